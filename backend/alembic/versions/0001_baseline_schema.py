@@ -0,0 +1,127 @@
+"""Baseline schema
+
+The schema as previously created by Base.metadata.create_all(). Databases
+created that way are stamped at this revision on first startup instead of
+running it.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+    ]
+
+
+def upgrade():
+    op.create_table(
+        "biography",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("title", sa.String(500), nullable=False),
+        sa.Column("bio_text", sa.Text(), nullable=False),
+        sa.Column("education", sa.JSON()),
+        sa.Column("achievements", sa.JSON()),
+        sa.Column("current_roles", sa.JSON()),
+        sa.Column("discography", sa.JSON()),
+        *_timestamps(),
+    )
+    op.create_index("ix_biography_id", "biography", ["id"])
+
+    op.create_table(
+        "events",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(500), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("time", sa.String(50)),
+        sa.Column("venue", sa.String(255), nullable=False),
+        sa.Column("location", sa.String(255)),
+        sa.Column("description", sa.Text()),
+        sa.Column("ensemble_name", sa.String(255)),
+        sa.Column("event_type", sa.String(100)),
+        sa.Column("photo_url", sa.String(500)),
+        sa.Column("is_past", sa.Boolean()),
+        *_timestamps(),
+    )
+    op.create_index("ix_events_id", "events", ["id"])
+    op.create_index("ix_events_date", "events", ["date"])
+    op.create_index("ix_events_is_past", "events", ["is_past"])
+
+    op.create_table(
+        "ensembles",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False, unique=True),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("formation_year", sa.Integer()),
+        sa.Column("musical_style", sa.Text()),
+        sa.Column("vision", sa.Text()),
+        sa.Column("contact_email", sa.String(255)),
+        sa.Column("contact_phone", sa.String(50)),
+        sa.Column("members", sa.JSON()),
+        sa.Column("highlights", sa.JSON()),
+        *_timestamps(),
+    )
+    op.create_index("ix_ensembles_id", "ensembles", ["id"])
+
+    op.create_table(
+        "videos",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(500), nullable=False),
+        sa.Column("youtube_id", sa.String(50), nullable=False),
+        sa.Column("youtube_url", sa.String(500), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("thumbnail_url", sa.String(500)),
+        sa.Column("duration", sa.String(20)),
+        sa.Column("published_date", sa.Date()),
+        sa.Column("category", sa.String(100)),
+        sa.Column("event_id", sa.Integer(), sa.ForeignKey("events.id")),
+        sa.Column("is_featured", sa.Boolean()),
+        sa.Column("display_order", sa.Integer()),
+        sa.Column("is_visible", sa.Boolean()),
+        *_timestamps(),
+    )
+    op.create_index("ix_videos_id", "videos", ["id"])
+    op.create_index("ix_videos_youtube_id", "videos", ["youtube_id"], unique=True)
+    op.create_index("ix_videos_is_featured", "videos", ["is_featured"])
+    op.create_index("ix_videos_is_visible", "videos", ["is_visible"])
+
+    op.create_table(
+        "playlists",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(500), nullable=False),
+        sa.Column("playlist_id", sa.String(100), nullable=False),
+        sa.Column("playlist_url", sa.String(500), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("thumbnail_url", sa.String(500)),
+        sa.Column("video_count", sa.Integer()),
+        sa.Column("is_featured", sa.Boolean()),
+        sa.Column("display_order", sa.Integer()),
+        sa.Column("is_visible", sa.Boolean()),
+        *_timestamps(),
+    )
+    op.create_index("ix_playlists_id", "playlists", ["id"])
+    op.create_index("ix_playlists_playlist_id", "playlists", ["playlist_id"], unique=True)
+    op.create_index("ix_playlists_is_featured", "playlists", ["is_featured"])
+    op.create_index("ix_playlists_is_visible", "playlists", ["is_visible"])
+
+
+def downgrade():
+    op.drop_table("playlists")
+    op.drop_table("videos")
+    op.drop_table("ensembles")
+    op.drop_table("events")
+    op.drop_table("biography")
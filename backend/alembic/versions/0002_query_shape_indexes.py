@@ -0,0 +1,136 @@
+"""Composite and partial indexes for the public list queries
+
+Replaces the single-column is_visible / is_featured / is_past indexes with
+indexes matching each router query: partial on is_visible, led by the
+filter column and ending in the list sort key. Also makes updated_at
+indexed and set on insert (the conditional GET validator reads
+max(updated_at)) and display_order NOT NULL (it leads the keyset cursor).
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+TIMESTAMPED_TABLES = ["biography", "events", "ensembles", "videos", "playlists"]
+
+
+def _visible():
+    # Spelled the way SQLAlchemy renders `is_visible == True` in queries, so
+    # the planner can match the partial index predicate
+    if op.get_bind().dialect.name == "sqlite":
+        return sa.text("is_visible = 1")
+    return sa.text("is_visible = true")
+
+
+def _published_desc():
+    # SQLite sorts NULLs last in DESC indexes natively and rejects NULLS LAST
+    if op.get_bind().dialect.name == "sqlite":
+        return sa.text("published_date DESC")
+    return sa.text("published_date DESC NULLS LAST")
+
+
+def _create_partial_index(name, table, columns):
+    op.create_index(
+        name, table, columns,
+        postgresql_where=_visible(),
+        sqlite_where=_visible(),
+    )
+
+
+def upgrade():
+    for table in TIMESTAMPED_TABLES:
+        op.execute(f"UPDATE {table} SET updated_at = created_at WHERE updated_at IS NULL")
+        with op.batch_alter_table(table) as batch:
+            batch.alter_column(
+                "updated_at",
+                existing_type=sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+            )
+        op.create_index(f"ix_{table}_updated_at", table, ["updated_at"])
+
+    for table in ["videos", "playlists"]:
+        op.execute(f"UPDATE {table} SET display_order = 0 WHERE display_order IS NULL")
+        with op.batch_alter_table(table) as batch:
+            batch.alter_column(
+                "display_order",
+                existing_type=sa.Integer(),
+                nullable=False,
+                server_default="0",
+            )
+
+    op.drop_index("ix_videos_is_featured", table_name="videos")
+    op.drop_index("ix_videos_is_visible", table_name="videos")
+    op.drop_index("ix_playlists_is_featured", table_name="playlists")
+    op.drop_index("ix_playlists_is_visible", table_name="playlists")
+    op.drop_index("ix_events_is_past", table_name="events")
+
+    # GET /videos (also keyset pagination)
+    _create_partial_index("ix_videos_visible_keyset", "videos", [
+        "display_order", _published_desc(), "id",
+    ])
+    # GET /videos?featured=..., GET /videos/featured
+    _create_partial_index("ix_videos_visible_featured", "videos", [
+        "is_featured", "display_order", _published_desc(), "id",
+    ])
+    # GET /videos?category=...
+    _create_partial_index("ix_videos_visible_category", "videos", [
+        "category", "display_order", _published_desc(), "id",
+    ])
+    # GET /videos/by-event/{event_id}
+    _create_partial_index("ix_videos_visible_event", "videos", ["event_id", "display_order"])
+
+    # GET /playlists (also keyset pagination)
+    _create_partial_index("ix_playlists_visible_keyset", "playlists", [
+        "display_order", sa.text("created_at DESC"), "id",
+    ])
+    # GET /playlists?featured=..., GET /playlists/featured
+    _create_partial_index("ix_playlists_visible_featured", "playlists", [
+        "is_featured", "display_order", sa.text("created_at DESC"), "id",
+    ])
+
+    # GET /events upcoming/past, ordered by date
+    op.create_index("ix_events_past_date", "events", ["is_past", "date"])
+
+
+def downgrade():
+    op.drop_index("ix_events_past_date", table_name="events")
+    op.drop_index("ix_playlists_visible_featured", table_name="playlists")
+    op.drop_index("ix_playlists_visible_keyset", table_name="playlists")
+    op.drop_index("ix_videos_visible_event", table_name="videos")
+    op.drop_index("ix_videos_visible_category", table_name="videos")
+    op.drop_index("ix_videos_visible_featured", table_name="videos")
+    op.drop_index("ix_videos_visible_keyset", table_name="videos")
+
+    op.create_index("ix_events_is_past", "events", ["is_past"])
+    op.create_index("ix_playlists_is_visible", "playlists", ["is_visible"])
+    op.create_index("ix_playlists_is_featured", "playlists", ["is_featured"])
+    op.create_index("ix_videos_is_visible", "videos", ["is_visible"])
+    op.create_index("ix_videos_is_featured", "videos", ["is_featured"])
+
+    for table in ["videos", "playlists"]:
+        with op.batch_alter_table(table) as batch:
+            batch.alter_column(
+                "display_order",
+                existing_type=sa.Integer(),
+                nullable=True,
+                server_default=None,
+            )
+
+    for table in TIMESTAMPED_TABLES:
+        op.drop_index(f"ix_{table}_updated_at", table_name=table)
+        with op.batch_alter_table(table) as batch:
+            batch.alter_column(
+                "updated_at",
+                existing_type=sa.DateTime(timezone=True),
+                server_default=None,
+            )
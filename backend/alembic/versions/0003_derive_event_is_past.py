@@ -0,0 +1,34 @@
+"""Derive events.is_past from the event date
+
+is_past was a stored flag that only changed when someone called
+POST /api/events/update-past-status. It is now computed from the date
+against today's date (Event.is_past), and the upcoming/past split is a
+range on ix_events_date, so the column and its index are dropped.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index("ix_events_past_date", table_name="events")
+    with op.batch_alter_table("events") as batch:
+        batch.drop_column("is_past")
+
+
+def downgrade():
+    with op.batch_alter_table("events") as batch:
+        batch.add_column(sa.Column("is_past", sa.Boolean()))
+    op.execute("UPDATE events SET is_past = (date < CURRENT_DATE)")
+    op.create_index("ix_events_past_date", "events", ["is_past", "date"])
@@ -0,0 +1,40 @@
+"""Track seeded rows for diff-based seeding
+
+seed_data.py used to skip any table that already had rows, so seed edits
+only reached a database after clearing the table. The seeder now diffs the
+seed records against the rows it wrote before, by natural key, and applies
+only the inserts, updates and deletes. seed_records remembers which rows
+are seeded (rows created through the API are never touched) and the
+fingerprint of the seed record each was last written from.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "seed_records",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("entity", sa.String(50), nullable=False),
+        sa.Column("natural_key", sa.String(600), nullable=False),
+        sa.Column("row_id", sa.Integer(), nullable=False),
+        sa.Column("fingerprint", sa.String(64), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("entity", "natural_key", name="uq_seed_records_entity_key"),
+    )
+
+
+def downgrade():
+    op.drop_table("seed_records")
@@ -0,0 +1,58 @@
+"""Full-text search vectors
+
+Adds a generated tsvector column with a GIN index to each table searched by
+GET /api/search. The 'simple' configuration indexes German, English and
+Arabic words alike (no stemming). Weights: A for titles, B for secondary
+fields, C for descriptions.
+
+PostgreSQL only: SQLite databases (development, tests) search with LIKE
+instead (see app/search.py), and the columns are not mapped on the models.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+# Table -> columns by weight (A, B, C)
+SEARCH_COLUMNS = {
+    "videos": [["title"], ["category"], ["description"]],
+    "events": [["title"], ["venue", "location"], ["description"]],
+    "playlists": [["title"], ["description"]],
+    "ensembles": [["name"], ["description"]],
+}
+
+
+def _vector(weighted):
+    parts = []
+    for weight, columns in zip("ABC", weighted):
+        text = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+        parts.append(f"setweight(to_tsvector('simple', {text}), '{weight}')")
+    return " || ".join(parts)
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, weighted in SEARCH_COLUMNS.items():
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({_vector(weighted)}) STORED"
+        )
+        op.execute(f"CREATE INDEX ix_{table}_search ON {table} USING gin (search_vector)")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in SEARCH_COLUMNS:
+        op.execute(f"DROP INDEX ix_{table}_search")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN search_vector")
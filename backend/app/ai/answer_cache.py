@@ -0,0 +1,121 @@
+"""
+Chat Answer Cache
+
+Answers to repeated visitor questions, served without calling the model.
+
+Most questions are the same few ("when is the next concert?", "do you give
+oud lessons?"). Each answered question is embedded locally (hashed words
+and character trigrams, see embeddings.hashed_embedding) into one row of a
+NumPy matrix; a new question is compared with every cached one in a single
+matrix-vector product, and the best match at or above
+settings.CHAT_CACHE_THRESHOLD is a hit. Lexical similarity cannot tell "oud
+lessons" from "cello lessons", so the default threshold only matches the
+same question worded slightly differently (case, punctuation, contractions).
+
+Answers are grounded on the chatbot context: the content chunks retrieved
+for the question (retrieval.py) or the site snapshot (context.py). Entries
+remember the context they were answered from and only match a question
+whose context is the same, so an edited event or bio never serves an
+answer built on the old text, while edits elsewhere keep it cached.
+Outdated entries are evicted as the least recently used.
+
+Questions that look personal (an email address, a phone number, long
+messages) are never cached: the cache is shared by all visitors.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from ..config import settings
+from .embeddings import HASHED_DIMS, hashed_embedding
+
+# Longest question cached; frequent questions are short
+MAX_QUESTION_CHARS = 200
+
+# Email addresses and phone numbers (5+ digits, possibly spaced)
+_PERSONAL = re.compile(r"\S+@\S+|\d[\d\s/().+-]{3,}\d")
+
+
+@dataclass
+class CachedAnswer:
+    """A cached question and its answer"""
+    question: str
+    answer: str
+    grounding: str
+
+
+def grounding_key(context: str) -> str:
+    """Fingerprint of the context an answer was generated from"""
+    return hashlib.sha1(context.encode()).hexdigest()
+
+
+def is_cacheable(question: str) -> bool:
+    """Whether an answer to the question may be served to other visitors"""
+    return len(question) <= MAX_QUESTION_CHARS and not _PERSONAL.search(question)
+
+
+class AnswerCache:
+    """Nearest-question lookup over a fixed number of cached answers"""
+
+    def __init__(self, max_entries: int, threshold: float, dims: int = HASHED_DIMS):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.dims = dims
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters"""
+        self._vectors = np.zeros((self.max_entries, self.dims), dtype=np.float32)
+        self._entries = [None] * self.max_entries
+        # Last use per row, for evicting the least recently used; 0 = free
+        self._used = np.zeros(self.max_entries, dtype=np.int64)
+        self._clock = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return sum(entry is not None for entry in self._entries)
+
+    def get(self, question: str, context: str) -> Optional[CachedAnswer]:
+        """The cached answer to a near-identical question, if any"""
+        if not is_cacheable(question):
+            return None
+        grounding = grounding_key(context)
+        same_context = np.fromiter(
+            (entry is not None and entry.grounding == grounding for entry in self._entries),
+            dtype=bool, count=self.max_entries,
+        )
+        if same_context.any():
+            scores = np.where(same_context, self._vectors @ hashed_embedding(question, self.dims), -1.0)
+            row = int(np.argmax(scores))
+            if scores[row] >= self.threshold:
+                self.hits += 1
+                self._clock += 1
+                self._used[row] = self._clock
+                return self._entries[row]
+        self.misses += 1
+        return None
+
+    def put(self, question: str, answer: str, context: str) -> None:
+        """Cache an answer generated from a context"""
+        if not answer or not is_cacheable(question):
+            return
+        row = int(np.argmin(self._used))
+        self._clock += 1
+        self._vectors[row] = hashed_embedding(question, self.dims)
+        self._entries[row] = CachedAnswer(question=question, answer=answer, grounding=grounding_key(context))
+        self._used[row] = self._clock
+
+    def stats(self) -> dict:
+        """Entry count and hit/miss counters of this worker"""
+        return {"entries": len(self), "hits": self.hits, "misses": self.misses}
+
+
+answer_cache = AnswerCache(
+    max_entries=settings.CHAT_CACHE_MAX_ENTRIES,
+    threshold=settings.CHAT_CACHE_THRESHOLD,
+)
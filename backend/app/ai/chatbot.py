@@ -79,8 +79,8 @@ def get_chatbot_response(user_message: str) -> str:
 
 3. Implement the functions below
 
-4. Add API endpoint in main.py:
-   - POST /api/ai/chat
+4. Add API endpoint in main.py (done: streaming POST /api/chat/stream,
+   see routers/chat.py)
 
 5. Connect frontend chat widget
 
@@ -91,8 +91,23 @@ def get_chatbot_response(user_message: str) -> str:
 8. (Optional) Add moderation/safety filters
 """
 
-from typing import List, Dict, Optional
-from sqlalchemy.orm import Session
+import re
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Dict, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..models.ensemble import Ensemble
+from ..models.event import Event
+from ..routers.contact import get_contact_info
+from ..scheduler import local_today
+from ..search import normalize
+from .answer_cache import answer_cache
+from .context import context_snapshot
+from .providers import get_provider
+from .retrieval import content_index, render_chunks
 
 
 def initialize_chatbot():
@@ -107,26 +122,215 @@ def initialize_chatbot():
     pass
 
 
-def get_context_from_db(db: Session) -> str:
+# Intent router: frequent questions answered from the database by template,
+# without a model call. Keywords are word prefixes, normalized like search
+# (case and Arabic marks ignored), per intent and language.
+INTENT_KEYWORDS = {
+    "next_events": {
+        "en": ["concert", "event", "gig", "upcoming"],
+        "de": ["konzert", "auftritt", "auftreten", "veranstaltung", "termin", "nächste"],
+        "ar": ["حفل", "فعالي", "أمسي", "امسي", "عرض", "القادم"],
+    },
+    "contact": {
+        "en": ["contact", "email", "e-mail", "phone", "call", "reach", "book", "address"],
+        "de": ["kontakt", "telefon", "anruf", "erreich", "buch", "adresse", "nummer"],
+        "ar": ["تواصل", "اتصال", "اتصل", "بريد", "ايميل", "إيميل", "هاتف", "رقم", "عنوان", "حجز"],
+    },
+    "ensemble_members": {
+        "en": ["member", "musicians", "lineup", "band"],
+        "de": ["mitglied", "musiker", "besetzung", "band"],
+        "ar": ["أعضاء", "اعضاء", "عضو", "فرقة", "موسيقيين"],
+    },
+}
+
+_KEYWORDS = {
+    intent: {language: tuple(normalize(keyword) for keyword in keywords) for language, keywords in languages.items()}
+    for intent, languages in INTENT_KEYWORDS.items()
+}
+
+# Words marking a German message when its keywords are shared with English
+GERMAN_WORDS = {"wann", "wo", "wer", "wie", "ist", "sind", "gibt", "ich", "ihr", "sie", "du", "kann", "spielt", "welche"}
+
+# Longer messages, and requests for explanations, are open-ended questions
+# for the model
+MAX_INTENT_WORDS = 12
+OPEN_ENDED = ("why", "explain", "warum", "wieso", "erklär", "لماذا", "اشرح")
+
+# Events listed in a templated answer
+INTENT_EVENTS = 3
+
+# Arabic prefixes (conjunctions, prepositions, article) stripped before matching
+_ARABIC_PREFIX = re.compile(r"^(?:و|ف)?(?:ب|ل|ك)?(?:ال)?(?=\w{2})")
+_ARABIC_LETTER = re.compile(r"[\u0600-\u06FF]")
+
+TEMPLATES = {
+    "next_events": {
+        "en": ("Upcoming events:\n{events}", "No upcoming events are scheduled right now. For bookings, write to {email}."),
+        "de": ("Die nächsten Termine:\n{events}", "Zurzeit sind keine Termine geplant. Für Anfragen: {email}."),
+        "ar": ("الفعاليات القادمة:\n{events}", "لا توجد فعاليات قادمة حالياً. للحجز والاستفسار: {email}"),
+    },
+    "contact": {
+        "en": "You can reach {name} at {email} or {phone}. For the ensemble, write to {ensemble_email}.",
+        "de": "Sie erreichen {name} unter {email} oder {phone}. Für das Ensemble: {ensemble_email}.",
+        "ar": "يمكنك التواصل مع {name} عبر البريد {email} أو الهاتف {phone}. للتواصل مع الفرقة: {ensemble_email}",
+    },
+    "ensemble_members": {
+        "en": "The members of {ensemble}:\n{members}",
+        "de": "Die Mitglieder von {ensemble}:\n{members}",
+        "ar": "أعضاء {ensemble}:\n{members}",
+    },
+}
+
+
+@dataclass
+class Intent:
+    """A recognized question and the language to answer it in"""
+    name: str
+    language: str
+
+
+def classify_intent(message: str) -> Optional[Intent]:
+    """
+    The FAQ intent of a short message, if exactly one intent's keywords occur.
+
+    Messages matching several intents or none, longer than
+    MAX_INTENT_WORDS or asking for an explanation are left to the model.
+    """
+    words = re.findall(r"[\w-]+", normalize(message))
+    if not words or len(words) > MAX_INTENT_WORDS:
+        return None
+    words += [_ARABIC_PREFIX.sub("", word) for word in words if _ARABIC_LETTER.match(word)]
+    if any(word.startswith(OPEN_ENDED) for word in words):
+        return None
+
+    matches = {}
+    for intent, languages in _KEYWORDS.items():
+        for language, keywords in languages.items():
+            if any(word.startswith(keywords) for word in words):
+                matches.setdefault(intent, []).append(language)
+    if len(matches) != 1:
+        return None
+    intent, languages = matches.popitem()
+
+    if _ARABIC_LETTER.search(message):
+        language = "ar"
+    elif languages == ["de"] or GERMAN_WORDS.intersection(words):
+        language = "de"
+    else:
+        language = "en"
+    return Intent(intent, language)
+
+
+def _event_line(event: Event, language: str) -> str:
+    day = event.date.strftime("%d.%m.%Y") if language == "de" else event.date.isoformat()
+    when = " ".join(part for part in (day, event.time) if part)
+    where = ", ".join(part for part in (event.venue, event.location) if part)
+    return f"- {when}: {event.title} – {where}"
+
+
+async def quick_answer(message: str, db: AsyncSession) -> Optional[str]:
+    """
+    Templated answer to a frequent question, or None for the model.
+
+    Recognizes (see classify_intent) questions about the next events,
+    contact details and ensemble members in English, German and Arabic,
+    and answers them with the same indexed queries as GET /api/events,
+    /api/contact-info and /api/ensemble.
+    """
+    intent = classify_intent(message)
+    if intent is None:
+        return None
+    template = TEMPLATES[intent.name][intent.language]
+    contact = get_contact_info()
+
+    if intent.name == "next_events":
+        events = (await db.scalars(
+            select(Event).where(Event.date >= local_today()).order_by(Event.date.asc()).limit(INTENT_EVENTS)
+        )).all()
+        listing, empty = template
+        if not events:
+            return empty.format(**contact)
+        return listing.format(events="\n".join(_event_line(event, intent.language) for event in events))
+
+    if intent.name == "contact":
+        return template.format(**contact)
+
+    ensemble = (await db.scalars(select(Ensemble).limit(1))).first()
+    if not ensemble or not ensemble.members:
+        return None
+    members = "\n".join(
+        f"- {member.get('name')}" + (f" ({member['instrument']})" if member.get("instrument") else "")
+        for member in ensemble.members
+    )
+    return template.format(ensemble=ensemble.name, members=members)
+
+
+async def get_context_from_db(
+    db: AsyncSession,
+    question: Optional[str] = None,
+    conversation_history: Optional[List[Dict]] = None
+) -> str:
     """
     Retrieve relevant context from database for chatbot responses.
 
+    With a question, only the content chunks most relevant to it (and to
+    the visitor's previous message, for follow-ups) are used; see
+    retrieval.py. Without one, or when nothing relevant is found, the
+    general snapshot is used instead; see context.py.
+
     Returns:
-        Formatted string with bio, upcoming events, and ensemble info
+        Formatted context within settings.CHAT_CONTEXT_TOKENS
     """
-    # TODO: Implement context retrieval
-    # Example:
-    # - Get bio summary
-    # - Get next 3 upcoming events
-    # - Get ensemble information
-    # - Format as context string
-    pass
+    if question and settings.CHAT_RETRIEVAL_CHUNKS:
+        previous = [message["content"] for message in conversation_history or [] if message["role"] == "user"]
+        await content_index.refresh(db)
+        chunks = content_index.search(" ".join(previous[-1:] + [question]), k=settings.CHAT_RETRIEVAL_CHUNKS)
+        if chunks:
+            return render_chunks(chunks, local_today(), settings.CHAT_CONTEXT_TOKENS)
+    return await context_snapshot(db)
 
 
-def handle_message(
+async def stream_message(
     user_message: str,
     conversation_history: Optional[List[Dict]] = None,
-    db: Session = None
+    context: str = ""
+) -> AsyncIterator[str]:
+    """
+    Stream the AI response to a user message, chunk by chunk.
+
+    Args:
+        user_message: The user's chat message
+        conversation_history: Previous messages in the conversation
+        context: Database context (see get_context_from_db)
+
+    Yields:
+        Response text as the provider generates it, or at once if the
+        question was answered before (see answer_cache.py). Closing the
+        generator closes the provider stream.
+    """
+    # Only opening questions are cached; follow-ups depend on the conversation
+    cached = settings.CHAT_CACHE_ENABLED and not conversation_history
+    if cached:
+        hit = answer_cache.get(user_message, context)
+        if hit is not None:
+            yield hit.answer
+            return
+
+    messages = [*(conversation_history or []), {"role": "user", "content": user_message}]
+    answer = []
+    async with aclosing(get_provider().stream(generate_system_prompt(context), messages)) as chunks:
+        async for chunk in chunks:
+            answer.append(chunk)
+            yield chunk
+    # Reached only when the answer is complete (not on disconnect or error)
+    if cached:
+        answer_cache.put(user_message, "".join(answer), context)
+
+
+async def handle_message(
+    user_message: str,
+    conversation_history: Optional[List[Dict]] = None,
+    db: AsyncSession = None
 ) -> str:
     """
     Process user message and generate AI response.
@@ -134,23 +338,19 @@ def handle_message(
     Args:
         user_message: The user's chat message
         conversation_history: Previous messages in the conversation
-        db: Database session for context retrieval
+        db: Async database session for context retrieval
 
     Returns:
         AI-generated response string
     """
-    # TODO: Implement message handling
-    # 1. Get context from database
-    # 2. Build prompt with context + conversation history
-    # 3. Call AI API (OpenAI/Anthropic)
-    # 4. Return response
-    # 5. (Optional) Log conversation to database
-
-    # Placeholder response
-    return (
-        "Hello! I'm here to help you learn more about Abathar Kmash's music lessons "
-        "and performances. The chatbot feature is coming soon!"
-    )
+    if db is not None:
+        answer = await quick_answer(user_message, db)
+        if answer is not None:
+            return answer
+    context = await get_context_from_db(db, user_message, conversation_history) if db is not None else ""
+    return "".join([
+        chunk async for chunk in stream_message(user_message, conversation_history, context)
+    ])
 
 
 def generate_system_prompt(context: str) -> str:
@@ -193,28 +393,3 @@ def generate_system_prompt(context: str) -> str:
 
     If you don't know something, suggest contacting Abathar directly via email.
     """
-
-
-# Example API endpoint integration (add to routers/ai_chat.py):
-"""
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from pydantic import BaseModel
-from ..database import get_db
-from ..ai.chatbot import handle_message
-
-router = APIRouter()
-
-class ChatRequest(BaseModel):
-    message: str
-    conversation_history: List[Dict] = []
-
-@router.post("/ai/chat")
-def chat(request: ChatRequest, db: Session = Depends(get_db)):
-    response = handle_message(
-        user_message=request.message,
-        conversation_history=request.conversation_history,
-        db=db
-    )
-    return {"response": response}
-"""
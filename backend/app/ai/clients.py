@@ -0,0 +1,74 @@
+"""
+AI Clients
+
+Lazily constructed API clients for the AI features.
+
+The provider SDKs are large imports; importing them at module level would
+add to every worker's cold start even though most requests never touch
+them. Each client is created (and its SDK imported) on first use and then
+reused:
+
+    from .clients import openai_client
+
+    response = openai_client().chat.completions.create(...)
+"""
+
+from functools import lru_cache
+
+from ..config import settings
+
+
+@lru_cache(maxsize=None)
+def openai_client():
+    """
+    OpenAI client, created on first call.
+
+    Raises:
+        RuntimeError: If OPENAI_API_KEY is not set
+    """
+    if not settings.OPENAI_API_KEY:
+        raise RuntimeError("OPENAI_API_KEY is not set")
+    from openai import OpenAI
+    return OpenAI(api_key=settings.OPENAI_API_KEY)
+
+
+@lru_cache(maxsize=None)
+def anthropic_client():
+    """
+    Anthropic client, created on first call.
+
+    Raises:
+        RuntimeError: If ANTHROPIC_API_KEY is not set
+    """
+    if not settings.ANTHROPIC_API_KEY:
+        raise RuntimeError("ANTHROPIC_API_KEY is not set")
+    from anthropic import Anthropic
+    return Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+
+
+@lru_cache(maxsize=None)
+def async_openai_client():
+    """
+    Async OpenAI client (for streaming), created on first call.
+
+    Raises:
+        RuntimeError: If OPENAI_API_KEY is not set
+    """
+    if not settings.OPENAI_API_KEY:
+        raise RuntimeError("OPENAI_API_KEY is not set")
+    from openai import AsyncOpenAI
+    return AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+
+
+@lru_cache(maxsize=None)
+def async_anthropic_client():
+    """
+    Async Anthropic client (for streaming), created on first call.
+
+    Raises:
+        RuntimeError: If ANTHROPIC_API_KEY is not set
+    """
+    if not settings.ANTHROPIC_API_KEY:
+        raise RuntimeError("ANTHROPIC_API_KEY is not set")
+    from anthropic import AsyncAnthropic
+    return AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
@@ -0,0 +1,218 @@
+"""
+Chatbot Context
+
+Compact snapshot of the site's content for the chatbot's system prompt:
+bio, upcoming events, the ensemble and featured videos.
+
+Rendering it reads four tables, so the snapshot is built once and reused
+across chat turns. Each turn only reads the tables' versions (max
+updated_at and row count, one aggregate query; see conditional.py) and
+today's date; the snapshot is rebuilt when either changed. Writes reported
+through invalidate() by this worker drop it right away.
+
+The text is trimmed to settings.CHAT_CONTEXT_TOKENS. Lines are added in
+priority order (who Abathar is, then the next events, the ensemble,
+featured videos, and finally the longer bio lists) until the budget is
+spent, then printed grouped by section:
+
+    context = await context_snapshot(db)
+"""
+
+import asyncio
+import math
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..cache import on_invalidate
+from ..conditional import TableVersion, table_versions_async
+from ..config import settings
+from ..models.bio import Bio
+from ..models.ensemble import Ensemble
+from ..models.event import Event
+from ..models.video import Video
+from ..scheduler import local_today
+
+# Tables the snapshot is rendered from, by cache entity name
+CONTEXT_SOURCES = {
+    "bio": Bio,
+    "events": Event,
+    "ensembles": Ensemble,
+    "videos": Video,
+}
+
+# Rows loaded per list section, before trimming to the budget
+CONTEXT_EVENTS = 10
+CONTEXT_VIDEOS = 5
+
+# Characters per token assumed by the estimate; close for German and English
+CHARS_PER_TOKEN = 4
+
+# Section headings, in the order they are printed
+SECTIONS = ["About", "Upcoming events", "Ensemble", "Featured videos", "Background"]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of a text, without a tokenizer"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def truncate(text: str, tokens: int) -> str:
+    """Cut text at a word boundary to about `tokens` tokens"""
+    limit = tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    return text[:limit - 1].rsplit(" ", 1)[0] + "…"
+
+
+def fit_to_budget(lines: List[Tuple[str, str]], budget: int) -> str:
+    """
+    Render (section, line) pairs, most important first, within a budget.
+
+    Lines that do not fit are dropped; a long line (e.g. the bio text) is
+    shortened to the remaining budget instead if enough of it would remain.
+    """
+    kept: Dict[str, List[str]] = {section: [] for section in SECTIONS}
+    used = 0
+    for section, line in lines:
+        # The heading costs tokens too, once per section
+        cost = estimate_tokens(line) + (0 if kept[section] else estimate_tokens(section) + 1)
+        if used + cost > budget:
+            remaining = budget - used - (cost - estimate_tokens(line))
+            if remaining < 32:
+                continue
+            line = truncate(line, remaining)
+            cost = budget - used
+        kept[section].append(line)
+        used += cost
+    return "\n\n".join(
+        f"{section}:\n" + "\n".join(section_lines)
+        for section, section_lines in kept.items() if section_lines
+    )
+
+
+def _join(*parts: Optional[Any], separator: str = ", ") -> str:
+    return separator.join(str(part) for part in parts if part)
+
+
+def _member(member: Dict[str, Any]) -> str:
+    if member.get("instrument"):
+        return f"{member.get('name')} ({member['instrument']})"
+    return str(member.get("name"))
+
+
+def _entry(item: Any) -> str:
+    """One line for a JSON list entry: a string or a dict of fields"""
+    if isinstance(item, dict):
+        return _join(*item.values(), separator=" – ")
+    return str(item)
+
+
+def render_context(
+    bio: Optional[Bio],
+    events: List[Event],
+    ensemble: Optional[Ensemble],
+    videos: List[Video],
+    budget: int,
+) -> str:
+    """Context text for the rows, trimmed to a token budget"""
+    lines: List[Tuple[str, str]] = []
+    if bio:
+        lines.append(("About", f"{bio.name} – {bio.title}"))
+        lines += [("About", f"- {role}") for role in bio.current_roles or []]
+    for event in events:
+        when = _join(event.date.isoformat(), event.time, separator=" ")
+        details = _join(event.title, _join(event.venue, event.location), event.ensemble_name, separator=" | ")
+        lines.append(("Upcoming events", f"- {when}: {details}"))
+    if ensemble:
+        founded = f"founded {ensemble.formation_year}" if ensemble.formation_year else None
+        lines.append(("Ensemble", _join(ensemble.name, founded)))
+        if ensemble.members:
+            lines.append(("Ensemble", "Members: " + ", ".join(_member(member) for member in ensemble.members)))
+    for video in videos:
+        title = _join(video.title, video.category, separator=" | ")
+        lines.append(("Featured videos", f"- {title}: {video.youtube_url}"))
+    # Long texts last: they fill what the lists above left of the budget
+    if bio:
+        lines.append(("About", bio.bio_text))
+    if ensemble:
+        lines.append(("Ensemble", ensemble.description))
+    if bio:
+        for heading, items in (
+            ("Achievements", bio.achievements),
+            ("Education", bio.education),
+            ("Discography", bio.discography),
+        ):
+            lines += [("Background", f"- {heading}: {_entry(item)}") for item in items or []]
+    return fit_to_budget(lines, budget)
+
+
+@dataclass
+class Snapshot:
+    """Rendered context and what it was rendered from"""
+    text: str
+    versions: List[TableVersion]
+    today: date
+    budget: int
+
+
+_snapshot: Optional[Snapshot] = None
+_lock = asyncio.Lock()
+
+
+async def context_snapshot(db: AsyncSession, budget: Optional[int] = None) -> str:
+    """
+    The chatbot context, re-rendered only when content or the date changed.
+
+    Args:
+        db: Async database session
+        budget: Token budget (default: settings.CHAT_CONTEXT_TOKENS)
+
+    Returns:
+        Context text for the system prompt
+    """
+    global _snapshot
+    budget = budget or settings.CHAT_CONTEXT_TOKENS
+    versions = await table_versions_async(db, *CONTEXT_SOURCES.values())
+    today = local_today()
+
+    def current(snapshot: Optional[Snapshot]) -> bool:
+        return (
+            snapshot is not None and snapshot.versions == versions
+            and snapshot.today == today and snapshot.budget == budget
+        )
+
+    if current(_snapshot):
+        return _snapshot.text
+    # Concurrent turns after a change render once
+    async with _lock:
+        if current(_snapshot):
+            return _snapshot.text
+        bio = (await db.scalars(select(Bio).limit(1))).first()
+        events = (await db.scalars(
+            select(Event).where(Event.date >= today).order_by(Event.date.asc()).limit(CONTEXT_EVENTS)
+        )).all()
+        ensemble = (await db.scalars(select(Ensemble).limit(1))).first()
+        videos = (await db.scalars(
+            select(Video)
+            .where(Video.is_featured == True, Video.is_visible == True)
+            .order_by(Video.display_order.asc())
+            .limit(CONTEXT_VIDEOS)
+        )).all()
+        _snapshot = Snapshot(render_context(bio, events, ensemble, videos, budget), versions, today, budget)
+        return _snapshot.text
+
+
+def clear_context_snapshot() -> None:
+    """Forget the rendered snapshot (e.g. between tests)"""
+    global _snapshot
+    _snapshot = None
+
+
+@on_invalidate
+def _drop_on_write(entity: str, ids: Tuple[Any, ...]) -> None:
+    if entity in CONTEXT_SOURCES:
+        clear_context_snapshot()
@@ -0,0 +1,105 @@
+"""
+Text Embeddings
+
+Local TF-IDF embeddings for similarity features (related videos, ...).
+
+Runs on the CPU with NumPy only; no model download or API key. Texts are
+tokenized like search (see search.normalize), so German, English and Arabic
+words all become terms. Vectors use sublinear term frequency and smoothed
+IDF and are L2-normalized, so the dot product of two vectors is their cosine
+similarity:
+
+    model = TfidfModel([tokenize(text) for text in texts])
+    vectors = model.transform([tokenize(text) for text in texts])
+    similarities = vectors @ vectors[0]
+
+The vocabulary is fitted on the corpus, so vectors from different models
+are not comparable; callers refit when the corpus changes.
+
+hashed_embedding needs no fitting: words and character trigrams are hashed
+into a fixed number of dimensions, so vectors of any two texts compare, and
+small spelling differences ("concert" / "konzert") still overlap. It suits
+short texts arriving one at a time, like chat questions.
+"""
+
+import math
+import re
+import zlib
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..search import normalize
+
+# Terms kept in the vocabulary, by document frequency
+MAX_FEATURES = 4096
+
+# Dimensions of hashed embeddings
+HASHED_DIMS = 1024
+
+# Words too common to say anything about a text
+STOPWORDS = {
+    # English
+    "a", "an", "and", "at", "by", "for", "from", "in", "is", "of", "on", "or", "the", "to", "with",
+    # German
+    "am", "auf", "das", "dem", "den", "der", "des", "die", "ein", "eine", "für", "im", "mit",
+    "und", "von", "zu",
+    # Arabic
+    "على", "عن", "في", "مع", "من",
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Normalized words of a text, without stopwords and single characters"""
+    return [
+        word for word in re.findall(r"\w+", normalize(text or ""))
+        if len(word) > 1 and word not in STOPWORDS
+    ]
+
+
+def hashed_embedding(text: str, dims: int = HASHED_DIMS) -> np.ndarray:
+    """L2-normalized vector of a text's hashed words and character trigrams"""
+    vector = np.zeros(dims, dtype=np.float32)
+    for word in re.findall(r"\w+", normalize(text or "")):
+        padded = f" {word} "
+        features = [f"w:{word}"] + [padded[index:index + 3] for index in range(len(padded) - 2)]
+        for feature in features:
+            # crc32 rather than hash(): stable across processes
+            vector[zlib.crc32(feature.encode()) % dims] += 1
+    np.log1p(vector, out=vector)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+class TfidfModel:
+    """Vocabulary and IDF weights fitted on a corpus of token lists"""
+
+    def __init__(self, documents: Sequence[List[str]], max_features: Optional[int] = MAX_FEATURES):
+        """Keeps the max_features most frequent terms (all terms if None)"""
+        frequencies = Counter(term for document in documents for term in set(document))
+        terms = sorted(frequencies, key=lambda term: (-frequencies[term], term))[:max_features]
+        self.vocabulary: Dict[str, int] = {term: index for index, term in enumerate(sorted(terms))}
+        count = len(documents)
+        self.idf = np.array(
+            [math.log((1 + count) / (1 + frequencies[term])) + 1 for term in sorted(terms)],
+            dtype=np.float32,
+        )
+
+    def weights(self, document: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Columns and values of a document's L2-normalized vector (sparse form)"""
+        counts = Counter(term for term in document if term in self.vocabulary)
+        columns = np.fromiter((self.vocabulary[term] for term in counts), dtype=np.int64, count=len(counts))
+        values = np.fromiter(
+            (1 + math.log(frequency) for frequency in counts.values()), dtype=np.float32, count=len(counts)
+        ) * self.idf[columns]
+        norm = np.linalg.norm(values)
+        return columns, values / norm if norm > 0 else values
+
+    def transform(self, documents: Sequence[List[str]]) -> np.ndarray:
+        """L2-normalized TF-IDF vectors, one row per document"""
+        vectors = np.zeros((len(documents), len(self.vocabulary)), dtype=np.float32)
+        for row, document in enumerate(documents):
+            columns, values = self.weights(document)
+            vectors[row, columns] = values
+        return vectors
@@ -0,0 +1,133 @@
+"""
+Chat Providers
+
+Streaming chat completions behind one interface, so the chat endpoint can
+relay text as the model generates it whichever provider is configured:
+
+    provider = get_provider()
+    async for text in provider.stream(system_prompt, messages):
+        ...
+
+settings.CHAT_PROVIDER selects the provider:
+
+- "fake" (default): a local stand-in that streams a canned reply word by
+  word; for development and tests, no API key needed
+- "openai": OpenAI chat completions (OPENAI_API_KEY)
+- "anthropic": Anthropic messages (ANTHROPIC_API_KEY)
+
+Providers are async generators pulled by the caller: the next chunk is only
+requested from the provider once the previous one was handed on, and
+closing the generator (e.g. when the visitor disconnects) closes the
+provider's HTTP stream, so generation stops too.
+"""
+
+import asyncio
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List
+
+from ..config import settings
+
+# Default models per provider, if CHAT_MODEL is not set
+DEFAULT_MODELS = {
+    "openai": "gpt-4o-mini",
+    "anthropic": "claude-3-5-haiku-latest",
+}
+
+
+class ChatProvider:
+    """Streams the assistant's reply to a conversation"""
+
+    name = "base"
+
+    def stream(self, system: str, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """
+        Reply text in chunks, as generated.
+
+        Args:
+            system: System prompt
+            messages: Conversation so far, [{"role": "user"|"assistant",
+                "content": "..."}], ending with the visitor's message
+        """
+        raise NotImplementedError
+
+
+class FakeProvider(ChatProvider):
+    """Local provider replying with a canned text, one word per chunk"""
+
+    name = "fake"
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+
+    async def stream(self, system: str, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        question = messages[-1]["content"] if messages else ""
+        reply = (
+            f"Thanks for your message! You asked: \"{question}\". "
+            "For lessons, concerts and bookings, please write to abathar.k987@gmail.com."
+        )
+        for index, word in enumerate(reply.split(" ")):
+            await asyncio.sleep(self.delay)
+            yield word if index == 0 else f" {word}"
+
+
+class OpenAIProvider(ChatProvider):
+    """OpenAI chat completions with stream=True"""
+
+    name = "openai"
+
+    def __init__(self, model: str):
+        self.model = model
+
+    async def stream(self, system: str, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        from .clients import async_openai_client
+
+        response = await async_openai_client().chat.completions.create(
+            model=self.model,
+            max_tokens=settings.CHAT_MAX_TOKENS,
+            messages=[{"role": "system", "content": system}, *messages],
+            stream=True,
+        )
+        async with response:
+            async for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+
+class AnthropicProvider(ChatProvider):
+    """Anthropic messages streaming"""
+
+    name = "anthropic"
+
+    def __init__(self, model: str):
+        self.model = model
+
+    async def stream(self, system: str, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        from .clients import async_anthropic_client
+
+        async with async_anthropic_client().messages.stream(
+            model=self.model,
+            max_tokens=settings.CHAT_MAX_TOKENS,
+            system=system,
+            messages=messages,
+        ) as response:
+            async for text in response.text_stream:
+                yield text
+
+
+@lru_cache(maxsize=None)
+def get_provider() -> ChatProvider:
+    """
+    The configured chat provider.
+
+    Raises:
+        ValueError: If CHAT_PROVIDER names no known provider
+    """
+    name = settings.CHAT_PROVIDER
+    if name == "fake":
+        return FakeProvider()
+    model = settings.CHAT_MODEL or DEFAULT_MODELS.get(name)
+    if name == "openai":
+        return OpenAIProvider(model)
+    if name == "anthropic":
+        return AnthropicProvider(model)
+    raise ValueError(f"Unknown CHAT_PROVIDER: {name}")
@@ -1,5 +1,16 @@
 """
-AI Music Recommendations Module - Placeholder for Future Implementation
+AI Music Recommendations Module
+
+Related videos are implemented: RelatedVideoIndex keeps TF-IDF embeddings
+(see embeddings.py) of every visible video's title, description and
+category in memory and precomputes each video's nearest neighbours when
+videos are written, so a related-videos rail is one lookup per page view.
+Event recommendations are implemented too: EventInterestIndex scores every
+upcoming event against an interest string with one vectorized pass over a
+TF-IDF inverted index that is rebuilt when events are written.
+NumPy is imported with this module, which the routers import on first use.
+
+The other recommendations below are still placeholders.
 
 This module will provide personalized music recommendations:
 - Similar artists based on musical style
@@ -68,8 +79,215 @@ def recommend_events_for_user(user_id: int):
 5. Display recommendations on frontend
 """
 
-from typing import List, Dict, Optional
-from sqlalchemy.orm import Session
+import asyncio
+from datetime import date
+from typing import List, Dict, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..indexes import RowIndex
+from ..models.event import Event
+from ..models.video import Video
+from ..scheduler import local_today
+from .embeddings import TfidfModel, tokenize
+
+# Neighbours precomputed per video; the longest related rail
+RELATED_NEIGHBOURS = 12
+
+# Rows of the similarity matrix computed at once, bounding memory use
+_BLOCK_ROWS = 256
+
+
+def video_terms(title: str, description: Optional[str], category: Optional[str]) -> List[str]:
+    """Terms describing a video; title and category words count twice"""
+    return tokenize(title) * 2 + tokenize(category) * 2 + tokenize(description)
+
+
+def nearest_neighbours(
+    documents: Dict[int, List[str]],
+    count: int = RELATED_NEIGHBOURS,
+) -> Dict[int, List[Tuple[int, float]]]:
+    """
+    Most similar other documents of each document.
+
+    Args:
+        documents: Terms by id
+        count: Neighbours to keep per document
+
+    Returns:
+        (id, cosine similarity) pairs by id, most similar first; documents
+        sharing no terms are not neighbours
+    """
+    ids = sorted(documents)
+    count = min(count, len(ids) - 1)
+    if count <= 0:
+        return {row_id: [] for row_id in ids}
+
+    terms = [documents[row_id] for row_id in ids]
+    vectors = TfidfModel(terms).transform(terms)
+    neighbours = {}
+    for start in range(0, len(ids), _BLOCK_ROWS):
+        similarities = vectors[start:start + _BLOCK_ROWS] @ vectors.T
+        rows = np.arange(similarities.shape[0])
+        similarities[rows, rows + start] = -1.0  # not related to itself
+        top = np.argpartition(-similarities, count - 1, axis=1)[:, :count]
+        for row, columns in zip(rows, top):
+            scores = similarities[row]
+            neighbours[ids[start + row]] = [
+                (ids[column], round(float(scores[column]), 4))
+                for column in sorted(columns, key=lambda column: (-scores[column], column))
+                if scores[column] > 0
+            ]
+    return neighbours
+
+
+class RelatedVideoIndex(RowIndex):
+    """Nearest visible videos of each visible video, by TF-IDF cosine similarity"""
+
+    def reset(self) -> None:
+        self._terms: Dict[int, List[str]] = {}
+        self._neighbours: Dict[int, List[Tuple[int, float]]] = {}
+        self._changed = False
+
+    def __contains__(self, video_id: int) -> bool:
+        return video_id in self._terms
+
+    async def load(self, db: AsyncSession, entity: str, ids: Optional[Set[int]]) -> None:
+        statement = select(Video.id, Video.title, Video.description, Video.category, Video.is_visible)
+        if ids is None:
+            statement = statement.where(Video.is_visible == True)
+        else:
+            statement = statement.where(Video.id.in_(ids))
+        terms = {
+            row.id: video_terms(row.title, row.description, row.category)
+            for row in (await db.execute(statement)).all() if row.is_visible
+        }
+
+        if ids is None:
+            self._changed = self._changed or terms != self._terms
+            self._terms = terms
+            return
+        for video_id in ids:
+            if terms.get(video_id) != self._terms.get(video_id):
+                self._changed = True
+                self._terms.pop(video_id, None)
+                if video_id in terms:
+                    self._terms[video_id] = terms[video_id]
+
+    async def loaded(self) -> None:
+        if self._changed:
+            self._changed = False
+            # NumPy releases the GIL; the event loop keeps serving meanwhile
+            self._neighbours = await asyncio.to_thread(nearest_neighbours, dict(self._terms))
+
+    def related(self, video_id: int, limit: int = RELATED_NEIGHBOURS) -> List[Tuple[int, float]]:
+        """(id, similarity) of the videos most similar to a video, best first"""
+        return self._neighbours.get(video_id, [])[:limit]
+
+
+related_video_index = RelatedVideoIndex(["videos"])
+
+
+def event_terms(
+    title: str,
+    description: Optional[str],
+    event_type: Optional[str],
+    ensemble_name: Optional[str],
+) -> List[str]:
+    """Terms describing an event; title words count twice"""
+    return (
+        tokenize(title) * 2 + tokenize(event_type) + tokenize(ensemble_name) + tokenize(description)
+    )
+
+
+class InterestScorer:
+    """
+    TF-IDF inverted index over events: for each term, the rows of the
+    events containing it and their weights. Scoring a query touches only
+    the postings of its few terms, as NumPy array operations.
+    """
+
+    def __init__(self, documents: Dict[int, List[str]], dates: Dict[int, date]):
+        ids = sorted(documents)
+        self.ids = np.array(ids, dtype=np.int64)
+        self.dates = np.array([dates[row_id].toordinal() for row_id in ids], dtype=np.int64)
+        # Every term, so rare words like a venue name still match
+        self.model = TfidfModel([documents[row_id] for row_id in ids], max_features=None)
+
+        postings: Dict[int, Tuple[List[int], List[float]]] = {}
+        for row, row_id in enumerate(ids):
+            for column, value in zip(*self.model.weights(documents[row_id])):
+                rows, values = postings.setdefault(int(column), ([], []))
+                rows.append(row)
+                values.append(float(value))
+        self.postings = {
+            column: (np.array(rows, dtype=np.int64), np.array(values, dtype=np.float32))
+            for column, (rows, values) in postings.items()
+        }
+
+    def score(self, terms: List[str], since: date, limit: int) -> List[Tuple[int, float]]:
+        """
+        (id, score) of the best matching events dated since a day.
+
+        Scores are cosine similarities of TF-IDF vectors; ties go to the
+        earlier event.
+        """
+        scores = np.zeros(len(self.ids), dtype=np.float32)
+        for column, weight in zip(*self.model.weights(terms)):
+            rows, values = self.postings[int(column)]
+            scores[rows] += values * weight
+        scores[self.dates < since.toordinal()] = 0
+
+        matches = np.flatnonzero(scores > 0)
+        if len(matches) > limit:
+            matches = matches[np.argpartition(-scores[matches], limit - 1)[:limit]]
+        matches = matches[np.lexsort((self.dates[matches], -scores[matches]))]
+        return [(int(self.ids[row]), round(float(scores[row]), 4)) for row in matches]
+
+
+class EventInterestIndex(RowIndex):
+    """Interest scorer over all events, rebuilt when events are written"""
+
+    def reset(self) -> None:
+        self._terms: Dict[int, List[str]] = {}
+        self._dates: Dict[int, date] = {}
+        self._scorer: Optional[InterestScorer] = None
+        self._changed = True
+
+    async def load(self, db: AsyncSession, entity: str, ids: Optional[Set[int]]) -> None:
+        statement = select(
+            Event.id, Event.title, Event.description, Event.event_type, Event.ensemble_name, Event.date
+        )
+        if ids is not None:
+            statement = statement.where(Event.id.in_(ids))
+        rows = (await db.execute(statement)).all()
+
+        if ids is None:
+            self._terms, self._dates = {}, {}
+        for row_id in ids or ():
+            self._terms.pop(row_id, None)
+            self._dates.pop(row_id, None)
+        for row in rows:
+            self._terms[row.id] = event_terms(row.title, row.description, row.event_type, row.ensemble_name)
+            self._dates[row.id] = row.date
+        self._changed = True
+
+    async def loaded(self) -> None:
+        if self._changed:
+            self._changed = False
+            self._scorer = await asyncio.to_thread(InterestScorer, dict(self._terms), dict(self._dates))
+
+    def recommend(self, interest: str, limit: int = 5, since: Optional[date] = None) -> List[Tuple[int, float]]:
+        """(id, score) of the upcoming events best matching an interest"""
+        terms = tokenize(interest)
+        if self._scorer is None or not terms:
+            return []
+        return self._scorer.score(terms, since or local_today(), limit)
+
+
+event_interest_index = EventInterestIndex(["events"])
 
 
 def recommend_similar_artists(
@@ -133,37 +351,34 @@ def recommend_similar_artists(
     return similar_artists
 
 
-def recommend_events_based_on_interest(
+async def recommend_events_based_on_interest(
     interest: str,
-    db: Session = None,
+    db: AsyncSession,
     limit: int = 5
 ) -> List[Dict]:
     """
-    Recommend events based on user interests.
+    Recommend upcoming events based on user interests.
+
+    Scores all upcoming events against the interest in one vectorized pass
+    (see EventInterestIndex) and loads the best ones.
 
     Args:
         interest: User interest (e.g., "oud music", "world music", "children's concerts")
-        db: Database session
+        db: Async database session
         limit: Maximum number of recommendations
 
     Returns:
-        List of recommended event dictionaries
+        {"event": Event, "match_score": 0..1} dictionaries, best match first
     """
-    # TODO: Implement event recommendations
-    # 1. Parse user interest
-    # 2. Query events matching criteria
-    # 3. Rank by relevance
-    # 4. Return top N events
-
-    # Placeholder
-    return [
-        {
-            "title": "Ogaro Ensemble at Gasteig HP8",
-            "date": "2026-05-17",
-            "relevance": "Features oud music with oriental dance",
-            "match_score": 0.95
-        }
-    ]
+    await event_interest_index.refresh(db)
+    scores = dict(event_interest_index.recommend(interest, limit=limit))
+    if not scores:
+        return []
+    events = (await db.scalars(select(Event).where(Event.id.in_(scores)))).all()
+    return sorted(
+        ({"event": event, "match_score": scores[event.id]} for event in events),
+        key=lambda match: (-match["match_score"], match["event"].date, match["event"].id),
+    )
 
 
 def recommend_similar_ensembles(
@@ -244,9 +459,9 @@ def recommend_music_for_discovery(
     ]
 
 
-def get_personalized_recommendations(
+async def get_personalized_recommendations(
     user_id: Optional[int] = None,
-    db: Session = None
+    db: AsyncSession = None
 ) -> Dict:
     """
     Get comprehensive personalized recommendations.
@@ -269,7 +484,7 @@ def get_personalized_recommendations(
 
     return {
         "similar_artists": recommend_similar_artists(),
-        "upcoming_events": recommend_events_based_on_interest("oud music", db),
+        "upcoming_events": await recommend_events_based_on_interest("oud music", db) if db else [],
         "similar_ensembles": recommend_similar_ensembles(),
         "discover_music": recommend_music_for_discovery()
     }
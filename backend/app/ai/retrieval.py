@@ -0,0 +1,274 @@
+"""
+Content Retrieval
+
+Retrieval index (RAG) over the site's content for the chatbot: only the
+chunks relevant to a question go into its prompt, so prompts stay small as
+the content grows.
+
+Rows are split into chunks of at most CHUNK_WORDS words:
+
+- bio: biography text, achievements, discography
+- events: title, date, venue and description
+- ensembles: description, one chunk per member
+- videos: title and category (visible videos)
+
+Chunks are scored by a hybrid of BM25 over their words (exact terms,
+names, places) and the cosine similarity of local hashed embeddings (see
+embeddings.hashed_embedding; spelling variants, partial words):
+
+    await content_index.refresh(db)
+    chunks = content_index.search("oud lessons for children", k=6)
+
+The index is a RowIndex: rows written through the routers are re-chunked
+on the next request, without rebuilding the rest, and the periodic full
+reload only re-embeds rows whose chunks changed. Chunks live in slots of a
+NumPy embedding matrix; the slots of removed chunks are reused.
+"""
+
+import math
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..indexes import RowIndex
+from ..models.bio import Bio
+from ..models.ensemble import Ensemble
+from ..models.event import Event
+from ..models.video import Video
+from .context import estimate_tokens
+from .embeddings import HASHED_DIMS, hashed_embedding, tokenize
+
+# Longest chunk, in words; long texts are split into overlapping windows
+CHUNK_WORDS = 80
+CHUNK_OVERLAP = 16
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Share of the BM25 score in the hybrid score (the rest is embedding similarity)
+HYBRID_WEIGHT = 0.5
+
+# Lowest hybrid score of a retrieved chunk
+MIN_SCORE = 0.2
+
+
+@dataclass
+class Chunk:
+    """A piece of site content, as retrieved for a prompt"""
+    entity: str
+    row_id: int
+    text: str
+    date: Optional[date] = None  # events: past or upcoming is decided when used
+
+
+def windows(text: Optional[str], prefix: str = "") -> List[str]:
+    """Split text into overlapping windows of at most CHUNK_WORDS words"""
+    words = (text or "").split()
+    step = CHUNK_WORDS - CHUNK_OVERLAP
+    return [
+        prefix + " ".join(words[start:start + CHUNK_WORDS])
+        for start in range(0, max(len(words) - CHUNK_OVERLAP, 1), step)
+        if words
+    ]
+
+
+def grouped(prefix: str, items: Iterable[Any]) -> List[str]:
+    """Join short list entries into chunks of at most CHUNK_WORDS words"""
+    chunks, current = [], []
+    for item in items or []:
+        text = " – ".join(str(value) for value in item.values() if value) if isinstance(item, dict) else str(item)
+        if current and len(" ".join(current + [text]).split()) > CHUNK_WORDS:
+            chunks.append(prefix + "; ".join(current))
+            current = []
+        current.append(text)
+    if current:
+        chunks.append(prefix + "; ".join(current))
+    return chunks
+
+
+def _bio_chunks(bio: Bio) -> List[Chunk]:
+    texts = (
+        windows(bio.bio_text, f"About {bio.name} ({bio.title}): ")
+        + grouped(f"Achievements of {bio.name}: ", bio.achievements)
+        + grouped(f"Discography of {bio.name}: ", bio.discography)
+    )
+    return [Chunk("bio", bio.id, text) for text in texts]
+
+
+def _event_chunks(event: Event) -> List[Chunk]:
+    where = ", ".join(part for part in (event.venue, event.location) if part)
+    when = " ".join(part for part in (event.date.isoformat(), event.time) if part)
+    header = f"Event \"{event.title}\" on {when} at {where}"
+    if event.ensemble_name:
+        header += f" with {event.ensemble_name}"
+    texts = windows(event.description, header + ": ") or [header]
+    return [Chunk("events", event.id, text, event.date) for text in texts]
+
+
+def _ensemble_chunks(ensemble: Ensemble) -> List[Chunk]:
+    texts = windows(ensemble.description, f"{ensemble.name}: ")
+    for member in ensemble.members or []:
+        instrument = f" ({member['instrument']})" if member.get("instrument") else ""
+        texts += windows(member.get("bio") or "", f"{ensemble.name} member {member.get('name')}{instrument}: ") or [
+            f"{ensemble.name} member {member.get('name')}{instrument}"
+        ]
+    return [Chunk("ensembles", ensemble.id, text) for text in texts]
+
+
+def _video_chunks(video: Video) -> List[Chunk]:
+    if not video.is_visible:
+        return []
+    category = f" ({video.category})" if video.category else ""
+    return [Chunk("videos", video.id, f"Video \"{video.title}\"{category}: {video.youtube_url}")]
+
+
+# Per cache entity: model and chunk builder
+CHUNKERS = {
+    "bio": (Bio, _bio_chunks),
+    "events": (Event, _event_chunks),
+    "ensembles": (Ensemble, _ensemble_chunks),
+    "videos": (Video, _video_chunks),
+}
+
+Key = Tuple[str, int]
+
+
+class ContentIndex(RowIndex):
+    """Hybrid BM25 and embedding index over chunks of site content"""
+
+    def reset(self) -> None:
+        self._chunks: List[Optional[Chunk]] = []
+        self._free: List[int] = []
+        self._slots: Dict[Key, List[int]] = {}
+        self._vectors = np.zeros((0, HASHED_DIMS), dtype=np.float32)
+        self._lengths = np.zeros(0, dtype=np.float32)
+        self._postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._total_length = 0
+
+    def __len__(self):
+        return len(self._chunks) - len(self._free)
+
+    # Maintenance
+
+    def _add(self, chunk: Chunk) -> int:
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = len(self._chunks)
+            self._chunks.append(None)
+            if slot == len(self._vectors):
+                capacity = max(64, 2 * len(self._vectors))
+                self._vectors = np.resize(self._vectors, (capacity, HASHED_DIMS))
+                self._vectors[slot:] = 0
+                self._lengths = np.resize(self._lengths, capacity)
+                self._lengths[slot:] = 0
+        terms = tokenize(chunk.text)
+        self._chunks[slot] = chunk
+        self._vectors[slot] = hashed_embedding(chunk.text)
+        self._lengths[slot] = len(terms)
+        self._total_length += len(terms)
+        for term, frequency in Counter(terms).items():
+            self._postings[term][slot] = frequency
+        return slot
+
+    def remove(self, key: Key) -> None:
+        """Drop the chunks of a row"""
+        for slot in self._slots.pop(key, []):
+            for term in set(tokenize(self._chunks[slot].text)):
+                del self._postings[term][slot]
+                if not self._postings[term]:
+                    del self._postings[term]
+            self._total_length -= int(self._lengths[slot])
+            self._lengths[slot] = 0
+            self._vectors[slot] = 0
+            self._chunks[slot] = None
+            self._free.append(slot)
+
+    def put(self, key: Key, chunks: List[Chunk]) -> None:
+        """Replace the chunks of a row"""
+        # Periodic full reloads mostly find rows unchanged: skip re-embedding
+        if key in self._slots and [self._chunks[slot] for slot in self._slots[key]] == chunks:
+            return
+        self.remove(key)
+        self._slots[key] = [self._add(chunk) for chunk in chunks]
+
+    async def load(self, db: AsyncSession, entity: str, ids: Optional[Set[int]]) -> None:
+        model, chunker = CHUNKERS[entity]
+        statement = select(model)
+        if ids is not None:
+            statement = statement.where(model.id.in_(ids))
+        rows = (await db.scalars(statement)).all()
+
+        # Rows no longer found were deleted
+        if ids is None:
+            stale = {key for key in self._slots if key[0] == entity}
+        else:
+            stale = {(entity, row_id) for row_id in ids}
+        for row in rows:
+            self.put((entity, row.id), chunker(row))
+            stale.discard((entity, row.id))
+        for key in stale:
+            self.remove(key)
+
+    # Lookup
+
+    def search(self, query: str, k: int = 6) -> List[Chunk]:
+        """
+        The k chunks most relevant to a query, best first.
+
+        Scores are HYBRID_WEIGHT * BM25 (scaled so the best chunk scores 1)
+        plus the rest times embedding cosine similarity; chunks below
+        MIN_SCORE are not returned.
+        """
+        count = len(self)
+        if not count:
+            return []
+        size = len(self._chunks)
+        bm25 = np.zeros(size, dtype=np.float32)
+        average_length = self._total_length / count or 1.0
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            slots = np.fromiter(postings.keys(), dtype=np.int64, count=len(postings))
+            frequencies = np.fromiter(postings.values(), dtype=np.float32, count=len(postings))
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[slots] / average_length)
+            bm25[slots] += idf * frequencies * (BM25_K1 + 1) / (frequencies + norm)
+        if bm25.max() > 0:
+            bm25 /= bm25.max()
+
+        dense = self._vectors[:size] @ hashed_embedding(query)
+        scores = HYBRID_WEIGHT * bm25 + (1 - HYBRID_WEIGHT) * dense
+        candidates = np.flatnonzero(scores >= MIN_SCORE)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [self._chunks[slot] for slot in candidates]
+
+
+def render_chunks(chunks: List[Chunk], today: date, budget: int) -> str:
+    """
+    Retrieved chunks as prompt context, best first within a token budget;
+    events are marked past or upcoming as of today.
+    """
+    lines = []
+    used = 0
+    for chunk in chunks:
+        line = f"- {chunk.text}"
+        if chunk.date is not None:
+            line += " (upcoming)" if chunk.date >= today else " (past)"
+        used += estimate_tokens(line)
+        if used > budget:
+            break
+        lines.append(line)
+    return "Relevant information:\n" + "\n".join(lines)
+
+
+content_index = ContentIndex(list(CHUNKERS))
@@ -0,0 +1,100 @@
+"""
+Database Bootstrap
+
+One-shot job that applies the migrations and the seed data:
+
+    python -m app.bootstrap            # migrations + seed data
+    python -m app.bootstrap --no-seed  # migrations only
+
+Run it once per deploy, before the web workers start (see render.yaml and
+the Dockerfile), with DB_SETUP_ON_STARTUP=false. Workers then only run
+check_database_ready(), so N workers no longer run N concurrent migrations
+and seeding passes on every boot.
+
+On PostgreSQL the job holds an advisory lock: if several runners start at
+once (e.g. workers with DB_SETUP_ON_STARTUP still on), one proceeds and the
+others wait for it, then find nothing left to do.
+"""
+
+import argparse
+import sys
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+from .config import settings
+from .migrations import run_migrations, schema_is_current
+from .timing import startup_timings
+
+# Application-wide advisory lock key for the bootstrap job (arbitrary)
+SETUP_LOCK_ID = 7_140_001
+
+
+@contextmanager
+def setup_lock():
+    """
+    Hold the bootstrap advisory lock (PostgreSQL; a no-op elsewhere).
+
+    Uses its own unpooled connection in autocommit mode, so the lock neither
+    takes a slot from the application pool nor leaves a transaction open
+    while migrations and seeding run on other connections.
+    """
+    lock_engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+    try:
+        if lock_engine.dialect.name != "postgresql":
+            yield
+            return
+        with lock_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("SELECT pg_advisory_lock(:id)"), {"id": SETUP_LOCK_ID})
+            try:
+                yield
+            finally:
+                connection.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": SETUP_LOCK_ID})
+    finally:
+        lock_engine.dispose()
+
+
+def bootstrap_database(seed: bool = True) -> None:
+    """Apply migrations, then seed data, under the bootstrap lock"""
+    with setup_lock():
+        with startup_timings.phase("migrations"):
+            run_migrations()
+        print("Database migrations applied successfully")
+
+        if seed:
+            with startup_timings.phase("seeding"):
+                # Imported here: seed_data (backend/, the working directory of
+                # every entry point) is a large module of literal data that
+                # web workers do not need
+                from seed_data import seed_database
+                seed_database()
+
+
+def check_database_ready() -> None:
+    """
+    Fail fast if the schema is behind the code (call from app startup).
+
+    Raises:
+        RuntimeError: If migrations are pending
+    """
+    if not schema_is_current():
+        raise RuntimeError(
+            "Database schema is not at the latest migration; "
+            "run `python -m app.bootstrap` (or set DB_SETUP_ON_STARTUP=true)"
+        )
+
+
+def main(argv=None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Apply database migrations and seed data")
+    parser.add_argument("--no-seed", action="store_true", help="Apply migrations only")
+    args = parser.parse_args(argv)
+
+    bootstrap_database(seed=not args.no_seed)
+    print(startup_timings.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""
+Bulk Writes
+
+Set-based batch inserts and atomic upserts by natural key.
+
+A batch costs a fixed number of statements regardless of its size: one
+SELECT ... WHERE key IN (...) for the duplicate check, one multi-row
+INSERT (or INSERT ... ON CONFLICT DO UPDATE when upserting) and a single
+commit. Items that cannot be applied (a key repeated within the batch, or
+already stored when not upserting) are reported per item instead of failing
+the whole batch:
+
+    result = bulk_create(db, Video, items, key=Video.youtube_id)
+    invalidate("videos", *result.ids())
+
+upsert_row writes a single row by its natural key with one
+INSERT ... ON CONFLICT DO UPDATE, so concurrent writers cannot both pass a
+uniqueness check and then collide:
+
+    video, created = upsert_row(db, Video, Video.youtube_id, values)
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, insert, literal_column, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .schemas.bulk import BulkItemResult, BulkResult
+
+# Largest batch accepted by the bulk endpoints
+BULK_MAX_ITEMS = 500
+
+# Dialect specific INSERT constructs supporting ON CONFLICT
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def check_batch_size(items: Sequence[Any]) -> None:
+    """
+    Reject empty or oversized batches.
+
+    Raises:
+        HTTPException: If the batch is empty or larger than BULK_MAX_ITEMS
+    """
+    if not items or len(items) > BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Send between 1 and {BULK_MAX_ITEMS} items",
+        )
+
+
+def upsert_statement(db: Session, model, key, columns: Sequence[str]):
+    """
+    INSERT ... ON CONFLICT (key) DO UPDATE for a model's unique column.
+
+    On conflict the given columns (except the key) take the inserted values.
+    updated_at is set explicitly, since the ORM's onupdate default does not
+    apply to ON CONFLICT updates.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect not in _UPSERT_INSERTS:
+        raise NotImplementedError(f"Upsert is not supported on {dialect}")
+
+    statement = _UPSERT_INSERTS[dialect](model)
+    return statement.on_conflict_do_update(
+        index_elements=[key],
+        set_={
+            **{name: statement.excluded[name] for name in columns if name != key.key},
+            "updated_at": func.now(),
+        },
+    )
+
+
+def bulk_create(
+    db: Session,
+    model,
+    items: List[Dict[str, Any]],
+    key=None,
+    upsert: bool = False,
+) -> BulkResult:
+    """
+    Insert a batch of rows in one statement and one transaction.
+
+    Args:
+        db: Database session
+        model: SQLAlchemy model
+        items: Column values per row
+        key: Unique column (e.g. Video.youtube_id) to check duplicates on
+        upsert: Update rows whose key already exists instead of reporting
+            them as conflicts (requires key)
+
+    Returns:
+        Per-item results in request order: created, updated or conflict
+
+    Raises:
+        HTTPException: 409 if the batch violates a constraint when written,
+            e.g. a concurrent insert of the same key or an unknown event_id
+    """
+    results: List[Optional[BulkItemResult]] = [None] * len(items)
+    accepted = list(enumerate(items))
+    existing = set()
+
+    if key is not None:
+        existing = set(db.scalars(select(key).where(key.in_({item[key.key] for item in items}))))
+        seen = set()
+        accepted = []
+        for index, item in enumerate(items):
+            value = item[key.key]
+            if value in seen:
+                detail = f"Duplicate {key.key} '{value}' in batch"
+            elif value in existing and not upsert:
+                detail = f"{key.key} '{value}' already exists"
+            else:
+                detail = None
+                accepted.append((index, item))
+            if detail:
+                results[index] = BulkItemResult(index=index, status="conflict", detail=detail)
+            seen.add(value)
+
+    if accepted:
+        values = [item for _, item in accepted]
+        try:
+            if key is not None:
+                statement = upsert_statement(db, model, key, values[0]) if upsert else insert(model)
+                ids = dict(
+                    (value, row_id)
+                    for row_id, value in db.execute(statement.returning(model.id, key), values)
+                )
+                for index, item in accepted:
+                    value = item[key.key]
+                    results[index] = BulkItemResult(
+                        index=index,
+                        id=ids[value],
+                        status="updated" if value in existing else "created",
+                    )
+            else:
+                returned = db.execute(
+                    insert(model).returning(model.id, sort_by_parameter_order=True), values
+                )
+                for (index, _), row_id in zip(accepted, returned.scalars()):
+                    results[index] = BulkItemResult(index=index, id=row_id, status="created")
+            db.commit()
+        except IntegrityError as error:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Batch conflicts with existing data: {error.orig}",
+            )
+
+    return BulkResult(results=results)
+
+
+def upsert_row(db: Session, model, key, values: Dict[str, Any]) -> Tuple[Any, bool]:
+    """
+    Create or replace one row by a unique natural key, atomically.
+
+    Args:
+        db: Database session
+        model: SQLAlchemy model
+        key: Unique column (e.g. Video.youtube_id); values must include it
+        values: Column values for the row
+
+    Returns:
+        The stored row and whether it was created (False: updated)
+
+    Raises:
+        HTTPException: 409 if the row violates another constraint, e.g. an
+            unknown event_id
+    """
+    statement = upsert_statement(db, model, key, values).values(values)
+    try:
+        if db.get_bind().dialect.name == "postgresql":
+            # xmax is 0 only for a row version created by an INSERT, so the
+            # statement itself reports which branch it took
+            row, created = db.execute(
+                statement.returning(model, literal_column("xmax") == 0),
+                execution_options={"populate_existing": True},
+            ).one()
+        else:
+            # No such marker elsewhere: check for the key in the same
+            # transaction (SQLite serializes writers anyway)
+            created = db.scalar(select(model.id).where(key == values[key.key])) is None
+            row = db.scalars(
+                statement.returning(model),
+                execution_options={"populate_existing": True},
+            ).one()
+        db.commit()
+    except IntegrityError as error:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Row conflicts with existing data: {error.orig}",
+        )
+    return row, created
@@ -0,0 +1,353 @@
+"""
+Response Cache
+
+In-process read-through cache for the public GET endpoints.
+
+Entries are keyed on the route function and its query/path parameters,
+expire after a TTL and are evicted least-recently-used once the cache is
+full. Every entry is tagged with the entity it was built from, so write
+handlers can invalidate exactly the keys their change affects:
+
+    @router.get("/videos/{video_id}", response_model=VideoSchema)
+    @cached("videos", VideoSchema, id_param="video_id")
+    def get_video(video_id: int, db: Session = Depends(get_db)):
+        ...
+
+    # in a POST/PUT/DELETE handler, after commit
+    invalidate("videos", video.id)
+
+The cache lives in each worker process, and invalidation only reaches the
+worker that handled the write. Other workers keep serving their entries
+until the TTL runs out, so keep CACHE_TTL_SECONDS short on multi-worker
+deployments.
+"""
+
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from .config import settings
+
+# Route parameters that never take part in the cache key
+UNCACHED_PARAMS = {"db", "request", "response"}
+
+_MISSING = object()
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with per-entry TTL and tag based invalidation"""
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 300):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[Hashable]] = {}
+        # Bumped on every invalidation, so a read that started before a
+        # write cannot store its stale result after the write invalidated
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def generation(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        """Snapshot of the invalidation counters for the given tags"""
+        with self._lock:
+            return tuple(self._generations.get(tag, 0) for tag in tags)
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        tags: Iterable[str] = (),
+        generation: Optional[Tuple[int, ...]] = None,
+    ) -> bool:
+        """
+        Store value under key, evicting the least recently used entries if full.
+
+        If a generation snapshot taken before computing the value is given and
+        one of the tags was invalidated since, the value is stale and is not
+        stored. Returns whether the value was stored.
+        """
+        tags = tuple(tags)
+        with self._lock:
+            if generation is not None and generation != self.generation(tags):
+                return False
+
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+            return True
+
+    def invalidate(self, *tags: str) -> int:
+        """Drop every entry carrying one of the given tags. Returns the number removed."""
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics"""
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Current size and hit/miss counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+response_cache = ResponseCache(
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.CACHE_TTL_SECONDS,
+)
+
+# JSON bytes of single rows, keyed on (schema, id, updated_at), which
+# serialized list responses are assembled from
+row_cache = ResponseCache(
+    max_entries=settings.ROW_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.ROW_CACHE_TTL_SECONDS,
+)
+
+
+def list_tag(entity: str) -> str:
+    """Tag shared by every collection/singleton read of an entity"""
+    return f"{entity}:list"
+
+
+def item_tag(entity: str, entity_id: Any) -> str:
+    """Tag for the detail read of a single row"""
+    return f"{entity}:{entity_id}"
+
+
+def entity_tag(entity: str) -> str:
+    """Tag carried by every cached read of an entity"""
+    return f"{entity}:*"
+
+
+# Callables told about every write reported through invalidate() as
+# (entity, ids), ids empty when the whole entity changed; for in-process
+# indexes derived from the tables
+_invalidation_listeners: List[Callable[[str, Tuple[Any, ...]], None]] = []
+
+
+def on_invalidate(listener: Callable[[str, Tuple[Any, ...]], None]) -> Callable:
+    """Register a listener for writes reported through invalidate (decorator)"""
+    _invalidation_listeners.append(listener)
+    return listener
+
+
+def _notify(entity: str, entity_ids: Tuple[Any, ...]) -> None:
+    for listener in _invalidation_listeners:
+        listener(entity, entity_ids)
+
+
+def invalidate_entity(entity: str) -> int:
+    """
+    Drop every cached read of an entity, list and detail alike.
+
+    Called when the table version moved; listeners are not told, since the
+    writes behind it were either reported by this worker already or are
+    picked up by the indexes' own periodic reload.
+    """
+    row_cache.invalidate(entity_tag(entity))
+    return response_cache.invalidate(entity_tag(entity))
+
+
+def invalidate(entity: str, *entity_ids: Any) -> int:
+    """
+    Invalidate cached reads affected by a write to an entity.
+
+    Always drops the entity's list reads; detail reads and serialized rows
+    are only dropped for the given ids, or all rows if no id is given (a
+    bulk update).
+    """
+    _notify(entity, entity_ids)
+    item_tags = [item_tag(entity, entity_id) for entity_id in entity_ids]
+    row_cache.invalidate(*(item_tags or [entity_tag(entity)]))
+    return response_cache.invalidate(list_tag(entity), *item_tags)
+
+
+def _to_schema(schema, result):
+    if isinstance(result, BaseModel):
+        return result
+    if isinstance(result, list):
+        return [schema.model_validate(item) for item in result]
+    return schema.model_validate(result)
+
+
+def row_json(entity: str, schema, row, variant: Any = None) -> bytes:
+    """
+    JSON bytes of one ORM row through its schema, cached per row version.
+
+    Rows are validated and encoded once per (id, updated_at); later pages
+    containing the same row reuse the bytes. variant is the route's `vary`
+    value, for schemas with fields derived from more than the row.
+    """
+    if isinstance(row, BaseModel):
+        return row.model_dump_json().encode()
+    if not settings.CACHE_ENABLED:
+        return schema.model_validate(row).model_dump_json().encode()
+
+    key = (schema, row.id, row.updated_at, variant)
+    value = row_cache.get(key)
+    if value is None:
+        value = schema.model_validate(row).model_dump_json().encode()
+        row_cache.set(key, value, tags=[item_tag(entity, row.id), entity_tag(entity)])
+    return value
+
+
+def _to_json(entity: str, schema, result, variant: Any = None) -> bytes:
+    if isinstance(result, BaseModel):
+        return result.model_dump_json().encode()
+    if isinstance(result, (list, tuple)):
+        return b"[" + b",".join(row_json(entity, schema, row, variant) for row in result) + b"]"
+    return row_json(entity, schema, result, variant)
+
+
+def cached(
+    entity: Union[str, Sequence[str]],
+    schema,
+    id_param: Optional[str] = None,
+    serialized: bool = False,
+    vary: Optional[Callable[[], Any]] = None,
+) -> Callable:
+    """
+    Cache the result of a GET route function.
+
+    Args:
+        entity: Entity name used for invalidation (e.g. "videos"), or a list
+            of names for routes built from several entities
+        schema: Pydantic schema the ORM result is converted to before caching
+        id_param: Path parameter holding the row id for detail routes
+        serialized: Cache the JSON bytes instead of the schema objects and
+            return them as a Response, so hits skip response_model
+            validation and encoding. List results are joined from per-row
+            bytes (see `row_json`).
+        vary: Called per request; its value is part of the cache key, for
+            results that depend on more than the database (e.g. the date)
+
+    Works on both sync and async route functions. HTTP errors raised by the
+    route are not cached.
+    """
+    entities = [entity] if isinstance(entity, str) else list(entity)
+
+    def decorator(func: Callable) -> Callable:
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        def lookup(kwargs, variant):
+            key = (name, variant, tuple(sorted(
+                # Repeatable query parameters arrive as lists
+                (param, tuple(value) if isinstance(value, list) else value)
+                for param, value in kwargs.items()
+                if param not in UNCACHED_PARAMS
+            )))
+            if id_param is not None:
+                tags = [item_tag(entities[0], kwargs[id_param]), entity_tag(entities[0])]
+            else:
+                tags = [tag for each in entities for tag in (list_tag(each), entity_tag(each))]
+            return key, tags, response_cache.get(key, _MISSING)
+
+        def store(key, tags, generation, result, variant):
+            if serialized:
+                value = _to_json(entities[0], schema, result, variant)
+            else:
+                value = _to_schema(schema, result)
+            response_cache.set(key, value, tags, generation=generation)
+            return value
+
+        def respond(value):
+            if serialized:
+                return Response(content=value, media_type="application/json")
+            return value
+
+        def uncached(result):
+            if serialized:
+                return respond(_to_json(entities[0], schema, result))
+            return result
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not settings.CACHE_ENABLED:
+                    return uncached(await func(*args, **kwargs))
+
+                variant = vary() if vary else None
+                key, tags, value = lookup(kwargs, variant)
+                if value is _MISSING:
+                    generation = response_cache.generation(tags)
+                    value = store(key, tags, generation, await func(*args, **kwargs), variant)
+                return respond(value)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not settings.CACHE_ENABLED:
+                return uncached(func(*args, **kwargs))
+
+            variant = vary() if vary else None
+            key, tags, value = lookup(kwargs, variant)
+            if value is _MISSING:
+                generation = response_cache.generation(tags)
+                value = store(key, tags, generation, func(*args, **kwargs), variant)
+            return respond(value)
+
+        return wrapper
+
+    return decorator
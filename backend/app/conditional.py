@@ -0,0 +1,253 @@
+"""
+Conditional GET
+
+ETag / Last-Modified support for the public read endpoints.
+
+The validator for a route is derived from the table it reads:
+max(updated_at) plus the row count. updated_at is set on insert and on
+update and is indexed, so this is one cheap aggregate query that changes on
+every insert, update or delete. It runs on every request, which makes it
+the source of truth across worker processes: when it differs from the
+version this worker last saw, the entity's cached responses are dropped
+before the route runs. Requests carrying a matching If-None-Match (or a
+fresh enough If-Modified-Since) get a 304 before any rows are loaded:
+
+    @router.get("/videos", response_model=List[VideoSchema])
+    @conditional("videos", Video)
+    @cached("videos", VideoSchema)
+    def get_videos(...):
+        ...
+"""
+
+import hashlib
+import inspect
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from fastapi import Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+import threading
+
+from .cache import UNCACHED_PARAMS, invalidate_entity
+
+_REQUEST_PARAM = "conditional_request"
+_RESPONSE_PARAM = "conditional_response"
+
+# Table version each entity's cached responses were last checked against
+_seen_versions = {}
+_seen_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class TableVersion:
+    """Cheap change marker for a whole table"""
+    last_modified: Optional[datetime]
+    row_count: int
+
+
+def version_statement(*models):
+    """max(updated_at) and row count for each model's table in one query"""
+    columns = []
+    for model in models:
+        columns.append(select(func.max(model.updated_at)).scalar_subquery())
+        columns.append(select(func.count(model.id)).scalar_subquery())
+    return select(*columns)
+
+
+def table_versions(db: Session, *models) -> List[TableVersion]:
+    """Read the table versions with a sync session"""
+    return _to_versions(db.execute(version_statement(*models)).one())
+
+
+async def table_versions_async(db: AsyncSession, *models) -> List[TableVersion]:
+    """Read the table versions with an AsyncSession"""
+    return _to_versions((await db.execute(version_statement(*models))).one())
+
+
+def _to_versions(row) -> List[TableVersion]:
+    versions = []
+    for last_modified, row_count in zip(row[::2], row[1::2]):
+        if last_modified is not None and last_modified.tzinfo is None:
+            # SQLite returns naive UTC timestamps
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        versions.append(TableVersion(last_modified=last_modified, row_count=row_count))
+    return versions
+
+
+def combine_versions(versions: Sequence[TableVersion]) -> TableVersion:
+    """Version of a response built from several tables"""
+    stamps = [version.last_modified for version in versions if version.last_modified]
+    return TableVersion(
+        last_modified=max(stamps) if stamps else None,
+        row_count=sum(version.row_count for version in versions),
+    )
+
+
+def make_etag(route_key: str, version: TableVersion) -> str:
+    """Build a weak ETag from the route, its parameters and the table version"""
+    stamp = version.last_modified.isoformat() if version.last_modified else ""
+    digest = hashlib.sha1(f"{route_key}|{stamp}|{version.row_count}".encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since against the current validators.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted when
+    no entity tag was sent (RFC 9110, section 13.2.2). A wildcard
+    If-None-Match is not evaluated here since it depends on whether the
+    resource exists; see `matches_any`.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        opaque = etag.removeprefix("W/")
+        return any(tag.removeprefix("W/") == opaque for tag in candidates)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
+def matches_any(request: Request) -> bool:
+    """Whether the request sent If-None-Match: *"""
+    if_none_match = request.headers.get("if-none-match") or ""
+    return "*" in {tag.strip() for tag in if_none_match.split(",")}
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    """Response headers advertising the validators"""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    return headers
+
+
+def _check_version(entity: str, version: TableVersion) -> None:
+    """Drop cached responses built from an older version of the table"""
+    with _seen_lock:
+        changed = _seen_versions.get(entity) != version
+        _seen_versions[entity] = version
+    if changed:
+        invalidate_entity(entity)
+
+
+def conditional(entity: str, model, vary: Optional[Callable[[], Any]] = None) -> Callable:
+    """
+    Answer conditional GETs for a route with 304 Not Modified.
+
+    Args:
+        entity: Entity name used for cache invalidation (e.g. "videos")
+        model: SQLAlchemy model whose table backs the route
+        vary: Called per request; its value is part of the ETag, for
+            responses that depend on more than the table. A datetime value
+            is also the earliest Last-Modified (e.g. the start of the day
+            for views derived from today's date).
+
+    The decorated route must take a `db` session parameter, a Session for
+    sync routes or an AsyncSession for async ones. The request and
+    response objects are injected into the route signature automatically.
+    """
+    return conditional_on({entity: model}, vary=vary)
+
+
+def conditional_on(sources: Dict[str, Any], vary: Optional[Callable[[], Any]] = None) -> Callable:
+    """
+    Like `conditional`, for a route built from several tables.
+
+    Args:
+        sources: Entity name -> model for every table the route reads
+        vary: As for `conditional`
+
+    The versions of all tables are read in one query; a change to any of
+    them changes the ETag and drops that entity's cached responses.
+    """
+    entities = list(sources)
+    models = list(sources.values())
+
+    def decorator(func: Callable) -> Callable:
+        name = f"{func.__module__}.{func.__qualname__}"
+        signature = inspect.signature(func)
+
+        def validators(kwargs, versions):
+            for entity, version in zip(entities, versions):
+                _check_version(entity, version)
+            params = sorted(
+                (param, value) for param, value in kwargs.items()
+                if param not in UNCACHED_PARAMS
+            )
+            # Per-table versions go into the key too: the combined version
+            # alone misses e.g. a delete in one table and insert in another
+            version = combine_versions(versions)
+            variant = vary() if vary else None
+            etag = make_etag(f"{name}|{params}|{versions}|{variant}", version)
+            last_modified = version.last_modified
+            if vary is not None:
+                # Without a time to compare, only the ETag can validate
+                if not isinstance(variant, datetime):
+                    last_modified = None
+                elif last_modified is None or variant > last_modified:
+                    last_modified = variant
+            return etag, last_modified, validator_headers(etag, last_modified)
+
+        def respond(request, response, result, headers):
+            if matches_any(request):
+                # The route returned, so the resource exists
+                return Response(status_code=304, headers=headers)
+            if isinstance(result, Response):
+                # Returned responses bypass the injected response's headers
+                result.headers.update(headers)
+            else:
+                response.headers.update(headers)
+            return result
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                request: Request = kwargs.pop(_REQUEST_PARAM)
+                response: Response = kwargs.pop(_RESPONSE_PARAM)
+
+                versions = await table_versions_async(kwargs["db"], *models)
+                etag, last_modified, headers = validators(kwargs, versions)
+                if is_not_modified(request, etag, last_modified):
+                    return Response(status_code=304, headers=headers)
+
+                return respond(request, response, await func(*args, **kwargs), headers)
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                request: Request = kwargs.pop(_REQUEST_PARAM)
+                response: Response = kwargs.pop(_RESPONSE_PARAM)
+
+                versions = table_versions(kwargs["db"], *models)
+                etag, last_modified, headers = validators(kwargs, versions)
+                if is_not_modified(request, etag, last_modified):
+                    return Response(status_code=304, headers=headers)
+
+                return respond(request, response, func(*args, **kwargs), headers)
+
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter(_REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            inspect.Parameter(_RESPONSE_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+        ])
+        return wrapper
+
+    return decorator
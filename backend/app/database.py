@@ -1,21 +1,109 @@
-from sqlalchemy import create_engine
+from sqlalchemy import DateTime, create_engine
+from sqlalchemy.dialects.sqlite import DATETIME as SQLITE_DATETIME
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+import random
+from contextlib import asynccontextmanager
+
+from fastapi import Request
+from sqlalchemy.orm import Session, sessionmaker
 from .config import settings
+from .pool import engine_options, instrument
+from .replicas import USE_PRIMARY, reads_from_primary
 
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,  # Log SQL queries in debug mode
-    pool_pre_ping=True,   # Verify connections before using
+    **engine_options(settings.DATABASE_URL),  # Pool sizing from DB_POOL_* settings
 )
+instrument(engine)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async drivers for the read path, by backend
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url(database_url: str):
+    """
+    Translate a sync database URL to its async driver.
+
+    libpq's sslmode is spelled ssl for asyncpg.
+    """
+    url = make_url(database_url)
+    url = url.set(drivername=ASYNC_DRIVERS[url.get_backend_name()])
+    if url.get_backend_name() == "postgresql" and "sslmode" in url.query:
+        url = url.difference_update_query(["sslmode"]).update_query_dict(
+            {"ssl": url.query["sslmode"]}
+        )
+    return url
+
+
+# Async engine for the read endpoints, so a worker can wait on many queries
+# at once instead of holding a threadpool thread per query
+async_engine = create_async_engine(
+    async_database_url(settings.DATABASE_URL),
+    echo=settings.DEBUG,
+    **engine_options(settings.DATABASE_URL, asynchronous=True),
+)
+instrument(async_engine.sync_engine)
+
+# Async engines for the read replicas in DATABASE_READ_URL, if any
+read_engines = [
+    create_async_engine(
+        async_database_url(url),
+        echo=settings.DEBUG,
+        **engine_options(url, asynchronous=True),
+    )
+    for url in settings.database_read_urls
+]
+for read_engine in read_engines:
+    instrument(read_engine.sync_engine)
+
+
+class RoutingSession(Session):
+    """
+    Session that reads from a replica and writes to the primary.
+
+    Each session sticks to one randomly chosen replica so that all queries
+    of a request see the same snapshot. Flushes, and sessions opened with
+    info={USE_PRIMARY: True}, use the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if not read_engines or self._flushing or self.info.get(USE_PRIMARY):
+            return async_engine.sync_engine
+        if "replica" not in self.info:
+            self.info["replica"] = random.choice(read_engines)
+        return self.info["replica"].sync_engine
+
+
+# Async session factory; expire_on_commit=False since expired attributes
+# cannot be lazy loaded outside of an await
+AsyncSessionLocal = async_sessionmaker(
+    sync_session_class=RoutingSession, autoflush=False, expire_on_commit=False,
+)
+
 # Create base class for models
 Base = declarative_base()
 
+# Timestamp column type. SQLite stores CURRENT_TIMESTAMP as
+# 'YYYY-MM-DD HH:MM:SS', so bind Python datetimes in that same format there;
+# otherwise equality and range filters on stored timestamps never match.
+Timestamp = DateTime(timezone=True).with_variant(
+    SQLITE_DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d "
+                       "%(hour)02d:%(minute)02d:%(second)02d"
+    ),
+    "sqlite",
+)
+
 
 def get_db():
     """
@@ -33,8 +121,45 @@ def get_db():
         db.close()
 
 
+async def get_async_db(request: Request):
+    """
+    Async database session dependency for read-only routes.
+
+    Reads from a replica when DATABASE_READ_URL is set, unless the client
+    wrote recently (see app/replicas.py).
+
+    Usage in route:
+        @app.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_async_db)):
+            result = await db.scalars(select(Item))
+            ...
+    """
+    async with AsyncSessionLocal(info={USE_PRIMARY: reads_from_primary(request)}) as db:
+        yield db
+
+
+@asynccontextmanager
+async def primary_reads(db: AsyncSession):
+    """
+    A session reading from the primary: db itself, unless db reads from a
+    replica, in which case a new session on the primary.
+
+    For reads that must see a write that just happened (replicas may lag).
+    """
+    if not read_engines or not isinstance(db.sync_session, RoutingSession) or db.info.get(USE_PRIMARY):
+        yield db
+        return
+    async with AsyncSessionLocal(info={USE_PRIMARY: True}) as primary:
+        yield primary
+
+
 def create_tables():
-    """Create all tables in the database"""
+    """
+    Create all tables in the database.
+
+    Only for throwaway databases (tests, scripts); the application schema is
+    managed by the Alembic migrations in backend/alembic.
+    """
     Base.metadata.create_all(bind=engine)
 
 
@@ -0,0 +1,96 @@
+"""
+Video Facets
+
+Counts of visible videos by category, published year and linked event, for
+filter menus like "concert (12) / performance (9)".
+
+The counts are a summary maintained in memory rather than a GROUP BY per
+request: the index keeps each visible video's facet values and adjusts the
+counters when rows are reloaded after a write (see indexes.RowIndex), so
+rendering facets never reads the videos table.
+"""
+
+from collections import Counter
+from typing import Any, Dict, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .indexes import RowIndex
+from .models.video import Video
+from .schemas.video import FacetCount, VideoFacets
+
+# Facet values of one video: category, published year, event_id
+Values = Tuple[Optional[str], Optional[int], Optional[int]]
+
+FACETS = ("category", "year", "event")
+
+
+class VideoFacetIndex(RowIndex):
+    """Facet counters over visible videos"""
+
+    def reset(self) -> None:
+        self._values: Dict[int, Values] = {}
+        self._counts: Dict[str, Counter] = {facet: Counter() for facet in FACETS}
+
+    def put(self, video_id: int, values: Values) -> None:
+        """Count a video, replacing its previous values"""
+        self.remove(video_id)
+        self._values[video_id] = values
+        for facet, value in zip(FACETS, values):
+            self._counts[facet][value] += 1
+
+    def remove(self, video_id: int) -> None:
+        """Stop counting a video if counted"""
+        values = self._values.pop(video_id, None)
+        if values is None:
+            return
+        for facet, value in zip(FACETS, values):
+            counts = self._counts[facet]
+            counts[value] -= 1
+            if not counts[value]:
+                del counts[value]
+
+    async def load(self, db: AsyncSession, entity: str, ids: Optional[Set[int]]) -> None:
+        statement = select(
+            Video.id, Video.category, Video.published_date, Video.event_id, Video.is_visible
+        )
+        if ids is None:
+            self.reset()
+            statement = statement.where(Video.is_visible == True)
+        else:
+            statement = statement.where(Video.id.in_(ids))
+        rows = (await db.execute(statement)).all()
+
+        found = set()
+        for row in rows:
+            if row.is_visible:
+                year = row.published_date.year if row.published_date else None
+                self.put(row.id, (row.category, year, row.event_id))
+                found.add(row.id)
+        # Deleted or hidden videos
+        for video_id in (ids or set()) - found:
+            self.remove(video_id)
+
+    def facets(self) -> VideoFacets:
+        """Current counts; unknown values (None) are listed last"""
+        def ordered(facet: str, by_value: bool = False) -> list:
+            def sort_key(item: Tuple[Any, int]):
+                value, count = item
+                if by_value:
+                    return (value is None, -(value or 0))
+                return (value is None, -count, str(value))
+            return [
+                FacetCount(value=value, count=count)
+                for value, count in sorted(self._counts[facet].items(), key=sort_key)
+            ]
+
+        return VideoFacets(
+            total=len(self._values),
+            category=ordered("category"),
+            year=ordered("year", by_value=True),  # newest first
+            event=ordered("event"),
+        )
+
+
+video_facets = VideoFacetIndex(["videos"])
@@ -0,0 +1,131 @@
+"""
+In-Memory Indexes
+
+Base class for per-worker structures derived from table rows (search
+suggestions, video facet counts, ...) that are read on every request and
+must not query the database to answer.
+
+An index is loaded on the first request and then maintained incrementally:
+write handlers already report changed rows through cache.invalidate(),
+which marks them dirty here, and the next request reloads only those rows,
+from the primary (a lagging read replica could still return the old rows).
+Writes handled by other workers are picked up by a full reload every
+INDEX_REFRESH_SECONDS.
+
+Subclasses implement reset() and load():
+
+    class TitleIndex(RowIndex):
+        def reset(self):
+            self.titles = {}
+
+        async def load(self, db, entity, ids):
+            ...  # select the rows (all of them if ids is None) and apply
+
+    title_index = TitleIndex(["videos"])
+
+    await title_index.refresh(db)
+"""
+
+import asyncio
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .cache import on_invalidate
+from .config import settings
+from .database import primary_reads
+
+_indexes: List["RowIndex"] = []
+
+
+class RowIndex:
+    """In-memory index over rows of some entities, refreshed from writes"""
+
+    def __init__(self, entities: List[str], refresh_seconds: Optional[float] = None):
+        """
+        Args:
+            entities: Cache entity names the index is built from, as passed
+                to invalidate(), e.g. ["videos"]
+            refresh_seconds: Seconds between full reloads (default:
+                settings.INDEX_REFRESH_SECONDS)
+        """
+        self.entities = list(entities)
+        self.refresh_seconds = (
+            settings.INDEX_REFRESH_SECONDS if refresh_seconds is None else refresh_seconds
+        )
+        self._lock = asyncio.Lock()
+        self.clear()
+        on_invalidate(self.mark_dirty)
+        _indexes.append(self)
+
+    def clear(self) -> None:
+        """Drop all data; the next refresh reloads everything"""
+        # entity -> dirty ids, or None when every row must be reloaded
+        self._dirty: Dict[str, Optional[Set[Any]]] = {entity: None for entity in self.entities}
+        # Whether rows were marked dirty by a write since the last reload
+        self._written = False
+        self._loaded_at = 0.0
+        self.reset()
+
+    def reset(self) -> None:
+        """Empty the index's own structures"""
+        raise NotImplementedError
+
+    async def load(self, db: AsyncSession, entity: str, ids: Optional[Set[Any]]) -> None:
+        """Reload rows of an entity: the given ids, or all rows if None"""
+        raise NotImplementedError
+
+    async def loaded(self) -> None:
+        """Called after a refresh reloaded rows, e.g. to rebuild derived data"""
+
+    def mark_dirty(self, entity: str, ids: Tuple[Any, ...] = ()) -> None:
+        """Schedule rows (all rows of the entity if no ids) for reloading"""
+        if entity not in self._dirty:
+            return
+        self._written = True
+        if not ids:
+            self._dirty[entity] = None
+        elif self._dirty[entity] is not None:
+            self._dirty[entity].update(int(row_id) for row_id in ids)
+
+    def _pending(self) -> bool:
+        return any(ids is None or ids for ids in self._dirty.values())
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """Reload dirty rows, or everything once refresh_seconds have passed"""
+        if time.monotonic() - self._loaded_at > self.refresh_seconds:
+            for entity in self.entities:
+                self._dirty[entity] = None
+        if not self._pending() and not self._lock.locked():
+            return
+
+        # Requests arriving during a reload wait for it rather than reading
+        # a half-loaded index
+        async with self._lock:
+            if not self._pending():
+                return
+            dirty, self._dirty = self._dirty, {entity: set() for entity in self.entities}
+            written, self._written = self._written, False
+            try:
+                # Written rows are read back from the primary
+                async with primary_reads(db) if written else nullcontext(db) as source:
+                    for entity in self.entities:
+                        ids = dirty[entity]
+                        if ids is None or ids:
+                            await self.load(source, entity, ids)
+                await self.loaded()
+            except BaseException:
+                # Retry the whole reload on the next request
+                self._dirty = {entity: None for entity in self.entities}
+                self._written = self._written or written
+                raise
+            if all(ids is None for ids in dirty.values()):
+                self._loaded_at = time.monotonic()
+
+
+def clear_indexes() -> None:
+    """Drop the data of every index (e.g. between tests)"""
+    for index in _indexes:
+        index.clear()
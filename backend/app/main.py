@@ -1,16 +1,20 @@
+import time
+
+_import_started = time.perf_counter()
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from .bootstrap import bootstrap_database, check_database_ready
 from .config import settings
-from .database import create_tables
-import sys
-import os
+from .replicas import sticky_reads_middleware
+from .scheduler import start_scheduler, stop_scheduler
+from .timing import startup_timings
 
-# Add parent directory to path to import seed_data
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from seed_data import seed_database
+startup_timings.record("import", time.perf_counter() - _import_started)
 
 # Import routers
-from .routers import bio, events, ensemble, contact, videos, playlists
+with startup_timings.phase("import_routers"):
+    from .routers import bio, events, ensemble, contact, videos, playlists, home, search, chat, internal
 
 app = FastAPI(
     title="Abathar Kmash Music Website API",
@@ -29,28 +33,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Send a client's reads to the primary for a while after it writes
+app.middleware("http")(sticky_reads_middleware)
+
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup"""
-    import os
-    from .database import SessionLocal, drop_tables
+    """Check (or, in development, set up) the database on startup"""
+    if settings.DB_SETUP_ON_STARTUP:
+        # Migrations and seed data (safe to run multiple times; concurrent
+        # workers are serialized by the bootstrap lock). Errors stop the
+        # worker: it could not serve against a half-set-up database anyway
+        bootstrap_database()
+
+    # Refuse to serve against an outdated schema
+    with startup_timings.phase("readiness"):
+        check_database_ready()
+
+    # Optional midnight refresh of date-dependent cached views
+    start_scheduler()
 
-    # Check if FORCE_RESEED environment variable is set
-    if os.getenv("FORCE_RESEED", "false").lower() == "true":
-        print("🔄 FORCE_RESEED detected - dropping and recreating ALL tables...")
-        drop_tables()
-        print("✓ All tables dropped")
+    print(startup_timings.summary())
 
-    create_tables()
-    print("Database tables created successfully")
 
-    # Seed database with initial data (safe to run multiple times)
-    try:
-        seed_database()
-    except Exception as e:
-        print(f"Warning: Database seeding encountered an error: {e}")
-        print("Continuing with startup...")
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background jobs"""
+    await stop_scheduler()
 
 
 @app.get("/")
@@ -70,12 +79,17 @@ async def health_check():
 
 
 # Include routers
-app.include_router(bio.router, prefix="/api", tags=["Biography"])
-app.include_router(events.router, prefix="/api", tags=["Events"])
-app.include_router(ensemble.router, prefix="/api", tags=["Ensemble"])
-app.include_router(contact.router, prefix="/api", tags=["Contact"])
-app.include_router(videos.router, prefix="/api", tags=["Videos"])
-app.include_router(playlists.router, prefix="/api", tags=["Playlists"])
+with startup_timings.phase("routers"):
+    app.include_router(bio.router, prefix="/api", tags=["Biography"])
+    app.include_router(events.router, prefix="/api", tags=["Events"])
+    app.include_router(ensemble.router, prefix="/api", tags=["Ensemble"])
+    app.include_router(contact.router, prefix="/api", tags=["Contact"])
+    app.include_router(videos.router, prefix="/api", tags=["Videos"])
+    app.include_router(playlists.router, prefix="/api", tags=["Playlists"])
+    app.include_router(home.router, prefix="/api", tags=["Home"])
+    app.include_router(search.router, prefix="/api", tags=["Search"])
+    app.include_router(chat.router, prefix="/api", tags=["Chat"])
+    app.include_router(internal.router, tags=["Internal"], include_in_schema=False)
 
 
 if __name__ == "__main__":
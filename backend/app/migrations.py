@@ -0,0 +1,81 @@
+"""
+Database Migrations
+
+Applies the Alembic migrations in backend/alembic on startup. This replaces
+the old create_tables() / FORCE_RESEED path, which dropped every table to
+apply a schema change.
+
+Databases created before migrations existed (via create_all) have the
+baseline tables but no alembic_version table; they are stamped at the
+baseline revision first and then upgraded like any other database.
+
+Web workers only run the readiness check (schema_is_current), which reads
+the revision ids from the migration files and the alembic_version table
+without importing Alembic; Alembic is imported where migrations run.
+"""
+
+import ast
+import glob
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, FrozenSet
+
+from sqlalchemy import inspect, text
+
+from .database import engine
+
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_REVISION = "0001"
+
+
+def alembic_config() -> "Config":
+    """Alembic configuration pointing at backend/alembic"""
+    from alembic.config import Config
+
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    return config
+
+
+def run_migrations(revision: str = "head") -> None:
+    """Upgrade the database to the given revision (default: latest)"""
+    from alembic import command
+
+    config = alembic_config()
+
+    inspector = inspect(engine)
+    if not inspector.has_table("alembic_version") and inspector.has_table("events"):
+        print(f"Existing schema without migration history - stamping revision {BASELINE_REVISION}")
+        command.stamp(config, BASELINE_REVISION)
+
+    command.upgrade(config, revision)
+
+
+@lru_cache(maxsize=None)
+def migration_heads() -> FrozenSet[str]:
+    """Latest revision ids in backend/alembic/versions (revisions nothing revises)"""
+    revisions, revised = set(), set()
+    for path in glob.glob(os.path.join(BACKEND_DIR, "alembic", "versions", "*.py")):
+        with open(path, encoding="utf-8") as file:
+            module = ast.parse(file.read())
+        for node in module.body:
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                name = node.targets[0].id
+                if name == "revision":
+                    revisions.add(ast.literal_eval(node.value))
+                elif name == "down_revision":
+                    value = ast.literal_eval(node.value)
+                    revised.update(value if isinstance(value, (tuple, list)) else [value])
+    return frozenset(revisions - revised)
+
+
+def schema_is_current(connectable=None) -> bool:
+    """Whether the database is at the latest migration (two small queries)"""
+    with (connectable or engine).connect() as connection:
+        if not inspect(connection).has_table("alembic_version"):
+            return False
+        current = connection.execute(text("SELECT version_num FROM alembic_version")).scalars().all()
+    return set(current) == migration_heads()
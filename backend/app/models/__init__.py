@@ -3,5 +3,6 @@ from .event import Event
 from .ensemble import Ensemble
 from .video import Video
 from .playlist import Playlist
+from .seed_record import SeedRecord
 
-__all__ = ["Bio", "Event", "Ensemble", "Video", "Playlist"]
+__all__ = ["Bio", "Event", "Ensemble", "Video", "Playlist", "SeedRecord"]
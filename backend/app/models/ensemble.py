@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, JSON, DateTime
+from sqlalchemy import Column, Integer, String, Text, JSON
 from sqlalchemy.sql import func
-from ..database import Base
+from ..database import Base, Timestamp
 
 
 class Ensemble(Base):
@@ -29,8 +29,8 @@ class Ensemble(Base):
     highlights = Column(JSON, nullable=True)
 
     # Metadata
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(Timestamp, server_default=func.now())
+    updated_at = Column(Timestamp, server_default=func.now(), onupdate=func.now(), index=True)
 
     def __repr__(self):
         return f"<Ensemble(name='{self.name}')>"
@@ -1,6 +1,8 @@
-from sqlalchemy import Column, Integer, String, Text, Date, Time, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Date, Time
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
-from ..database import Base
+from ..database import Base, Timestamp
+from ..scheduler import local_today
 
 
 class Event(Base):
@@ -23,12 +25,19 @@ class Event(Base):
     event_type = Column(String(100), nullable=True)  # e.g., "concert", "workshop", "children's concert"
     photo_url = Column(String(500), nullable=True)  # e.g., "/images/performances/performance-01.webp"
 
-    # Status
-    is_past = Column(Boolean, default=False, index=True)
-
     # Metadata
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(Timestamp, server_default=func.now())
+    updated_at = Column(Timestamp, server_default=func.now(), onupdate=func.now(), index=True)
+
+    @hybrid_property
+    def is_past(self):
+        """Whether the event date is before today (site timezone)"""
+        return self.date < local_today()
+
+    @is_past.expression
+    def is_past(cls):
+        # Compares the indexed date column, so the split is an index range
+        return cls.date < local_today()
 
     def __repr__(self):
         return f"<Event(title='{self.title}', date='{self.date}')>"
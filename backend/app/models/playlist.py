@@ -4,9 +4,9 @@ Playlist Model
 SQLAlchemy model for YouTube playlists.
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, Index, true
 from sqlalchemy.sql import func
-from ..database import Base
+from ..database import Base, Timestamp
 
 
 class Playlist(Base):
@@ -25,13 +25,30 @@ class Playlist(Base):
     video_count = Column(Integer, nullable=True)  # Number of videos in playlist
 
     # Display settings
-    is_featured = Column(Boolean, default=False, index=True)
-    display_order = Column(Integer, default=0)
-    is_visible = Column(Boolean, default=True, index=True)
+    is_featured = Column(Boolean, default=False)
+    display_order = Column(Integer, default=0, server_default="0", nullable=False)
+    is_visible = Column(Boolean, default=True)
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(Timestamp, server_default=func.now())
+    updated_at = Column(Timestamp, server_default=func.now(), onupdate=func.now(), index=True)
+
+    __table_args__ = (
+        # Keyset pagination over visible playlists: display_order, newest first, id
+        Index(
+            "ix_playlists_visible_keyset",
+            display_order, created_at.desc(), id,
+            postgresql_where=is_visible == true(),
+            sqlite_where=is_visible == true(),
+        ),
+        # Featured filter and GET /playlists/featured
+        Index(
+            "ix_playlists_visible_featured",
+            is_featured, display_order, created_at.desc(), id,
+            postgresql_where=is_visible == true(),
+            sqlite_where=is_visible == true(),
+        ),
+    )
 
     def __repr__(self):
         return f"<Playlist {self.title}>"
@@ -0,0 +1,32 @@
+"""
+Seed Record Model
+
+Tracks which rows were written by the seeder (seed_data.py), under which
+natural key and from which version of the seed record.
+"""
+
+from sqlalchemy import Column, Integer, String, UniqueConstraint
+from sqlalchemy.sql import func
+from ..database import Base, Timestamp
+
+
+class SeedRecord(Base):
+    """Row written by the seeder, with the fingerprint of its seed data"""
+
+    __tablename__ = "seed_records"
+
+    id = Column(Integer, primary_key=True)
+    entity = Column(String(50), nullable=False)  # e.g. "videos"
+    natural_key = Column(String(600), nullable=False)  # e.g. youtube_id
+    row_id = Column(Integer, nullable=False)  # id of the seeded row in its table
+    fingerprint = Column(String(64), nullable=False)  # SHA-256 of the seed record
+
+    # Timestamps
+    updated_at = Column(Timestamp, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("entity", "natural_key", name="uq_seed_records_entity_key"),
+    )
+
+    def __repr__(self):
+        return f"<SeedRecord {self.entity}:{self.natural_key}>"
@@ -1,7 +1,27 @@
-from sqlalchemy import Column, Integer, String, Text, Date, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Date, Boolean, ForeignKey, Index, true
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from ..database import Base
+from ..database import Base, Timestamp
+
+
+def _visible_index(name, leading, display_order, published_date, id, is_visible):
+    """
+    Partial index over visible videos, ending in the list sort key
+    (display_order, newest first, id).
+
+    SQLite sorts NULLs last in DESC indexes natively and rejects NULLS LAST,
+    so each dialect gets its own variant.
+    """
+    return (
+        Index(
+            name, *leading, display_order, published_date.desc().nulls_last(), id,
+            postgresql_where=is_visible == true(),
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            name, *leading, display_order, published_date.desc(), id,
+            sqlite_where=is_visible == true(),
+        ).ddl_if(dialect="sqlite"),
+    )
 
 
 class Video(Base):
@@ -25,16 +45,33 @@ class Video(Base):
     event_id = Column(Integer, ForeignKey("events.id"), nullable=True)  # Link to event if applicable
 
     # Display settings
-    is_featured = Column(Boolean, default=False, index=True)
-    display_order = Column(Integer, default=0)
-    is_visible = Column(Boolean, default=True, index=True)
+    is_featured = Column(Boolean, default=False)
+    display_order = Column(Integer, default=0, server_default="0", nullable=False)
+    is_visible = Column(Boolean, default=True)
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(Timestamp, server_default=func.now())
+    updated_at = Column(Timestamp, server_default=func.now(), onupdate=func.now(), index=True)
 
     # Relationship
     event = relationship("Event", backref="videos")
 
+    # One index per list query shape in routers/videos.py; all of them are
+    # partial on is_visible and end in the list sort key
+    __table_args__ = (
+        # GET /videos (also keyset pagination)
+        *_visible_index("ix_videos_visible_keyset", (), display_order, published_date, id, is_visible),
+        # GET /videos?featured=..., GET /videos/featured
+        *_visible_index("ix_videos_visible_featured", (is_featured,), display_order, published_date, id, is_visible),
+        # GET /videos?category=...
+        *_visible_index("ix_videos_visible_category", (category,), display_order, published_date, id, is_visible),
+        # GET /videos/by-event/{event_id}
+        Index(
+            "ix_videos_visible_event", event_id, display_order,
+            postgresql_where=is_visible == true(),
+            sqlite_where=is_visible == true(),
+        ),
+    )
+
     def __repr__(self):
         return f"<Video(title='{self.title}', youtube_id='{self.youtube_id}')>"
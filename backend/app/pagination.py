@@ -0,0 +1,141 @@
+"""
+Keyset Pagination
+
+Cursor based pagination helpers for list endpoints.
+
+A cursor is the sort key of the last row of a page, encoded as URL-safe
+base64 JSON. The next page is selected with a WHERE clause that seeks past
+that key instead of OFFSET, so every page costs the same index range scan
+no matter how deep the client has scrolled. The sort key always ends with
+the primary key, which makes the ordering total and stops rows from
+repeating across pages.
+
+Nullable descending keys sort NULLs last on every database.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, false, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One column of a keyset ordering"""
+    column: Any
+    descending: bool = False
+    nullable: bool = False
+
+    def order_by(self):
+        clause = self.column.desc() if self.descending else self.column.asc()
+        return clause.nulls_last() if self.nullable else clause
+
+    def equals(self, value):
+        return self.column.is_(None) if value is None else self.column == value
+
+    def after(self, value):
+        """Rows sorting strictly after value in this column"""
+        if value is None:
+            # NULLs sort last, nothing comes after them
+            return false()
+        seek = self.column < value if self.descending else self.column > value
+        return or_(seek, self.column.is_(None)) if self.nullable else seek
+
+
+def order_clauses(keys: Sequence[SortKey]) -> List:
+    """ORDER BY clauses for a keyset ordering"""
+    return [key.order_by() for key in keys]
+
+
+def seek_condition(keys: Sequence[SortKey], values: Sequence[Any]):
+    """
+    WHERE clause selecting the rows after the given key values.
+
+    Expands the tuple comparison column by column, since the ordering may
+    mix ascending and descending keys. The leading key gets an extra range
+    bound so the database can start the index scan at the cursor.
+    """
+    branches = []
+    for position, key in enumerate(keys):
+        prefix = [keys[i].equals(values[i]) for i in range(position)]
+        branches.append(and_(*prefix, key.after(values[position])))
+
+    leading = keys[0]
+    condition = or_(*branches)
+    if values[0] is not None and not leading.nullable:
+        bound = leading.column <= values[0] if leading.descending else leading.column >= values[0]
+        condition = and_(bound, condition)
+    return condition
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row into an opaque cursor"""
+    payload = [value.isoformat() if isinstance(value, (date, datetime)) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[SortKey]) -> List[Any]:
+    """
+    Decode a cursor back into typed sort key values.
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(keys):
+            raise ValueError("cursor does not match the sort key")
+        return [_parse_value(key, value) for key, value in zip(keys, payload)]
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def _parse_value(key: SortKey, value: Any) -> Any:
+    if value is None:
+        return None
+    python_type = key.column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+async def keyset_page(db: AsyncSession, statement, keys: Sequence[SortKey], cursor: Optional[str], limit: int):
+    """
+    Fetch one page of a select() statement in keyset order.
+
+    Args:
+        db: Async database session
+        statement: Filtered select() without ORDER BY / LIMIT
+        keys: Sort keys, ending with a unique column
+        cursor: Cursor from the previous page, or empty for the first page
+        limit: Page size
+
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page
+    """
+    if limit < 1:
+        return [], None
+    if cursor:
+        statement = statement.where(seek_condition(keys, decode_cursor(cursor, keys)))
+
+    statement = statement.order_by(*order_clauses(keys)).limit(limit + 1)
+    rows = (await db.scalars(statement)).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor([getattr(last, key.column.key) for key in keys])
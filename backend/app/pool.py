@@ -0,0 +1,142 @@
+"""
+Connection Pool
+
+Pool configuration and metrics for the database engine.
+
+The pool is sized from settings (DB_POOL_*), so each uvicorn worker can be
+budgeted against the database's connection limit:
+
+    workers * 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW) <= max_connections - reserved
+
+The sync and async engines each have a pool of that size. Checkout,
+checkin and wait-time counters (shared by both) are exposed on
+GET /internal/db-pool.
+"""
+
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from .config import settings
+
+
+class PoolMetrics:
+    """Thread-safe counters for pool activity"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.connects = 0
+            self.checkouts = 0
+            self.checkins = 0
+            self.invalidations = 0
+            self.waits = 0
+            self.wait_timeouts = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.waits += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if timed_out:
+                self.wait_timeouts += 1
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "waits": self.waits,
+                "wait_timeouts": self.wait_timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+                "wait_seconds_avg": round(self.wait_seconds_total / self.waits, 6) if self.waits else 0.0,
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class _WaitTimingMixin:
+    """Records how long each checkout waited for a connection"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        pool_metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    """QueuePool that records how long each checkout waited for a connection"""
+
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    """Async engine counterpart of InstrumentedQueuePool"""
+
+
+def engine_options(database_url: str, asynchronous: bool = False) -> Dict[str, Any]:
+    """
+    Keyword arguments for create_engine() built from the DB_POOL_* settings.
+
+    Pass asynchronous=True for create_async_engine(). SQLite keeps
+    SQLAlchemy's default pool, which does not take sizing options.
+    """
+    options: Dict[str, Any] = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if make_url(database_url).get_backend_name() == "sqlite":
+        return options
+
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool if asynchronous else InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_use_lifo=settings.DB_POOL_USE_LIFO,
+    )
+    return options
+
+
+def instrument(engine: Engine) -> None:
+    """Attach the metrics listeners to an engine's pool"""
+    event.listen(engine, "connect", lambda *args: pool_metrics.increment("connects"))
+    event.listen(engine, "checkout", lambda *args: pool_metrics.increment("checkouts"))
+    event.listen(engine, "checkin", lambda *args: pool_metrics.increment("checkins"))
+    event.listen(engine, "invalidate", lambda *args: pool_metrics.increment("invalidations"))
+
+
+def pool_status(engine: Engine) -> Dict[str, Any]:
+    """Current pool occupancy plus the cumulative counters"""
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+            max_overflow=pool._max_overflow,
+            timeout_seconds=pool.timeout(),
+        )
+    status["counters"] = pool_metrics.snapshot()
+    return status
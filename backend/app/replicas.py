@@ -0,0 +1,58 @@
+"""
+Read Replicas
+
+Read-your-writes stickiness for replica routing.
+
+When DATABASE_READ_URL is set, the async sessions behind the public GET
+endpoints read from a replica (see RoutingSession in database.py). A
+replica may lag behind the primary, so a client that just wrote would not
+see its own change. After every successful write request the response
+sets a short-lived cookie; while it is present, that client's reads go
+to the primary:
+
+    POST /api/videos        -> 200, Set-Cookie: db_read_primary=1; Max-Age=10
+    GET  /api/videos/42     -> read from the primary
+    (10 seconds later)
+    GET  /api/videos/42     -> read from a replica
+
+The frontend calls the API cross-site (Vercel -> Render), so the cookie is
+SameSite=None; Secure and the frontend sends credentials (withCredentials),
+which CORS allows for the ALLOWED_ORIGINS.
+"""
+
+from fastapi import Request
+
+from .config import settings
+
+# Cookie marking a client that wrote within DB_READ_STICKY_SECONDS
+STICKY_COOKIE = "db_read_primary"
+
+# Session.info key telling RoutingSession to stay on the primary
+USE_PRIMARY = "use_primary"
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def reads_from_primary(request: Request) -> bool:
+    """Whether this request must read from the primary to see its own writes"""
+    return STICKY_COOKIE in request.cookies
+
+
+async def sticky_reads_middleware(request: Request, call_next):
+    """Mark clients that just wrote so their next reads go to the primary"""
+    response = await call_next(request)
+    if (
+        settings.database_read_urls
+        and request.method not in SAFE_METHODS
+        and response.status_code < 400
+    ):
+        response.set_cookie(
+            STICKY_COOKIE,
+            "1",
+            max_age=settings.DB_READ_STICKY_SECONDS,
+            httponly=True,
+            # Sent back on cross-site requests from the frontend
+            samesite="none",
+            secure=True,
+        )
+    return response
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
-from ..database import get_db
+from ..cache import cached, invalidate
+from ..conditional import conditional
+from ..database import get_async_db, get_db
 from ..models.bio import Bio
 from ..schemas.bio import BioSchema, BioCreate, BioUpdate
 
@@ -9,12 +13,14 @@ router = APIRouter()
 
 
 @router.get("/bio", response_model=BioSchema)
-def get_bio(db: Session = Depends(get_db)):
+@conditional("bio", Bio)
+@cached("bio", BioSchema)
+async def get_bio(db: AsyncSession = Depends(get_async_db)):
     """
     Get the biography information.
     Returns the first (and typically only) bio entry.
     """
-    bio = db.query(Bio).first()
+    bio = (await db.scalars(select(Bio).limit(1))).first()
     if not bio:
         raise HTTPException(status_code=404, detail="Biography not found")
     return bio
@@ -38,6 +44,7 @@ def create_bio(bio: BioCreate, db: Session = Depends(get_db)):
     db.add(db_bio)
     db.commit()
     db.refresh(db_bio)
+    invalidate("bio", db_bio.id)
     return db_bio
 
 
@@ -58,6 +65,7 @@ def update_bio(bio_update: BioUpdate, db: Session = Depends(get_db)):
 
     db.commit()
     db.refresh(bio)
+    invalidate("bio", bio.id)
     return bio
 
 
@@ -73,4 +81,5 @@ def delete_bio(bio_id: int, db: Session = Depends(get_db)):
 
     db.delete(bio)
     db.commit()
+    invalidate("bio", bio_id)
     return {"message": "Biography deleted successfully"}
@@ -0,0 +1,81 @@
+"""
+Chat API Router
+
+Chatbot replies streamed as Server-Sent Events.
+"""
+
+import json
+import logging
+from typing import Any, AsyncIterator, Dict
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import get_async_db
+from ..schemas.chat import ChatRequest
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    """One Server-Sent Event; data is JSON, so newlines in text are safe"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def single_reply(text: str) -> AsyncIterator[str]:
+    """A complete reply, as a stream of one chunk"""
+    yield text
+
+
+@router.post("/chat/stream")
+async def chat_stream(request: ChatRequest, db: AsyncSession = Depends(get_async_db)):
+    """
+    Answer a visitor's chat message, streaming the reply as it is generated.
+
+    Body:
+    - message: The visitor's message
+    - conversation_history: Earlier messages, [{"role": "user"|"assistant", "content": "..."}]
+
+    Returns a text/event-stream of `token` events ({"text": "..."}) ending
+    in `done` ({}), or in `error` ({"detail": "..."}) if the provider fails.
+
+    Frequent questions (next events, contact details, ensemble members)
+    are answered from the database by template in a single `token` event,
+    without a model call; see chatbot.quick_answer.
+
+    Each chunk is requested from the provider only after the previous one
+    was sent, so a slow client slows generation instead of buffering it;
+    when the client disconnects, the provider stream is closed.
+    """
+    # AI modules (and provider SDKs) stay out of the worker's startup imports
+    from ..ai.chatbot import get_context_from_db, quick_answer, stream_message
+
+    # Read before streaming: the session is released when this returns,
+    # not held for the whole generation
+    history = [message.model_dump() for message in request.conversation_history]
+    answer = await quick_answer(request.message, db)
+    if answer is None:
+        context = await get_context_from_db(db, request.message, history)
+        replies = stream_message(request.message, history, context)
+    else:
+        replies = single_reply(answer)
+
+    async def events():
+        try:
+            async for text in replies:
+                yield sse_event("token", {"text": text})
+        except Exception:
+            logger.exception("Chat stream failed")
+            yield sse_event("error", {"detail": "The assistant is unavailable, please try again later"})
+            return
+        yield sse_event("done", {})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # No caching, and no buffering by reverse proxies (nginx)
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
-from ..database import get_db
+from ..cache import cached, invalidate
+from ..conditional import conditional
+from ..database import get_async_db, get_db
 from ..models.ensemble import Ensemble
 from ..schemas.ensemble import EnsembleSchema, EnsembleCreate, EnsembleUpdate
 
@@ -9,32 +13,38 @@ router = APIRouter()
 
 
 @router.get("/ensembles", response_model=List[EnsembleSchema])
-def get_ensembles(db: Session = Depends(get_db)):
+@conditional("ensembles", Ensemble)
+@cached("ensembles", EnsembleSchema, serialized=True)
+async def get_ensembles(db: AsyncSession = Depends(get_async_db)):
     """
     Get all ensembles.
     """
-    ensembles = db.query(Ensemble).all()
+    ensembles = (await db.scalars(select(Ensemble))).all()
     return ensembles
 
 
 @router.get("/ensemble", response_model=EnsembleSchema)
-def get_main_ensemble(db: Session = Depends(get_db)):
+@conditional("ensembles", Ensemble)
+@cached("ensembles", EnsembleSchema)
+async def get_main_ensemble(db: AsyncSession = Depends(get_async_db)):
     """
     Get the main ensemble (Ogaro Ensemble).
     Returns the first ensemble entry.
     """
-    ensemble = db.query(Ensemble).first()
+    ensemble = (await db.scalars(select(Ensemble).limit(1))).first()
     if not ensemble:
         raise HTTPException(status_code=404, detail="Ensemble not found")
     return ensemble
 
 
 @router.get("/ensembles/{ensemble_id}", response_model=EnsembleSchema)
-def get_ensemble_by_id(ensemble_id: int, db: Session = Depends(get_db)):
+@conditional("ensembles", Ensemble)
+@cached("ensembles", EnsembleSchema, id_param="ensemble_id")
+async def get_ensemble_by_id(ensemble_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Get a specific ensemble by ID.
     """
-    ensemble = db.query(Ensemble).filter(Ensemble.id == ensemble_id).first()
+    ensemble = await db.get(Ensemble, ensemble_id)
     if not ensemble:
         raise HTTPException(status_code=404, detail="Ensemble not found")
     return ensemble
@@ -58,6 +68,7 @@ def create_ensemble(ensemble: EnsembleCreate, db: Session = Depends(get_db)):
     db.add(db_ensemble)
     db.commit()
     db.refresh(db_ensemble)
+    invalidate("ensembles", db_ensemble.id)
     return db_ensemble
 
 
@@ -81,6 +92,7 @@ def update_main_ensemble(
 
     db.commit()
     db.refresh(ensemble)
+    invalidate("ensembles", ensemble.id)
     return ensemble
 
 
@@ -105,6 +117,7 @@ def update_ensemble(
 
     db.commit()
     db.refresh(ensemble)
+    invalidate("ensembles", ensemble.id)
     return ensemble
 
 
@@ -120,4 +133,5 @@ def delete_ensemble(ensemble_id: int, db: Session = Depends(get_db)):
 
     db.delete(ensemble)
     db.commit()
+    invalidate("ensembles", ensemble_id)
     return {"message": "Ensemble deleted successfully"}
@@ -1,18 +1,26 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from datetime import date
-from ..database import get_db
+from ..bulk import bulk_create, check_batch_size
+from ..cache import cached, invalidate
+from ..conditional import conditional
+from ..database import get_async_db, get_db
 from ..models.event import Event
-from ..schemas.event import EventSchema, EventCreate, EventUpdate
+from ..scheduler import local_today, refresh_daily_views, start_of_today
+from ..schemas.bulk import BulkResult
+from ..schemas.event import EventSchema, EventCreate, EventUpdate, EventRecommendation
 
 router = APIRouter()
 
 
 @router.get("/events", response_model=List[EventSchema])
-def get_events(
+@conditional("events", Event, vary=start_of_today)
+@cached("events", EventSchema, serialized=True, vary=start_of_today)
+async def get_events(
     filter_type: Optional[str] = Query(None, description="Filter: 'upcoming', 'past', or 'all'"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all events with optional filtering.
@@ -20,28 +28,63 @@ def get_events(
     Parameters:
     - filter_type: 'upcoming' (default), 'past', or 'all'
 
-    Returns events sorted by date (ascending for upcoming, descending for past)
+    Returns events sorted by date (ascending for upcoming, descending for past).
+    Events dated before today (Europe/Berlin) are past.
     """
-    query = db.query(Event)
+    query = select(Event)
+    today = local_today()
 
     # Apply filter
     if filter_type == "past":
-        query = query.filter(Event.is_past == True).order_by(Event.date.desc())
+        query = query.where(Event.date < today).order_by(Event.date.desc())
     elif filter_type == "all":
         query = query.order_by(Event.date.asc())
     else:  # 'upcoming' or None (default)
-        query = query.filter(Event.is_past == False).order_by(Event.date.asc())
+        query = query.where(Event.date >= today).order_by(Event.date.asc())
 
-    events = query.all()
+    events = (await db.scalars(query)).all()
     return events
 
 
+@router.get("/events/recommended", response_model=List[EventRecommendation])
+@conditional("events", Event, vary=start_of_today)
+@cached("events", EventRecommendation, serialized=True, vary=start_of_today)
+async def get_recommended_events(
+    interest: str = Query(..., min_length=1, max_length=200, description="Interest, e.g. 'oud concert'"),
+    limit: int = Query(5, ge=1, le=20, description="Limit number of events"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Recommend upcoming events matching an interest.
+
+    Parameters:
+    - interest: Free text in German, English or Arabic (e.g., "oud music",
+      "Kinderkonzert", "children's concerts")
+    - limit: Maximum number of events to return (default: 5, max: 20)
+
+    Events are ranked by TF-IDF similarity of their title, description,
+    event type and ensemble to the interest; events matching no word are
+    not returned. Returns [{"event": {...}, "match_score": 0..1}], best
+    match first.
+    """
+    # NumPy stays out of the worker's startup imports
+    from ..ai.recommendations import recommend_events_based_on_interest
+
+    matches = await recommend_events_based_on_interest(interest, db, limit=limit)
+    return [
+        EventRecommendation(event=EventSchema.model_validate(match["event"]), match_score=match["match_score"])
+        for match in matches
+    ]
+
+
 @router.get("/events/{event_id}", response_model=EventSchema)
-def get_event(event_id: int, db: Session = Depends(get_db)):
+@conditional("events", Event, vary=start_of_today)
+@cached("events", EventSchema, id_param="event_id", vary=start_of_today)
+async def get_event(event_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Get a specific event by ID.
     """
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = await db.get(Event, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     return event
@@ -57,9 +100,25 @@ def create_event(event: EventCreate, db: Session = Depends(get_db)):
     db.add(db_event)
     db.commit()
     db.refresh(db_event)
+    invalidate("events", db_event.id)
     return db_event
 
 
+@router.post("/events/bulk", response_model=BulkResult)
+def create_events(events: List[EventCreate], db: Session = Depends(get_db)):
+    """
+    Create many events at once, e.g. a whole season.
+    (Future admin feature)
+
+    Inserts the batch with one multi-row statement in a single transaction.
+    Returns one result per event, in request order.
+    """
+    check_batch_size(events)
+    result = bulk_create(db, Event, [event.model_dump() for event in events])
+    invalidate("events", *result.ids())
+    return result
+
+
 @router.put("/events/{event_id}", response_model=EventSchema)
 def update_event(
     event_id: int,
@@ -81,6 +140,7 @@ def update_event(
 
     db.commit()
     db.refresh(event)
+    invalidate("events", event.id)
     return event
 
 
@@ -94,35 +154,28 @@ def delete_event(event_id: int, db: Session = Depends(get_db)):
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
+    # The delete unlinks the event's videos (event_id is set to NULL)
+    video_ids = [video.id for video in event.videos]
     db.delete(event)
     db.commit()
+    invalidate("events", event_id)
+    if video_ids:
+        invalidate("videos", *video_ids)
     return {"message": "Event deleted successfully"}
 
 
 @router.post("/events/update-past-status")
-def update_past_events_status(db: Session = Depends(get_db)):
+def update_past_events_status():
     """
-    Update is_past status for all events based on current date.
-    (Utility endpoint - can be called periodically or via cron)
-    """
-    today = date.today()
-
-    # Mark past events
-    past_count = db.query(Event).filter(
-        Event.date < today,
-        Event.is_past == False
-    ).update({"is_past": True})
-
-    # Mark upcoming events (in case dates were updated)
-    upcoming_count = db.query(Event).filter(
-        Event.date >= today,
-        Event.is_past == True
-    ).update({"is_past": False})
+    Refresh cached event views for the current date.
 
-    db.commit()
+    is_past is derived from the event date, so there is nothing to update;
+    kept for existing cron jobs. Enable MIDNIGHT_REFRESH_ENABLED to do this
+    in-process at midnight instead.
+    """
+    refresh_daily_views()
 
     return {
-        "message": "Event statuses updated",
-        "marked_as_past": past_count,
-        "marked_as_upcoming": upcoming_count
+        "message": "Event views refreshed",
+        "today": local_today().isoformat(),
     }
@@ -0,0 +1,80 @@
+"""
+Home API Router
+
+Aggregate endpoint for the homepage: bio, featured videos and playlists,
+upcoming events and the main ensemble in one request.
+"""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..cache import cached
+from ..conditional import conditional_on
+from ..database import get_async_db
+from ..models.bio import Bio
+from ..models.ensemble import Ensemble
+from ..models.event import Event
+from ..models.playlist import Playlist
+from ..models.video import Video
+from ..scheduler import local_today, start_of_today
+from ..schemas.home import HomeSchema
+
+router = APIRouter()
+
+# Every table the homepage reads; a write to any of them rebuilds it
+HOME_SOURCES = {
+    "bio": Bio,
+    "videos": Video,
+    "playlists": Playlist,
+    "events": Event,
+    "ensembles": Ensemble,
+}
+
+# Items per homepage section
+HOME_SECTION_LIMIT = 3
+
+
+@router.get("/home", response_model=HomeSchema)
+@conditional_on(HOME_SOURCES, vary=start_of_today)
+@cached(list(HOME_SOURCES), HomeSchema, serialized=True, vary=start_of_today)
+async def get_home(db: AsyncSession = Depends(get_async_db)):
+    """
+    Get everything the homepage shows in one response.
+
+    Returns the bio, featured videos and playlists, the next upcoming
+    events and the main ensemble. The JSON is built once and served from
+    the cache until one of the underlying tables changes.
+    """
+    bio = (await db.scalars(select(Bio).limit(1))).first()
+
+    featured_videos = (await db.scalars(
+        select(Video)
+        .where(Video.is_featured == True, Video.is_visible == True)
+        .order_by(Video.display_order.asc())
+        .limit(HOME_SECTION_LIMIT)
+    )).all()
+
+    featured_playlists = (await db.scalars(
+        select(Playlist)
+        .where(Playlist.is_visible == True, Playlist.is_featured == True)
+        .order_by(Playlist.display_order, Playlist.created_at.desc())
+        .limit(HOME_SECTION_LIMIT)
+    )).all()
+
+    upcoming_events = (await db.scalars(
+        select(Event)
+        .where(Event.date >= local_today())
+        .order_by(Event.date.asc())
+        .limit(HOME_SECTION_LIMIT)
+    )).all()
+
+    ensemble = (await db.scalars(select(Ensemble).limit(1))).first()
+
+    return HomeSchema.model_validate({
+        "bio": bio,
+        "featured_videos": featured_videos,
+        "featured_playlists": featured_playlists,
+        "upcoming_events": upcoming_events,
+        "ensemble": ensemble,
+    }, from_attributes=True)
@@ -0,0 +1,83 @@
+"""
+Internal API Router
+
+Operational endpoints that are not part of the public API. Requests must
+send INTERNAL_API_TOKEN as X-Internal-Token; without a configured token the
+endpoints only exist in DEBUG mode (404 otherwise).
+"""
+
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from ..config import settings
+from ..database import async_engine, engine, read_engines
+from ..pool import pool_status
+from ..timing import startup_timings
+
+
+def require_internal_token(x_internal_token: Optional[str] = Header(None)):
+    """Reject requests without the configured internal token"""
+    if not settings.INTERNAL_API_TOKEN:
+        # Deny by default: a deployment without a token exposes nothing
+        if not settings.DEBUG:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+        return
+    if not secrets.compare_digest(
+        x_internal_token or "", settings.INTERNAL_API_TOKEN
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid internal token",
+        )
+
+
+router = APIRouter(dependencies=[Depends(require_internal_token)])
+
+
+@router.get("/internal/db-pool")
+def get_db_pool_status():
+    """
+    Get connection pool occupancy and counters.
+
+    Returns:
+        Pool size, checked out/in connections, overflow and cumulative
+        connect/checkout/checkin/wait-time counters for this worker, plus
+        the occupancy of the async (read) engine's pool under "async" and
+        of each read replica's pool under "replicas"
+    """
+    status = pool_status(engine)
+    status["async"] = pool_status(async_engine.sync_engine)
+    status["async"].pop("counters")
+    status["replicas"] = []
+    for read_engine in read_engines:
+        replica = pool_status(read_engine.sync_engine)
+        replica.pop("counters")
+        status["replicas"].append(replica)
+    return status
+
+
+@router.get("/internal/startup")
+def get_startup_timings():
+    """
+    Get this worker's cold start breakdown.
+
+    Returns:
+        Milliseconds spent per startup phase (imports, router registration,
+        migrations, seeding, readiness check) and their total
+    """
+    return startup_timings.report()
+
+
+@router.get("/internal/chat-cache")
+def get_chat_cache_stats():
+    """
+    Get this worker's chat answer cache counters.
+
+    Returns:
+        Cached answers and the hits and misses of opening questions
+    """
+    # Keeps the AI modules out of startup imports
+    from ..ai.answer_cache import answer_cache
+    return answer_cache.stats()
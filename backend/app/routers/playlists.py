@@ -4,25 +4,41 @@ Playlists API Router
 API endpoints for managing YouTube playlists.
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, select
 
-from ..database import get_db
+from ..bulk import bulk_create, check_batch_size, upsert_row
+from ..cache import cached, invalidate
+from ..conditional import conditional
+from ..database import get_async_db, get_db
 from ..models.playlist import Playlist
-from ..schemas.playlist import PlaylistSchema, PlaylistCreate, PlaylistUpdate
+from ..pagination import SortKey, keyset_page, order_clauses
+from ..schemas.bulk import BulkResult
+from ..schemas.playlist import PlaylistSchema, PlaylistCreate, PlaylistUpdate, PlaylistUpsert, PlaylistPage
 
 
 router = APIRouter()
 
+# Total ordering for playlist lists: display_order, newest first, then id
+PLAYLIST_SORT_KEYS = [
+    SortKey(Playlist.display_order),
+    SortKey(Playlist.created_at, descending=True),
+    SortKey(Playlist.id),
+]
 
-@router.get("/playlists", response_model=List[PlaylistSchema])
-def get_playlists(
+
+@router.get("/playlists", response_model=Union[List[PlaylistSchema], PlaylistPage])
+@conditional("playlists", Playlist)
+@cached("playlists", PlaylistSchema, serialized=True)
+async def get_playlists(
     featured: Optional[bool] = None,
-    limit: int = 20,
-    offset: int = 0,
-    db: Session = Depends(get_db),
+    limit: int = Query(20, ge=1, le=100, description="Limit number of results"),
+    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get all visible playlists with optional filtering.
@@ -31,30 +47,40 @@ def get_playlists(
         featured: Filter by featured playlists (optional)
         limit: Maximum number of playlists to return (default: 20)
         offset: Number of playlists to skip (default: 0)
+        cursor: Opt-in keyset pagination cursor. Pass an empty cursor for the
+            first page, then the returned next_cursor. Offset is ignored.
         db: Database session
 
     Returns:
-        List of playlists
+        List of playlists, or a page with items and next_cursor in cursor mode
     """
-    query = db.query(Playlist).filter(Playlist.is_visible == True)
+    query = select(Playlist).where(Playlist.is_visible == True)
 
     if featured is not None:
-        query = query.filter(Playlist.is_featured == featured)
+        query = query.where(Playlist.is_featured == featured)
+
+    if cursor is not None:
+        playlists, next_cursor = await keyset_page(db, query, PLAYLIST_SORT_KEYS, cursor, limit)
+        return PlaylistPage(
+            items=[PlaylistSchema.model_validate(playlist) for playlist in playlists],
+            next_cursor=next_cursor,
+        )
 
-    playlists = (
-        query.order_by(Playlist.display_order, desc(Playlist.created_at))
+    playlists = (await db.scalars(
+        query.order_by(*order_clauses(PLAYLIST_SORT_KEYS))
         .offset(offset)
         .limit(limit)
-        .all()
-    )
+    )).all()
 
     return playlists
 
 
 @router.get("/playlists/featured", response_model=List[PlaylistSchema])
-def get_featured_playlists(
-    limit: int = 3,
-    db: Session = Depends(get_db),
+@conditional("playlists", Playlist)
+@cached("playlists", PlaylistSchema, serialized=True)
+async def get_featured_playlists(
+    limit: int = Query(3, ge=1, le=100, description="Limit number of featured playlists"),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get featured playlists for homepage/highlights.
@@ -66,21 +92,22 @@ def get_featured_playlists(
     Returns:
         List of featured playlists
     """
-    playlists = (
-        db.query(Playlist)
-        .filter(Playlist.is_visible == True, Playlist.is_featured == True)
+    playlists = (await db.scalars(
+        select(Playlist)
+        .where(Playlist.is_visible == True, Playlist.is_featured == True)
         .order_by(Playlist.display_order, desc(Playlist.created_at))
         .limit(limit)
-        .all()
-    )
+    )).all()
 
     return playlists
 
 
 @router.get("/playlists/{playlist_id}", response_model=PlaylistSchema)
-def get_playlist(
+@conditional("playlists", Playlist)
+@cached("playlists", PlaylistSchema, id_param="playlist_id")
+async def get_playlist(
     playlist_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get a single playlist by ID.
@@ -95,11 +122,10 @@ def get_playlist(
     Raises:
         HTTPException: If playlist not found
     """
-    playlist = (
-        db.query(Playlist)
-        .filter(Playlist.id == playlist_id, Playlist.is_visible == True)
-        .first()
-    )
+    playlist = (await db.scalars(
+        select(Playlist)
+        .where(Playlist.id == playlist_id, Playlist.is_visible == True)
+    )).first()
 
     if not playlist:
         raise HTTPException(
@@ -144,6 +170,85 @@ def create_playlist(
     db.add(db_playlist)
     db.commit()
     db.refresh(db_playlist)
+    invalidate("playlists", db_playlist.id)
+
+    return db_playlist
+
+
+@router.post("/admin/playlists/bulk", response_model=BulkResult)
+def create_playlists(
+    playlists: List[PlaylistCreate],
+    upsert: bool = False,
+    db: Session = Depends(get_db),
+):
+    """
+    Create many playlists at once (admin only).
+
+    Args:
+        playlists: Playlist data, up to BULK_MAX_ITEMS items
+        upsert: Update playlists whose playlist_id already exists instead of
+            reporting them as conflicts
+        db: Database session
+
+    Returns:
+        One result per playlist, in request order
+
+    Raises:
+        HTTPException: If the batch is empty or too large, or conflicts with
+            a concurrent write
+    """
+    check_batch_size(playlists)
+    result = bulk_create(
+        db,
+        Playlist,
+        [playlist.model_dump() for playlist in playlists],
+        key=Playlist.playlist_id,
+        upsert=upsert,
+    )
+    invalidate("playlists", *result.ids())
+
+    return result
+
+
+@router.put("/admin/playlists/by-playlist-id/{youtube_playlist_id}", response_model=PlaylistSchema)
+def upsert_playlist(
+    youtube_playlist_id: str,
+    playlist: PlaylistUpsert,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    """
+    Create or replace a playlist by its YouTube playlist_id (admin only).
+
+    Idempotent and atomic: a single INSERT ... ON CONFLICT statement on the
+    unique playlist_id index.
+
+    Args:
+        youtube_playlist_id: YouTube playlist ID
+        playlist: Playlist data
+        response: Response, status 201 if created and 200 if updated
+        db: Database session
+
+    Returns:
+        Stored playlist
+
+    Raises:
+        HTTPException: If the body's playlist_id does not match the URL
+    """
+    if playlist.playlist_id is not None and playlist.playlist_id != youtube_playlist_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="playlist_id in body does not match the URL",
+        )
+
+    db_playlist, created = upsert_row(
+        db,
+        Playlist,
+        Playlist.playlist_id,
+        {**playlist.model_dump(), "playlist_id": youtube_playlist_id},
+    )
+    invalidate("playlists", db_playlist.id)
+    response.status_code = status.HTTP_201_CREATED if created else status.HTTP_200_OK
 
     return db_playlist
 
@@ -182,6 +287,7 @@ def update_playlist(
 
     db.commit()
     db.refresh(db_playlist)
+    invalidate("playlists", db_playlist.id)
 
     return db_playlist
 
@@ -211,5 +317,6 @@ def delete_playlist(
 
     db.delete(db_playlist)
     db.commit()
+    invalidate("playlists", playlist_id)
 
     return None
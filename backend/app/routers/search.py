@@ -0,0 +1,92 @@
+"""
+Search API Router
+
+Ranked full-text search across videos, events, playlists and ensembles.
+"""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..cache import cached
+from ..conditional import conditional_on
+from ..database import get_async_db
+from ..models.ensemble import Ensemble
+from ..models.event import Event
+from ..models.playlist import Playlist
+from ..models.video import Video
+from ..schemas.search import SearchResults, Suggestions
+from ..search import SEARCH_TYPES, search
+from ..suggest import SUGGEST_TYPES, suggest_index
+
+router = APIRouter()
+
+# Every table search reads; a write to any of them drops cached results
+SEARCH_TABLES = {
+    "videos": Video,
+    "events": Event,
+    "playlists": Playlist,
+    "ensembles": Ensemble,
+}
+
+
+@router.get("/search/suggest", response_model=Suggestions)
+async def get_suggestions(
+    q: str = Query(..., min_length=1, max_length=100, description="Partial query as typed"),
+    types: Optional[List[str]] = Query(None, alias="type", description="Suggestion types to include (repeatable)"),
+    limit: int = Query(8, ge=1, le=20, description="Maximum number of suggestions"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Suggest video, event and playlist titles while the visitor types.
+
+    Parameters:
+    - q: The query typed so far; every word must start a title word, the
+      last one may be incomplete. Falls back to fuzzy (trigram) matches.
+    - type: Only suggest these types: video, event, playlist
+    - limit: Maximum number of suggestions (default: 8, max: 20)
+
+    Served from an in-memory index; the database is only read when rows
+    changed since the last request.
+    """
+    unknown = set(types or []) - set(SUGGEST_TYPES)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown suggestion types: {', '.join(sorted(unknown))}",
+        )
+
+    await suggest_index.refresh(db)
+    return Suggestions(query=q, suggestions=suggest_index.suggest(q, limit=limit, types=types))
+
+
+@router.get("/search", response_model=SearchResults)
+@conditional_on(SEARCH_TABLES)
+@cached(list(SEARCH_TABLES), SearchResults, serialized=True)
+async def get_search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search query"),
+    types: Optional[List[str]] = Query(None, alias="type", description="Result types to include (repeatable)"),
+    limit: int = Query(20, ge=1, le=50, description="Maximum number of results"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Search videos, events, playlists and ensembles.
+
+    Parameters:
+    - q: Search words in German, English or Arabic; on PostgreSQL
+      "quoted phrases", or and -exclusions are supported
+    - type: Only return these result types: video, event, playlist, ensemble
+    - limit: Maximum number of results (default: 20, max: 50)
+
+    Returns results ranked best first, each with its type, id, title and an
+    HTML snippet with the matched words wrapped in <mark>.
+    """
+    unknown = set(types or []) - set(SEARCH_TYPES)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown result types: {', '.join(sorted(unknown))}",
+        )
+
+    return SearchResults(query=q, results=await search(db, q, types=types, limit=limit))
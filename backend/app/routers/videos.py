@@ -1,20 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from ..database import get_db
+from typing import List, Optional, Union
+from ..bulk import bulk_create, check_batch_size, upsert_row
+from ..cache import cached, invalidate
+from ..conditional import conditional
+from ..database import get_async_db, get_db
+from ..facets import video_facets
 from ..models.video import Video
-from ..schemas.video import VideoSchema, VideoCreate, VideoUpdate
+from ..pagination import SortKey, keyset_page, order_clauses
+from ..schemas.bulk import BulkResult
+from ..schemas.video import VideoSchema, VideoCreate, VideoUpdate, VideoUpsert, VideoPage, VideoFacets
 
 router = APIRouter()
 
+# Total ordering for video lists: display_order, newest first, then id
+VIDEO_SORT_KEYS = [
+    SortKey(Video.display_order),
+    SortKey(Video.published_date, descending=True, nullable=True),
+    SortKey(Video.id),
+]
 
-@router.get("/videos", response_model=List[VideoSchema])
-def get_videos(
+
+@router.get("/videos", response_model=Union[List[VideoSchema], VideoPage])
+@conditional("videos", Video)
+@cached("videos", VideoSchema, serialized=True)
+async def get_videos(
     category: Optional[str] = Query(None, description="Filter by category"),
     featured: Optional[bool] = Query(None, description="Filter featured videos"),
     limit: int = Query(20, ge=1, le=100, description="Limit number of results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Keyset cursor; pass an empty value for the first page"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all visible videos with optional filtering.
@@ -24,30 +42,42 @@ def get_videos(
     - featured: True/False to filter featured videos
     - limit: Maximum number of videos to return (default: 20, max: 100)
     - offset: Number of videos to skip for pagination
+    - cursor: Opt-in keyset pagination. Pass an empty cursor for the first page,
+      then the returned next_cursor. Offset is ignored in this mode.
 
-    Returns videos sorted by display_order, then by published_date (newest first)
+    Returns videos sorted by display_order, then by published_date (newest first).
+    In cursor mode the response is {"items": [...], "next_cursor": "..."}.
     """
-    query = db.query(Video).filter(Video.is_visible == True)
+    query = select(Video).where(Video.is_visible == True)
 
     # Apply filters
     if category:
-        query = query.filter(Video.category == category)
+        query = query.where(Video.category == category)
 
     if featured is not None:
-        query = query.filter(Video.is_featured == featured)
+        query = query.where(Video.is_featured == featured)
+
+    if cursor is not None:
+        videos, next_cursor = await keyset_page(db, query, VIDEO_SORT_KEYS, cursor, limit)
+        return VideoPage(
+            items=[VideoSchema.model_validate(video) for video in videos],
+            next_cursor=next_cursor,
+        )
 
     # Order by display_order (ascending) then by published_date (descending)
-    query = query.order_by(Video.display_order.asc(), Video.published_date.desc())
+    query = query.order_by(*order_clauses(VIDEO_SORT_KEYS))
 
     # Apply pagination
-    videos = query.offset(offset).limit(limit).all()
+    videos = (await db.scalars(query.offset(offset).limit(limit))).all()
     return videos
 
 
 @router.get("/videos/featured", response_model=List[VideoSchema])
-def get_featured_videos(
+@conditional("videos", Video)
+@cached("videos", VideoSchema, serialized=True)
+async def get_featured_videos(
     limit: int = Query(3, ge=1, le=20, description="Limit number of featured videos"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get featured videos for homepage display.
@@ -57,23 +87,41 @@ def get_featured_videos(
 
     Returns featured videos sorted by display_order
     """
-    videos = db.query(Video).filter(
+    videos = (await db.scalars(select(Video).where(
         Video.is_featured == True,
         Video.is_visible == True
-    ).order_by(Video.display_order.asc()).limit(limit).all()
+    ).order_by(Video.display_order.asc()).limit(limit))).all()
 
     return videos
 
 
+@router.get("/videos/facets", response_model=VideoFacets)
+async def get_video_facets(db: AsyncSession = Depends(get_async_db)):
+    """
+    Get counts of visible videos by category, published year and event.
+
+    Returns {"total": n, "category": [...], "year": [...], "event": [...]},
+    each a list of {"value": ..., "count": n}: categories and events by
+    count, years newest first, and videos without the value (null) last.
+
+    Served from a summary kept in memory and updated on writes; the videos
+    table is only read for rows changed since the last request.
+    """
+    await video_facets.refresh(db)
+    return video_facets.facets()
+
+
 @router.get("/videos/{video_id}", response_model=VideoSchema)
-def get_video(video_id: int, db: Session = Depends(get_db)):
+@conditional("videos", Video)
+@cached("videos", VideoSchema, id_param="video_id")
+async def get_video(video_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Get a specific video by ID.
     """
-    video = db.query(Video).filter(
+    video = (await db.scalars(select(Video).where(
         Video.id == video_id,
         Video.is_visible == True
-    ).first()
+    ))).first()
 
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
@@ -81,8 +129,50 @@ def get_video(video_id: int, db: Session = Depends(get_db)):
     return video
 
 
+@router.get("/videos/{video_id}/related", response_model=List[VideoSchema])
+@conditional("videos", Video)
+@cached("videos", VideoSchema, serialized=True)
+async def get_related_videos(
+    video_id: int,
+    limit: int = Query(6, ge=1, le=12, description="Limit number of related videos"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get the videos most similar to a video, for a "related videos" rail.
+
+    Parameters:
+    - video_id: ID of the video being watched
+    - limit: Maximum number of videos to return (default: 6, max: 12)
+
+    Similarity compares title, description and category (TF-IDF). The
+    neighbours of every video are precomputed when videos are written; a
+    request looks them up and loads those videos in one query.
+    """
+    # NumPy stays out of the worker's startup imports
+    from ..ai.recommendations import related_video_index
+
+    await related_video_index.refresh(db)
+    if video_id not in related_video_index:
+        # Possibly created by another worker since the last reload
+        related_video_index.mark_dirty("videos", (video_id,))
+        await related_video_index.refresh(db)
+        if video_id not in related_video_index:
+            raise HTTPException(status_code=404, detail="Video not found")
+
+    ids = [related_id for related_id, _ in related_video_index.related(video_id, limit)]
+    if not ids:
+        return []
+    videos = {video.id: video for video in (await db.scalars(select(Video).where(
+        Video.id.in_(ids),
+        Video.is_visible == True
+    )))}
+    return [videos[related_id] for related_id in ids if related_id in videos]
+
+
 @router.get("/videos/by-event/{event_id}", response_model=List[VideoSchema])
-def get_videos_by_event(event_id: int, db: Session = Depends(get_db)):
+@conditional("videos", Video)
+@cached("videos", VideoSchema, serialized=True)
+async def get_videos_by_event(event_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Get all videos linked to a specific event.
 
@@ -91,10 +181,10 @@ def get_videos_by_event(event_id: int, db: Session = Depends(get_db)):
 
     Returns videos linked to the event, sorted by display_order
     """
-    videos = db.query(Video).filter(
+    videos = (await db.scalars(select(Video).where(
         Video.event_id == event_id,
         Video.is_visible == True
-    ).order_by(Video.display_order.asc()).all()
+    ).order_by(Video.display_order.asc()))).all()
 
     return videos
 
@@ -119,6 +209,58 @@ def create_video(video: VideoCreate, db: Session = Depends(get_db)):
     db.add(db_video)
     db.commit()
     db.refresh(db_video)
+    invalidate("videos", db_video.id)
+    return db_video
+
+
+@router.post("/videos/bulk", response_model=BulkResult)
+def create_videos(
+    videos: List[VideoCreate],
+    upsert: bool = Query(False, description="Update videos whose youtube_id already exists"),
+    db: Session = Depends(get_db)
+):
+    """
+    Create many videos at once.
+    (Future admin feature)
+
+    Checks all youtube_ids for duplicates with one query and inserts the batch
+    with one multi-row statement in a single transaction. Videos whose
+    youtube_id exists (or repeats within the batch) are reported as conflicts,
+    or updated in place with upsert=true.
+
+    Returns one result per video, in request order.
+    """
+    check_batch_size(videos)
+    result = bulk_create(
+        db, Video, [video.model_dump() for video in videos], key=Video.youtube_id, upsert=upsert
+    )
+    invalidate("videos", *result.ids())
+    return result
+
+
+@router.put("/videos/by-youtube-id/{youtube_id}", response_model=VideoSchema)
+def upsert_video(
+    youtube_id: str,
+    video: VideoUpsert,
+    response: Response,
+    db: Session = Depends(get_db)
+):
+    """
+    Create or replace a video by its youtube_id.
+    (Future admin feature, e.g. for channel sync jobs)
+
+    Idempotent: a single INSERT ... ON CONFLICT statement, so repeating the
+    request or racing another writer never creates a duplicate.
+    Responds 201 if the video was created, 200 if it was updated.
+    """
+    if video.youtube_id is not None and video.youtube_id != youtube_id:
+        raise HTTPException(status_code=400, detail="youtube_id in body does not match the URL")
+
+    db_video, created = upsert_row(
+        db, Video, Video.youtube_id, {**video.model_dump(), "youtube_id": youtube_id}
+    )
+    invalidate("videos", db_video.id)
+    response.status_code = status.HTTP_201_CREATED if created else status.HTTP_200_OK
     return db_video
 
 
@@ -152,6 +294,7 @@ def update_video(
 
     db.commit()
     db.refresh(video)
+    invalidate("videos", video.id)
     return video
 
 
@@ -167,4 +310,5 @@ def delete_video(video_id: int, db: Session = Depends(get_db)):
 
     db.delete(video)
     db.commit()
+    invalidate("videos", video_id)
     return {"message": "Video deleted successfully"}
@@ -0,0 +1,90 @@
+"""
+Scheduler
+
+Local calendar helpers and the optional midnight refresh job.
+
+Whether an event is past is derived from its date and today's date in
+settings.TIMEZONE, so nothing in the database changes when the day rolls
+over. Cached event views (and the homepage) vary on the local date and miss
+automatically on the first request of a new day; with
+MIDNIGHT_REFRESH_ENABLED the app also drops them right at midnight, so no
+worker keeps yesterday's entries around until they are requested again.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+from .cache import invalidate
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+_task: Optional[asyncio.Task] = None
+
+
+def local_now() -> datetime:
+    """Current time in the site's timezone"""
+    return datetime.now(ZoneInfo(settings.TIMEZONE))
+
+
+def local_today() -> date:
+    """Today's date in the site's timezone; events before it are past"""
+    return local_now().date()
+
+
+def start_of_today() -> datetime:
+    """
+    Local midnight that started today.
+
+    Passed as `vary` to the cache and conditional GET decorators of views
+    showing is_past: it changes at midnight, and is the latest time such a
+    view can change without a write.
+    """
+    now = local_now()
+    return datetime.combine(now.date(), datetime.min.time(), now.tzinfo)
+
+
+def seconds_until_midnight(now: Optional[datetime] = None) -> float:
+    """Seconds from now until the next local midnight"""
+    now = now or local_now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), now.tzinfo)
+    # Subtract in UTC; aware datetimes sharing a tzinfo subtract as wall
+    # clock times, which is off by an hour across DST transitions
+    return (midnight.astimezone(timezone.utc) - now.astimezone(timezone.utc)).total_seconds()
+
+
+def refresh_daily_views() -> None:
+    """Drop cached views that depend on today's date"""
+    invalidate("events")
+
+
+async def _midnight_refresh_loop() -> None:
+    while True:
+        await asyncio.sleep(seconds_until_midnight() + 1)
+        try:
+            refresh_daily_views()
+            logger.info("Refreshed date-dependent views for %s", local_today())
+        except Exception:
+            logger.exception("Midnight refresh failed")
+
+
+def start_scheduler() -> None:
+    """Start the midnight refresh job if enabled (call from app startup)"""
+    global _task
+    if settings.MIDNIGHT_REFRESH_ENABLED and _task is None:
+        _task = asyncio.get_running_loop().create_task(_midnight_refresh_loop())
+
+
+async def stop_scheduler() -> None:
+    """Cancel the midnight refresh job (call from app shutdown)"""
+    global _task
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
@@ -0,0 +1,27 @@
+"""
+Bulk Schemas
+
+Pydantic schemas for the results of the bulk endpoints.
+"""
+
+from typing import List, Literal, Optional
+from pydantic import BaseModel
+
+
+class BulkItemResult(BaseModel):
+    """Outcome for one item of a batch, by its position in the request"""
+
+    index: int
+    id: Optional[int] = None
+    status: Literal["created", "updated", "conflict"]
+    detail: Optional[str] = None
+
+
+class BulkResult(BaseModel):
+    """Per-item outcomes of a batch, in request order"""
+
+    results: List[BulkItemResult]
+
+    def ids(self) -> List[int]:
+        """IDs of the rows written by the batch"""
+        return [result.id for result in self.results if result.id is not None]
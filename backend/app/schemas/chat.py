@@ -0,0 +1,20 @@
+"""
+Chat Schemas
+
+Pydantic schemas for chatbot requests.
+"""
+
+from pydantic import BaseModel, Field
+from typing import List, Literal
+
+
+class ChatMessage(BaseModel):
+    """One earlier message of a chat conversation"""
+    role: Literal["user", "assistant"]
+    content: str = Field(..., min_length=1, max_length=4000)
+
+
+class ChatRequest(BaseModel):
+    """Schema for a visitor's chat message"""
+    message: str = Field(..., min_length=1, max_length=2000)
+    conversation_history: List[ChatMessage] = Field(default_factory=list, max_length=20)
@@ -14,7 +14,6 @@ class EventBase(BaseModel):
     ensemble_name: Optional[str] = Field(None, max_length=255)
     event_type: Optional[str] = Field(None, max_length=100)
     photo_url: Optional[str] = Field(None, max_length=500)
-    is_past: bool = False
 
 
 class EventCreate(EventBase):
@@ -33,14 +32,20 @@ class EventUpdate(BaseModel):
     ensemble_name: Optional[str] = Field(None, max_length=255)
     event_type: Optional[str] = Field(None, max_length=100)
     photo_url: Optional[str] = Field(None, max_length=500)
-    is_past: Optional[bool] = None
 
 
 class EventSchema(EventBase):
     """Schema for returning event data"""
     id: int
+    is_past: bool  # Derived from date, see Event.is_past
     created_at: datetime
     updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True  # Enables ORM mode for SQLAlchemy models
+
+
+class EventRecommendation(BaseModel):
+    """Schema for an event recommended for an interest"""
+    event: EventSchema
+    match_score: float  # 0..1, TF-IDF cosine similarity to the interest
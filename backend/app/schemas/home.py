@@ -0,0 +1,24 @@
+"""
+Home Schemas
+
+Pydantic schema for the homepage aggregate.
+"""
+
+from typing import List, Optional
+from pydantic import BaseModel
+
+from .bio import BioSchema
+from .ensemble import EnsembleSchema
+from .event import EventSchema
+from .playlist import PlaylistSchema
+from .video import VideoSchema
+
+
+class HomeSchema(BaseModel):
+    """Everything the homepage renders, in one response"""
+
+    bio: Optional[BioSchema] = None
+    featured_videos: List[VideoSchema]
+    featured_playlists: List[PlaylistSchema]
+    upcoming_events: List[EventSchema]
+    ensemble: Optional[EnsembleSchema] = None
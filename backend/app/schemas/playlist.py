@@ -5,8 +5,8 @@ Pydantic schemas for YouTube playlist validation and serialization.
 """
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional
+from pydantic import BaseModel, Field, field_validator
 
 
 class PlaylistBase(BaseModel):
@@ -29,6 +29,12 @@ class PlaylistCreate(PlaylistBase):
     pass
 
 
+class PlaylistUpsert(PlaylistBase):
+    """Schema for creating or replacing a playlist by playlist_id (taken from the URL)"""
+
+    playlist_id: Optional[str] = Field(None, min_length=1, max_length=100)
+
+
 class PlaylistUpdate(BaseModel):
     """Schema for updating an existing playlist"""
 
@@ -40,6 +46,14 @@ class PlaylistUpdate(BaseModel):
     display_order: Optional[int] = None
     is_visible: Optional[bool] = None
 
+    @field_validator("display_order")
+    @classmethod
+    def display_order_not_null(cls, value: Optional[int]) -> int:
+        """display_order may be omitted, but not null: it is a sort key"""
+        if value is None:
+            raise ValueError("display_order cannot be null")
+        return value
+
 
 class PlaylistSchema(PlaylistBase):
     """Complete playlist schema with database fields"""
@@ -50,3 +64,10 @@ class PlaylistSchema(PlaylistBase):
 
     class Config:
         from_attributes = True
+
+
+class PlaylistPage(BaseModel):
+    """Page of playlists returned in cursor pagination mode"""
+
+    items: List[PlaylistSchema]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,40 @@
+"""
+Search Schemas
+
+Pydantic schemas for search results.
+"""
+
+from typing import List, Literal
+from pydantic import BaseModel
+
+
+class SearchResult(BaseModel):
+    """One ranked search hit"""
+
+    type: Literal["video", "event", "playlist", "ensemble"]
+    id: int
+    title: str
+    snippet: str  # HTML-escaped text with matches wrapped in <mark>
+    rank: float
+
+
+class SearchResults(BaseModel):
+    """Search hits for a query, best first"""
+
+    query: str
+    results: List[SearchResult]
+
+
+class Suggestion(BaseModel):
+    """A title matching a partial query"""
+
+    type: Literal["video", "event", "playlist"]
+    id: int
+    title: str
+
+
+class Suggestions(BaseModel):
+    """Suggestions for a partial query, best first"""
+
+    query: str
+    suggestions: List[Suggestion]
@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime, date
-from typing import Optional
+from typing import List, Optional, Union
 
 
 class VideoBase(BaseModel):
@@ -24,6 +24,11 @@ class VideoCreate(VideoBase):
     pass
 
 
+class VideoUpsert(VideoBase):
+    """Schema for creating or replacing a video by youtube_id (taken from the URL)"""
+    youtube_id: Optional[str] = Field(None, min_length=1, max_length=50)
+
+
 class VideoUpdate(BaseModel):
     """Schema for updating a video (all fields optional)"""
     title: Optional[str] = Field(None, min_length=1, max_length=500)
@@ -39,6 +44,14 @@ class VideoUpdate(BaseModel):
     display_order: Optional[int] = None
     is_visible: Optional[bool] = None
 
+    @field_validator("display_order")
+    @classmethod
+    def display_order_not_null(cls, value: Optional[int]) -> int:
+        """display_order may be omitted, but not null: it is a sort key"""
+        if value is None:
+            raise ValueError("display_order cannot be null")
+        return value
+
 
 class VideoSchema(VideoBase):
     """Schema for returning video data"""
@@ -48,3 +61,23 @@ class VideoSchema(VideoBase):
 
     class Config:
         from_attributes = True  # Enables ORM mode for SQLAlchemy models
+
+
+class VideoPage(BaseModel):
+    """Schema for a page of videos in cursor pagination mode"""
+    items: List[VideoSchema]
+    next_cursor: Optional[str] = None
+
+
+class FacetCount(BaseModel):
+    """Number of visible videos with one facet value (None: not set)"""
+    value: Union[int, str, None]
+    count: int
+
+
+class VideoFacets(BaseModel):
+    """Schema for video counts by category, published year and linked event"""
+    total: int
+    category: List[FacetCount]
+    year: List[FacetCount]
+    event: List[FacetCount]  # by event_id; None counts videos without an event
@@ -0,0 +1,234 @@
+"""
+Search
+
+Full-text search over videos, events, playlists and ensembles.
+
+On PostgreSQL each searchable table has a generated `search_vector`
+tsvector column with a GIN index (migration 0005); a query is one
+UNION ALL of index lookups ranked with ts_rank. Titles mix German, English
+and Arabic ("Gypsy Dance - رقصة غجرية"), so the vectors use the 'simple'
+text search configuration: it lowercases and splits on word boundaries in
+every script, where a language configuration would stem (and mangle) the
+words of the other two languages.
+
+Elsewhere (SQLite in development and tests) the same query runs as
+case-insensitive LIKE matching with a weighted hit count as the rank.
+
+Snippets are built here from the matched rows' text, HTML-escaped, with
+matched terms wrapped in <mark>...</mark>, so both backends return the same
+shape and the frontend can render them as-is.
+"""
+
+import html
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import and_, case, func, literal, literal_column, or_, select, true, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models.ensemble import Ensemble
+from .models.event import Event
+from .models.playlist import Playlist
+from .models.video import Video
+from .schemas.search import SearchResult
+
+# Text search configuration shared with migration 0005
+SEARCH_CONFIG = "simple"
+
+# Words of context around the first match in a snippet
+SNIPPET_WORDS = 24
+
+# Arabic diacritics (tashkeel) and tatweel, ignored when matching
+_ARABIC_MARKS = re.compile("[\u0640\u064B-\u065F\u0670]")
+
+
+@dataclass
+class SearchSource:
+    """How one table is searched"""
+
+    type: str  # result type, e.g. "video"
+    model: Any
+    # Columns by weight, highest first (tsvector weights A, B, C)
+    weighted: List[List[Any]]
+    # Extra WHERE clause, e.g. only visible rows
+    where: Any = field(default_factory=true)
+
+    @property
+    def title(self):
+        return self.weighted[0][0]
+
+    @property
+    def columns(self):
+        return [column for columns in self.weighted for column in columns]
+
+
+SEARCH_SOURCES = [
+    SearchSource("video", Video, [[Video.title], [Video.category], [Video.description]],
+                 Video.is_visible == True),
+    SearchSource("event", Event, [[Event.title], [Event.venue, Event.location], [Event.description]]),
+    SearchSource("playlist", Playlist, [[Playlist.title], [Playlist.description]],
+                 Playlist.is_visible == True),
+    SearchSource("ensemble", Ensemble, [[Ensemble.name], [Ensemble.description]]),
+]
+
+SEARCH_TYPES = [source.type for source in SEARCH_SOURCES]
+
+# Hit weights of the LIKE fallback, by column weight (cf. ts_rank defaults)
+_FALLBACK_WEIGHTS = [1.0, 0.4, 0.2]
+
+
+def normalize(text: str) -> str:
+    """Case- and mark-insensitive form of text for matching"""
+    return _ARABIC_MARKS.sub("", unicodedata.normalize("NFKC", text)).casefold()
+
+
+def query_terms(q: str) -> List[str]:
+    """Distinct search terms of a query string, normalized"""
+    terms = []
+    for term in re.findall(r"\w+", normalize(q)):
+        if term not in terms:
+            terms.append(term)
+    return terms
+
+
+def highlight(text: Optional[str], terms: Sequence[str], words: int = SNIPPET_WORDS) -> str:
+    """
+    HTML snippet of text around the first matched term.
+
+    The text is escaped; each match of a term at the start of a word is
+    wrapped in <mark>. Long texts are cut to `words` words around the first
+    match, with an ellipsis where cut.
+    """
+    if not text:
+        return ""
+    tokens = text.split()
+    first = next(
+        (index for index, token in enumerate(tokens)
+         if any(normalize(token).lstrip("\"'(«").startswith(term) for term in terms)),
+        0,
+    )
+    start = max(0, min(first - words // 3, len(tokens) - words))
+    excerpt = tokens[start:start + words]
+    parts = [_mark(token, terms) for token in excerpt]
+    prefix = "… " if start > 0 else ""
+    suffix = " …" if start + words < len(tokens) else ""
+    return prefix + " ".join(parts) + suffix
+
+
+def _mark(token: str, terms: Sequence[str]) -> str:
+    normalized = normalize(token)
+    for match in re.finditer(r"\w+", normalized):
+        if any(match.group().startswith(term) for term in terms):
+            # Normalizing keeps word offsets unless it dropped Arabic marks
+            if len(normalized) == len(token):
+                before, word, after = token[:match.start()], token[match.start():match.end()], token[match.end():]
+                return f"{html.escape(before)}<mark>{html.escape(word)}</mark>{html.escape(after)}"
+            return f"<mark>{html.escape(token)}</mark>"
+    return html.escape(token)
+
+
+def _tsvector(source: SearchSource):
+    return literal_column(f"{source.model.__tablename__}.search_vector")
+
+
+def _postgres_query(source: SearchSource, tsquery):
+    vector = _tsvector(source)
+    return (
+        select(
+            literal(source.type).label("type"),
+            source.model.id.label("id"),
+            func.ts_rank(vector, tsquery).label("rank"),
+        )
+        .where(source.where, vector.op("@@")(tsquery))
+    )
+
+
+def _contains(column, term: str):
+    # Terms are \w+ and may contain "_", a LIKE wildcard
+    return func.lower(column).contains(term, autoescape=True)
+
+
+def _fallback_query(source: SearchSource, terms: List[str]):
+    matches = []
+    rank = literal(0.0)
+    for term in terms:
+        matches.append(or_(*(_contains(column, term) for column in source.columns)))
+        for weight, columns in zip(_FALLBACK_WEIGHTS, source.weighted):
+            for column in columns:
+                rank = rank + case((_contains(column, term), weight), else_=0.0)
+    return (
+        select(
+            literal(source.type).label("type"),
+            source.model.id.label("id"),
+            rank.label("rank"),
+        )
+        .where(source.where, and_(*matches))
+    )
+
+
+async def search(
+    db: AsyncSession,
+    q: str,
+    types: Optional[Sequence[str]] = None,
+    limit: int = 20,
+) -> List[SearchResult]:
+    """
+    Rank rows of the requested types against a query.
+
+    Args:
+        db: Async database session
+        q: Query string; on PostgreSQL websearch syntax ("quoted phrase",
+            -exclude, or) applies
+        types: Result types to search (default: all)
+        limit: Maximum number of results
+
+    Returns:
+        Results ordered by rank, best first
+    """
+    terms = query_terms(q)
+    if not terms:
+        return []
+    sources = [source for source in SEARCH_SOURCES if not types or source.type in types]
+
+    if db.get_bind().dialect.name == "postgresql":
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        queries = [_postgres_query(source, tsquery) for source in sources]
+    else:
+        queries = [_fallback_query(source, terms) for source in sources]
+
+    ranked = union_all(*queries).subquery()
+    hits = (await db.execute(
+        select(ranked).order_by(ranked.c.rank.desc(), ranked.c.type, ranked.c.id).limit(limit)
+    )).all()
+
+    # Load the matched rows' text for titles and snippets: one query per type
+    rows: Dict[str, Dict[int, Any]] = {}
+    for source in sources:
+        ids = [hit.id for hit in hits if hit.type == source.type]
+        if ids:
+            result = await db.execute(
+                select(source.model.id, *source.columns).where(source.model.id.in_(ids))
+            )
+            rows[source.type] = {row.id: row for row in result}
+
+    results = []
+    for hit in hits:
+        source = next(source for source in sources if source.type == hit.type)
+        row = rows[hit.type][hit.id]
+        title = getattr(row, source.title.key)
+        # Snippet from the first non-title column mentioning a term, else the title
+        texts = [getattr(row, column.key) for column in source.columns[1:]]
+        text = next(
+            (text for text in texts if text and any(term in normalize(text) for term in terms)),
+            title,
+        )
+        results.append(SearchResult(
+            type=hit.type,
+            id=hit.id,
+            title=title,
+            snippet=highlight(text, terms),
+            rank=round(float(hit.rank), 4),
+        ))
+    return results
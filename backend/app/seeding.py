@@ -0,0 +1,160 @@
+"""
+Seeding
+
+Diff-based seeding by natural key.
+
+Each seed record is fingerprinted (SHA-256 of its normalized values) and
+compared with the fingerprint stored in seed_records when the seeder last
+wrote it. A run applies only the difference, with one bulk statement per
+kind of change:
+
+- new seed records are inserted
+- records whose fingerprint changed overwrite their row
+- rows seeded before but no longer in the seed data are deleted
+
+Unchanged records are not written at all, so re-running the seeder on an
+up-to-date database costs two SELECTs per table. Rows created through the
+API are not in seed_records and are never updated or deleted. A seeded row
+that was deleted through the API stays deleted until its seed record
+changes.
+
+Rows seeded before seed_records existed are adopted by natural key on the
+first run (and overwritten only if they differ from the seed data).
+"""
+
+import hashlib
+import json
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from .models.seed_record import SeedRecord
+
+# Columns managed by the database, not by seed data
+UNSEEDED_COLUMNS = {"id", "created_at", "updated_at"}
+
+
+def seed_columns(model) -> List[str]:
+    """Columns of a model that seed records set"""
+    return [column.key for column in model.__table__.columns if column.key not in UNSEEDED_COLUMNS]
+
+
+def normalize(model, record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    A seed record with every seeded column set.
+
+    Omitted columns take their Python-side default (or None), so a column
+    removed from a seed record is reset on update, and all records of a
+    table share one set of keys for a single executemany.
+    """
+    values = {}
+    for column in model.__table__.columns:
+        if column.key in UNSEEDED_COLUMNS:
+            continue
+        if column.key in record:
+            values[column.key] = record[column.key]
+        elif column.default is not None and column.default.is_scalar:
+            values[column.key] = column.default.arg
+        else:
+            values[column.key] = None
+    unknown = set(record) - set(values)
+    if unknown:
+        raise ValueError(f"Unknown {model.__tablename__} columns in seed data: {sorted(unknown)}")
+    return values
+
+
+def fingerprint(values: Dict[str, Any]) -> str:
+    """Stable hash of a normalized record"""
+    encoded = json.dumps(values, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def sync_seed(
+    db: Session,
+    model,
+    entity: str,
+    records: List[Dict[str, Any]],
+    key: Callable[[Dict[str, Any]], str],
+) -> Dict[str, int]:
+    """
+    Bring a table's seeded rows in line with its seed records.
+
+    Does not commit; the caller commits once per table (or per run).
+
+    Args:
+        db: Database session
+        model: SQLAlchemy model
+        entity: Name the rows are tracked under in seed_records, e.g. "videos"
+        records: Seed records (column values)
+        key: Natural key of a record or row, e.g. lambda r: r["youtube_id"]
+
+    Returns:
+        Number of rows inserted, updated, deleted and unchanged
+    """
+    wanted = {}
+    for record in records:
+        values = normalize(model, record)
+        natural_key = key(values)
+        if natural_key in wanted:
+            raise ValueError(f"Duplicate {entity} seed key: {natural_key}")
+        wanted[natural_key] = values
+
+    tracked = {
+        record.natural_key: record
+        for record in db.scalars(select(SeedRecord).where(SeedRecord.entity == entity))
+    }
+    columns = seed_columns(model)
+    stored = {
+        row["id"]: dict(row)
+        for row in db.execute(select(model.id, *(model.__table__.c[name] for name in columns))).mappings()
+    }
+    by_key = {key(row): row_id for row_id, row in stored.items()}
+
+    inserts, updates, adopted = [], [], []
+    for natural_key, values in wanted.items():
+        digest = fingerprint(values)
+        record = tracked.get(natural_key)
+        if record is not None and record.fingerprint == digest:
+            continue
+        row_id = record.row_id if record is not None else by_key.get(natural_key)
+        if row_id not in stored:
+            inserts.append((natural_key, values, digest))
+        elif record is None and fingerprint({name: stored[row_id][name] for name in columns}) == digest:
+            adopted.append((natural_key, row_id, digest))
+        else:
+            updates.append((natural_key, {"id": row_id, **values}, digest))
+
+    removed = [record for natural_key, record in tracked.items() if natural_key not in wanted]
+
+    if inserts:
+        ids = db.execute(
+            insert(model).returning(model.id, sort_by_parameter_order=True),
+            [values for _, values, _ in inserts],
+        ).scalars().all()
+        adopted += [(natural_key, row_id, digest) for (natural_key, _, digest), row_id in zip(inserts, ids)]
+    if updates:
+        # ORM bulk UPDATE by primary key; also sets updated_at
+        db.execute(update(model), [values for _, values, _ in updates])
+        adopted += [(natural_key, values["id"], digest) for natural_key, values, digest in updates]
+    if removed:
+        db.execute(delete(model).where(model.id.in_([record.row_id for record in removed])))
+
+    # Re-record every changed key
+    changed = [natural_key for natural_key, _, _ in adopted] + [record.natural_key for record in removed]
+    if changed:
+        db.execute(
+            delete(SeedRecord).where(SeedRecord.entity == entity, SeedRecord.natural_key.in_(changed))
+        )
+    if adopted:
+        db.execute(insert(SeedRecord), [
+            {"entity": entity, "natural_key": natural_key, "row_id": row_id, "fingerprint": digest}
+            for natural_key, row_id, digest in adopted
+        ])
+
+    return {
+        "inserted": len(inserts),
+        "updated": len(updates),
+        "deleted": len(removed),
+        "unchanged": len(wanted) - len(inserts) - len(updates),
+    }
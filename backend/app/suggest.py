@@ -0,0 +1,198 @@
+"""
+Search Suggestions
+
+In-memory index of video, event and playlist titles for search-as-you-type.
+
+The frontend asks for suggestions on every keystroke, so a lookup must not
+touch the database. Each worker keeps two structures over the normalized
+title words (see search.normalize):
+
+- a sorted word list, searched with bisect like a trie: every word starting
+  with a prefix is one contiguous slice
+- trigram postings (trigram -> titles containing it), for typos and
+  matches inside words when no prefix matches
+
+Like every indexes.RowIndex, it reloads only the rows written since the
+last request, plus everything every INDEX_REFRESH_SECONDS.
+"""
+
+import bisect
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .indexes import RowIndex
+from .models.event import Event
+from .models.playlist import Playlist
+from .models.video import Video
+from .schemas.search import Suggestion
+from .search import normalize
+
+# Minimum trigram similarity (shared / all trigrams) of a fuzzy match
+TRIGRAM_THRESHOLD = 0.3
+
+
+@dataclass
+class SuggestSource:
+    """Titles of one table"""
+
+    type: str
+    entity: str  # cache entity name, as passed to invalidate()
+    model: Any
+    title: Any
+    visible: Any = None  # boolean column; hidden rows are not suggested
+
+
+SUGGEST_SOURCES = [
+    SuggestSource("video", "videos", Video, Video.title, Video.is_visible),
+    SuggestSource("event", "events", Event, Event.title),
+    SuggestSource("playlist", "playlists", Playlist, Playlist.title, Playlist.is_visible),
+]
+
+SUGGEST_TYPES = [source.type for source in SUGGEST_SOURCES]
+
+_SOURCES_BY_ENTITY = {source.entity: source for source in SUGGEST_SOURCES}
+
+Key = Tuple[str, int]
+
+
+def words(text: str) -> List[str]:
+    """Normalized words of a title or query"""
+    return re.findall(r"\w+", normalize(text))
+
+
+def trigrams(text: str) -> Set[str]:
+    """Character trigrams of each word, padded to mark word starts and ends"""
+    grams = set()
+    for word in words(text):
+        padded = f"  {word} "
+        grams.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return grams
+
+
+class SuggestIndex(RowIndex):
+    """Prefix and trigram index over titles, keyed by (type, id)"""
+
+    def reset(self) -> None:
+        self._titles: Dict[Key, str] = {}
+        self._normalized: Dict[Key, str] = {}
+        self._words: List[Tuple[str, Key]] = []  # sorted (word, key) pairs
+        self._trigrams: Dict[str, Set[Key]] = defaultdict(set)
+        self._gram_counts: Dict[Key, int] = {}
+
+    def __len__(self):
+        return len(self._titles)
+
+    # Maintenance
+
+    def put(self, key: Key, title: str) -> None:
+        """Add or replace a title"""
+        if self._titles.get(key) == title:
+            return
+        self.remove(key)
+        self._titles[key] = title
+        self._normalized[key] = " ".join(words(title))
+        for word in set(words(title)):
+            bisect.insort(self._words, (word, key))
+        grams = trigrams(title)
+        for gram in grams:
+            self._trigrams[gram].add(key)
+        self._gram_counts[key] = len(grams)
+
+    def remove(self, key: Key) -> None:
+        """Drop a title if present"""
+        title = self._titles.pop(key, None)
+        if title is None:
+            return
+        del self._normalized[key]
+        for word in set(words(title)):
+            index = bisect.bisect_left(self._words, (word, key))
+            if index < len(self._words) and self._words[index] == (word, key):
+                del self._words[index]
+        for gram in trigrams(title):
+            self._trigrams[gram].discard(key)
+            if not self._trigrams[gram]:
+                del self._trigrams[gram]
+        del self._gram_counts[key]
+
+    async def load(self, db: AsyncSession, entity: str, ids: Optional[Set[int]]) -> None:
+        source = _SOURCES_BY_ENTITY[entity]
+        visible = source.visible if source.visible is not None else true()
+        statement = select(source.model.id, source.title, visible.label("visible"))
+        if ids is not None:
+            statement = statement.where(source.model.id.in_(ids))
+        rows = (await db.execute(statement)).all()
+
+        found = set()
+        for row in rows:
+            key = (source.type, row.id)
+            if row.visible:
+                self.put(key, row.title)
+                found.add(key)
+            else:
+                self.remove(key)
+        # Rows no longer in the table (or the whole stale type on a full load)
+        stale = (
+            {key for key in self._titles if key[0] == source.type}
+            if ids is None else {(source.type, row_id) for row_id in ids}
+        )
+        for key in stale - found:
+            self.remove(key)
+
+    # Lookup
+
+    def suggest(self, q: str, limit: int = 8, types: Optional[List[str]] = None) -> List[Suggestion]:
+        """
+        Titles matching a partial query, best first.
+
+        Every query word must start a word of the title (the last one may be
+        incomplete); titles starting with the query rank first. Without such
+        matches, titles sharing enough trigrams with the query are returned.
+        """
+        query_words = words(q)
+        if not query_words:
+            return []
+
+        candidates: Optional[Set[Key]] = None
+        for word in query_words:
+            start = bisect.bisect_left(self._words, (word,))
+            matches = set()
+            for index in range(start, len(self._words)):
+                indexed, key = self._words[index]
+                if not indexed.startswith(word):
+                    break
+                matches.add(key)
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                break
+
+        query = " ".join(query_words)
+        scored: List[Tuple[float, Key]] = []
+        if candidates:
+            for key in candidates:
+                scored.append((2.0 if self._normalized[key].startswith(query) else 1.0, key))
+        else:
+            grams = trigrams(q)
+            shared: Dict[Key, int] = defaultdict(int)
+            for gram in grams:
+                for key in self._trigrams.get(gram, ()):
+                    shared[key] += 1
+            for key, count in shared.items():
+                similarity = count / (len(grams) + self._gram_counts[key] - count)
+                if similarity >= TRIGRAM_THRESHOLD:
+                    scored.append((similarity, key))
+
+        if types:
+            scored = [(score, key) for score, key in scored if key[0] in types]
+        scored.sort(key=lambda item: (-item[0], len(self._titles[item[1]]), self._titles[item[1]], item[1]))
+        return [
+            Suggestion(type=key[0], id=key[1], title=self._titles[key])
+            for _, key in scored[:limit]
+        ]
+
+
+suggest_index = SuggestIndex([source.entity for source in SUGGEST_SOURCES])
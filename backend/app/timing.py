@@ -0,0 +1,53 @@
+"""
+Startup Timing
+
+Breakdown of a worker's cold start, for scale-to-zero hosting where every
+first request after idling pays for it:
+
+    import          app modules (FastAPI, SQLAlchemy, models, schemas)
+    import_routers  router modules
+    routers         router registration
+    migrations      bootstrap job: Alembic upgrade (DB_SETUP_ON_STARTUP only)
+    seeding         bootstrap job: seed diff (DB_SETUP_ON_STARTUP only)
+    readiness       schema version check
+
+Served at GET /internal/startup and printed when startup completes.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+
+class StartupTimings:
+    """Durations of named startup phases, in seconds"""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        """Store a phase's duration (a phase run again replaces it)"""
+        self.phases[name] = seconds
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as a phase"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def report(self) -> dict:
+        """Phase durations and their total in milliseconds"""
+        phases = {name: round(seconds * 1000, 1) for name, seconds in self.phases.items()}
+        return {"phases_ms": phases, "total_ms": round(sum(phases.values()), 1)}
+
+    def summary(self) -> str:
+        """One line for the startup log"""
+        report = self.report()
+        phases = ", ".join(f"{name} {ms:.0f}ms" for name, ms in report["phases_ms"].items())
+        return f"Startup took {report['total_ms']:.0f}ms ({phases})"
+
+
+startup_timings = StartupTimings()
@@ -0,0 +1,98 @@
+"""
+Benchmark list response serialization
+
+Compares the per-request cost of encoding a 100-video page through
+response_model (pydantic validation + JSON encoding on every request) with
+the pre-serialized path used by the list endpoints (per-row JSON bytes
+cached per row version, joined into the body).
+
+Usage:
+    python benchmark_serialization.py [rows] [iterations]
+"""
+
+import json
+import sys
+import timeit
+from datetime import date, datetime, timezone
+from typing import List
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.cache import _to_json, row_cache
+from app.models.video import Video
+from app.schemas.video import VideoSchema
+
+
+def make_videos(count: int) -> List[Video]:
+    """Transient rows shaped like the seeded videos"""
+    now = datetime.now(timezone.utc)
+    return [
+        Video(
+            id=index,
+            title=f"Concert recording {index}",
+            youtube_id=f"yt{index:08d}",
+            youtube_url=f"https://www.youtube.com/watch?v=yt{index:08d}",
+            description="Live performance with the Ogaro Ensemble. " * 4,
+            thumbnail_url=f"https://img.youtube.com/vi/yt{index:08d}/hqdefault.jpg",
+            duration="12:34",
+            published_date=date(2025, 1 + index % 12, 1 + index % 28),
+            category="concert",
+            event_id=None,
+            is_featured=index % 5 == 0,
+            display_order=index,
+            is_visible=True,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(1, count + 1)
+    ]
+
+
+def benchmark(rows: int = 100, iterations: int = 500) -> None:
+    videos = make_videos(rows)
+    cached_schemas = [VideoSchema.model_validate(video) for video in videos]
+    adapter = TypeAdapter(List[VideoSchema])
+
+    def encode(schemas):
+        # What FastAPI does for response_model=List[VideoSchema] on every
+        # request, even when the route returns cached schema objects
+        content = adapter.dump_python(adapter.validate_python(schemas), mode="json")
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def response_model_cold_path():
+        return encode([VideoSchema.model_validate(video) for video in videos])
+
+    def response_model_path():
+        return encode(cached_schemas)
+
+    def cold_rows_path():
+        row_cache.clear()
+        return Response(_to_json("videos", VideoSchema, videos), media_type="application/json")
+
+    def warm_rows_path():
+        return Response(_to_json("videos", VideoSchema, videos), media_type="application/json")
+
+    body = warm_rows_path().body
+
+    def cached_body_path():
+        return Response(body, media_type="application/json")
+
+    assert json.loads(response_model_path()) == json.loads(body)
+
+    print(f"{rows} rows, {iterations} iterations (ms per request, speedup vs. first line)")
+    baseline = None
+    for label, path in [
+        ("response_model, cache hit", response_model_path),
+        ("response_model, cache miss", response_model_cold_path),
+        ("pre-serialized, rows cold", cold_rows_path),
+        ("pre-serialized, rows warm", warm_rows_path),
+        ("pre-serialized, cached body", cached_body_path),
+    ]:
+        seconds = min(timeit.repeat(path, number=iterations, repeat=3)) / iterations
+        baseline = baseline or seconds
+        print(f"  {label:<30} {seconds * 1000:8.3f}  ({baseline / seconds:5.1f}x)")
+
+
+if __name__ == "__main__":
+    benchmark(*(int(arg) for arg in sys.argv[1:3]))
@@ -4,17 +4,35 @@ Database Seed Script
 This script populates the database with initial content from the original website.
 Run this after creating the database tables.
 
+Events, videos and playlists are synced by natural key (see app/seeding.py):
+editing, adding or removing a record here and re-running the script applies
+just that change. Biography and ensemble are only created when missing.
+
 Usage:
     python seed_data.py
 """
 
 from datetime import date
+from app.cache import invalidate
 from app.database import SessionLocal
 from app.models.bio import Bio
 from app.models.event import Event
 from app.models.ensemble import Ensemble
 from app.models.video import Video
 from app.models.playlist import Playlist
+from app.seeding import sync_seed
+
+
+def sync_and_report(db, model, entity, records, key):
+    """Apply the difference between seed records and the database, then commit"""
+    counts = sync_seed(db, model, entity, records, key)
+    db.commit()
+    if counts["inserted"] or counts["updated"] or counts["deleted"]:
+        invalidate(entity)
+    print(
+        f"{entity}: {counts['inserted']} inserted, {counts['updated']} updated, "
+        f"{counts['deleted']} deleted, {counts['unchanged']} unchanged"
+    )
 
 
 def seed_bio(db):
@@ -99,15 +117,9 @@ def seed_events(db):
     """Seed events data"""
     print("Seeding events...")
 
-    # Check if events already exist
-    existing_events = db.query(Event).count()
-    if existing_events > 0:
-        print(f"{existing_events} events already exist. Skipping...")
-        return
-
     events = [
         # Past Events with Photos
-        Event(
+        dict(
             title="Sound of Munich Now 2021",
             date=date(2021, 8, 14),
             time="20:00",
@@ -116,10 +128,9 @@ def seed_events(db):
             description="Ogaro Ensemble performance at Sound of Munich Now Festival",
             ensemble_name="Ogaro Ensemble",
             event_type="festival",
-            photo_url="/images/performances/performance-07.webp",
-            is_past=True
+            photo_url="/images/performances/performance-07.webp"
         ),
-        Event(
+        dict(
             title="European Championships 2022 Opening",
             date=date(2022, 8, 17),
             time="19:00",
@@ -128,10 +139,9 @@ def seed_events(db):
             description="Ogaro Ensemble performance at European Championships 2022 opening ceremony",
             ensemble_name="Ogaro Ensemble",
             event_type="festival",
-            photo_url="/images/performances/performance-08.webp",
-            is_past=True
+            photo_url="/images/performances/performance-08.webp"
         ),
-        Event(
+        dict(
             title="Sound of Munich Now 2023",
             date=date(2023, 7, 15),
             time="21:00",
@@ -140,70 +150,63 @@ def seed_events(db):
             description="Ogaro Ensemble performance at Sound of Munich Now Festival",
             ensemble_name="Ogaro Ensemble",
             event_type="festival",
-            photo_url="/images/hero-performance.webp",
-            is_past=True
+            photo_url="/images/hero-performance.webp"
         ),
         # 2026 Upcoming Events
-        Event(
+        dict(
             title="Ogaro Ensemble",
             date=date(2026, 1, 22),
             time="19:30",
             venue="Stadtstadel Kempten",
             location="Kempten",
             ensemble_name="Ogaro Ensemble",
-            event_type="concert",
-            is_past=False
+            event_type="concert"
         ),
-        Event(
+        dict(
             title="All that Music (OMOPO)",
             date=date(2026, 2, 22),
             time="20:00",
             venue="Freies Musikzentrum München",
             location="München",
-            event_type="concert",
-            is_past=False
+            event_type="concert"
         ),
-        Event(
+        dict(
             title="Alfulimux, der Wüstenfuchs",
             date=date(2026, 3, 15),
             time="16:00",
             venue="Gasteig HP8",
             location="München",
             description="Children's concert",
-            event_type="children's concert",
-            is_past=False
+            event_type="children's concert"
         ),
-        Event(
+        dict(
             title="Alfulimux, der Wüstenfuchs",
             date=date(2026, 3, 16),
             time="10:00",
             venue="Gasteig HP8",
             location="München",
             description="Children's concert",
-            event_type="children's concert",
-            is_past=False
+            event_type="children's concert"
         ),
-        Event(
+        dict(
             title="Alfulimux, der Wüstenfuchs",
             date=date(2026, 3, 22),
             time="15:00",
             venue="Schwörsaal im Waaghaus",
             location="Ravensburg",
             description="Children's concert",
-            event_type="children's concert",
-            is_past=False
+            event_type="children's concert"
         ),
-        Event(
+        dict(
             title="Alfulimux, der Wüstenfuchs",
             date=date(2026, 3, 23),
             time="10:00",
             venue="Schwörsaal im Waaghaus",
             location="Ravensburg",
             description="Children's concert",
-            event_type="children's concert",
-            is_past=False
+            event_type="children's concert"
         ),
-        Event(
+        dict(
             title="One Sky, Many Dreams",
             date=date(2026, 4, 26),
             time="11:00",
@@ -211,10 +214,9 @@ def seed_events(db):
             location="Gelnhausen",
             description=None,
             ensemble_name="Qantara Trio",
-            event_type="concert",
-            is_past=False
+            event_type="concert"
         ),
-        Event(
+        dict(
             title="Ogaro Ensemble with Oriental Dance",
             date=date(2026, 5, 17),
             time="20:00",
@@ -222,10 +224,9 @@ def seed_events(db):
             location="München",
             description="Ogaro Ensemble with oriental dance performance",
             ensemble_name="Ogaro Ensemble",
-            event_type="concert",
-            is_past=False
+            event_type="concert"
         ),
-        Event(
+        dict(
             title="Eröffnungsfeier für Superar München",
             date=date(2026, 5, 18),
             time="17:00",
@@ -233,10 +234,9 @@ def seed_events(db):
             location="München",
             description="Konzert für Oud kinder bei Superar",
             ensemble_name=None,
-            event_type="concert",
-            is_past=False
+            event_type="concert"
         ),
-        Event(
+        dict(
             title="Embryo feat. Abathar Kmash & Fabiana Striffler",
             date=date(2026, 5, 23),
             time="21:00",
@@ -244,10 +244,9 @@ def seed_events(db):
             location="München",
             description="Untwelving Festival",
             ensemble_name=None,
-            event_type="concert",
-            is_past=False
+            event_type="concert"
         ),
-        Event(
+        dict(
             title="Alfulimux, der Wüstenfuchs",
             date=date(2026, 7, 26),
             time="14:00",
@@ -255,14 +254,12 @@ def seed_events(db):
             location="Rheingau-Taunus-Kreis",
             description="Rheingau Musikfestival",
             ensemble_name=None,
-            event_type="children's concert",
-            is_past=False
+            event_type="children's concert"
         ),
     ]
 
-    db.add_all(events)
-    db.commit()
-    print(f"Seeded {len(events)} events successfully!")
+    # Events have no unique column; date and title identify them
+    sync_and_report(db, Event, "events", events, key=lambda event: f"{event['date']}|{event['title']}")
 
 
 def seed_ensemble(db):
@@ -331,12 +328,6 @@ def seed_videos(db):
     """Seed video data"""
     print("Seeding videos...")
 
-    # Check if videos already exist
-    existing_count = db.query(Video).count()
-    if existing_count > 0:
-        print(f"{existing_count} videos already exist. Skipping...")
-        return
-
     # Real videos from Abathar Kmash's YouTube channel
     # Channel: https://www.youtube.com/@abatharkmash3453
     videos_data = [
@@ -622,24 +613,13 @@ def seed_videos(db):
         }
     ]
 
-    for video_data in videos_data:
-        video = Video(**video_data)
-        db.add(video)
-
-    db.commit()
-    print(f"Seeded {len(videos_data)} videos successfully!")
+    sync_and_report(db, Video, "videos", videos_data, key=lambda video: video["youtube_id"])
 
 
 def seed_playlists(db):
     """Seed playlists data"""
     print("Seeding playlists...")
 
-    # Check if playlists already exist
-    existing_count = db.query(Playlist).count()
-    if existing_count > 0:
-        print(f"{existing_count} playlists already exist. Skipping...")
-        return
-
     # Playlists from Abathar Kmash's YouTube channel
     # Note: Playlist titles need to be manually updated from YouTube
     # Thumbnail URLs use the first video in each playlist for preview
@@ -696,12 +676,7 @@ def seed_playlists(db):
         },
     ]
 
-    for playlist_data in playlists_data:
-        playlist = Playlist(**playlist_data)
-        db.add(playlist)
-
-    db.commit()
-    print(f"Seeded {len(playlists_data)} playlists successfully!")
+    sync_and_report(db, Playlist, "playlists", playlists_data, key=lambda playlist: playlist["playlist_id"])
 
 
 def seed_database():
@@ -1,21 +1,31 @@
 """Test configuration and fixtures"""
+import os
+import tempfile
 import pytest
-from datetime import date
+from datetime import timedelta
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 from app.main import app
-from app.database import Base, get_db
+from app.ai.answer_cache import answer_cache
+from app.ai.context import clear_context_snapshot
+from app.cache import response_cache, row_cache
+from app.config import settings
+from app.database import Base, async_database_url, get_async_db, get_db
+from app.indexes import clear_indexes
 from app.models.event import Event
 from app.models.bio import Bio
 from app.models.ensemble import Ensemble
 from app.models.video import Video
 from app.models.playlist import Playlist
+from app.scheduler import local_today
 
-# Use in-memory SQLite for tests
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# Use a temporary SQLite file for tests, shared by the sync (write) and
+# async (read) sessions
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -24,6 +34,10 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# NullPool: aiosqlite connections must not outlive the TestClient's event loop
+async_engine = create_async_engine(async_database_url(SQLALCHEMY_DATABASE_URL), poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 
 @pytest.fixture(scope="function")
 def db_session():
@@ -46,26 +60,42 @@ def client(db_session):
         finally:
             pass
 
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    response_cache.clear()
+    row_cache.clear()
+    clear_indexes()
+    clear_context_snapshot()
+    answer_cache.clear()
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def internal_headers(monkeypatch):
+    """Configure an internal API token and return the headers sending it"""
+    monkeypatch.setattr(settings, "INTERNAL_API_TOKEN", "test-token")
+    return {"X-Internal-Token": "test-token"}
+
+
 @pytest.fixture
 def sample_event(db_session):
     """Create a sample event for testing"""
     event = Event(
         title="Test Concert",
-        date=date(2026, 12, 31),
+        date=local_today() + timedelta(days=60),  # Upcoming whenever the tests run
         time="20:00",
         venue="Test Venue",
         location="Test City",
         description="Test Description",
         ensemble_name="Test Ensemble",
         event_type="concert",
-        photo_url="/images/test.webp",
-        is_past=False
+        photo_url="/images/test.webp"
     )
     db_session.add(event)
     db_session.commit()
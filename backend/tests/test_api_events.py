@@ -1,6 +1,10 @@
 """Unit tests for Events API"""
 import pytest
-from datetime import date
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from app import scheduler
+from app.models.event import Event
 
 
 def test_health_check(client):
@@ -110,3 +114,78 @@ def test_delete_event(client, sample_event):
     # Verify it's gone
     response = client.get(f"/api/events/{sample_event.id}")
     assert response.status_code == 404
+
+
+def _add_event(db_session, title, event_date):
+    db_session.add(Event(title=title, date=event_date, venue="Hall"))
+    db_session.commit()
+
+
+def test_is_past_derived_from_date(client, db_session):
+    """Test events before today are past and today's events are upcoming"""
+    today = scheduler.local_today()
+    _add_event(db_session, "Yesterday", today - timedelta(days=1))
+    _add_event(db_session, "Today", today)
+
+    upcoming = client.get("/api/events?filter_type=upcoming").json()
+    past = client.get("/api/events?filter_type=past").json()
+    assert [(event["title"], event["is_past"]) for event in upcoming] == [("Today", False)]
+    assert [(event["title"], event["is_past"]) for event in past] == [("Yesterday", True)]
+
+
+def test_events_roll_over_at_midnight(client, db_session, monkeypatch):
+    """Test cached views and validators change with the date, without any write"""
+    today = scheduler.local_today()
+    _add_event(db_session, "Today", today)
+
+    response = client.get("/api/events")
+    assert [event["title"] for event in response.json()] == ["Today"]
+
+    tomorrow = scheduler.local_now() + timedelta(days=1)
+    monkeypatch.setattr(scheduler, "local_now", lambda: tomorrow)
+
+    rolled_over = client.get("/api/events", headers={"If-None-Match": response.headers["etag"]})
+    assert rolled_over.status_code == 200
+    assert rolled_over.json() == []
+    assert client.get("/api/events?filter_type=past").json()[0]["is_past"] is True
+
+
+def test_update_past_status_refreshes_views(client):
+    """Test the legacy cron endpoint only refreshes cached views"""
+    response = client.post("/api/events/update-past-status")
+    assert response.status_code == 200
+    assert response.json()["today"] == scheduler.local_today().isoformat()
+
+
+def test_seconds_until_midnight_across_dst():
+    """Test the wait is measured in real seconds on the day clocks go forward"""
+    now = datetime(2026, 3, 29, 0, 30, tzinfo=ZoneInfo("Europe/Berlin"))
+    assert scheduler.seconds_until_midnight(now) == timedelta(hours=22, minutes=30).total_seconds()
+
+
+def test_recommended_events(client, db_session, sample_event):
+    """Test events rank by interest, past and unmatched events excluded"""
+    today = scheduler.local_today()
+    db_session.add_all([
+        Event(title="Oud Night", date=today + timedelta(days=10), venue="Gasteig HP8",
+              description="Solo oud and taqsim", event_type="concert", ensemble_name="Ogaro Ensemble"),
+        Event(title="Kinderkonzert", date=today + timedelta(days=5), venue="Schule",
+              description="Oud für Kinder", event_type="children's concert"),
+        Event(title="Oud Workshop", date=today - timedelta(days=5), venue="Studio",
+              event_type="workshop"),
+    ])
+    db_session.commit()
+
+    response = client.get("/api/events/recommended?interest=oud taqsim")
+    assert response.status_code == 200
+    matches = response.json()
+    assert [match["event"]["title"] for match in matches] == ["Oud Night", "Kinderkonzert"]
+    assert 0 < matches[1]["match_score"] < matches[0]["match_score"] <= 1
+
+    matches = client.get("/api/events/recommended?interest=kinder").json()
+    assert [match["event"]["title"] for match in matches] == ["Kinderkonzert"]
+    assert client.get("/api/events/recommended?interest=jazz").json() == []
+
+    client.put(f"/api/events/{sample_event.id}", json={"title": "Oud Ensemble Evening"})
+    matches = client.get("/api/events/recommended?interest=oud ensemble&limit=1").json()
+    assert [match["event"]["id"] for match in matches] == [sample_event.id]
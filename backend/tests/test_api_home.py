@@ -0,0 +1,51 @@
+"""Unit tests for the homepage aggregate API"""
+from app.cache import response_cache
+from app.models.video import Video
+
+
+def test_get_home_empty(client):
+    """Test the aggregate when the database is empty"""
+    response = client.get("/api/home")
+    assert response.status_code == 200
+    assert response.json() == {
+        "bio": None,
+        "featured_videos": [],
+        "featured_playlists": [],
+        "upcoming_events": [],
+        "ensemble": None,
+    }
+
+
+def test_get_home_with_data(client, db_session, sample_bio, sample_event):
+    """Test every section is filled from its table"""
+    db_session.add(Video(title="Featured", youtube_id="abc", youtube_url="https://youtu.be/abc", is_featured=True))
+    db_session.add(Video(title="Regular", youtube_id="def", youtube_url="https://youtu.be/def"))
+    db_session.commit()
+
+    data = client.get("/api/home").json()
+    assert data["bio"]["name"] == "Test Musician"
+    assert [video["title"] for video in data["featured_videos"]] == ["Featured"]
+    assert [event["title"] for event in data["upcoming_events"]] == ["Test Concert"]
+
+
+def test_home_served_from_cache(client, sample_event):
+    """Test repeated reads return the stored payload"""
+    first = client.get("/api/home")
+    hits = response_cache.stats()["hits"]
+    second = client.get("/api/home")
+    assert second.content == first.content
+    assert response_cache.stats()["hits"] > hits
+
+
+def test_home_rebuilt_after_write(client, sample_event):
+    """Test a write to any section's table rebuilds the payload"""
+    assert client.get("/api/home").json()["upcoming_events"][0]["title"] == "Test Concert"
+    client.put(f"/api/events/{sample_event.id}", json={"title": "Renamed"})
+    assert client.get("/api/home").json()["upcoming_events"][0]["title"] == "Renamed"
+
+
+def test_home_not_modified(client, sample_event):
+    """Test the aggregate honours If-None-Match"""
+    etag = client.get("/api/home").headers["etag"]
+    response = client.get("/api/home", headers={"If-None-Match": etag})
+    assert response.status_code == 304
@@ -0,0 +1,106 @@
+"""Unit tests for the Search API"""
+from app.models.playlist import Playlist
+from app.models.video import Video
+from app.search import highlight, query_terms
+
+
+def add_videos(db_session):
+    db_session.add_all([
+        Video(title="Gypsy Dance - رقصة غجرية", youtube_id="gypsy", youtube_url="https://youtu.be/gypsy",
+              description="Ogaro Ensemble live in Freiburg", category="concert"),
+        Video(title="Longa Nahawand", youtube_id="longa", youtube_url="https://youtu.be/longa",
+              description="A dance form from the Ottoman repertoire", category="performance"),
+        Video(title="Hidden dance", youtube_id="hidden", youtube_url="https://youtu.be/hidden",
+              is_visible=False),
+    ])
+    db_session.add(Playlist(title="Dance Sessions", playlist_id="PLdance",
+                            playlist_url="https://www.youtube.com/playlist?list=PLdance"))
+    db_session.commit()
+
+
+def test_search_ranks_title_matches_first(client, db_session):
+    """Test title hits outrank description hits and hidden rows are excluded"""
+    add_videos(db_session)
+
+    response = client.get("/api/search?q=dance")
+    assert response.status_code == 200
+    results = response.json()["results"]
+    titles = [result["title"] for result in results]
+    assert "Hidden dance" not in titles
+    assert set(titles) == {"Gypsy Dance - رقصة غجرية", "Dance Sessions", "Longa Nahawand"}
+    assert titles[-1] == "Longa Nahawand"
+    assert results[0]["rank"] > results[-1]["rank"]
+
+
+def test_search_arabic(client, db_session, sample_event):
+    """Test Arabic words are matched and highlighted"""
+    add_videos(db_session)
+
+    results = client.get("/api/search?q=غجرية").json()["results"]
+    assert [(result["type"], result["title"]) for result in results] == [
+        ("video", "Gypsy Dance - رقصة غجرية")
+    ]
+    assert "<mark>غجرية</mark>" in results[0]["snippet"]
+
+
+def test_search_filters_by_type(client, db_session, sample_event):
+    """Test type restricts results, and events are searched by venue"""
+    add_videos(db_session)
+
+    results = client.get("/api/search?q=test venue&type=event").json()["results"]
+    assert [result["type"] for result in results] == ["event"]
+    assert results[0]["id"] == sample_event.id
+
+    assert client.get("/api/search?q=dance&type=event").json()["results"] == []
+    assert client.get("/api/search?q=dance&type=song").status_code == 422
+
+
+def test_search_snippet_is_escaped_and_highlighted():
+    """Test snippets escape HTML and mark matched word prefixes"""
+    snippet = highlight("Live <b>Dancing</b> in Munich", query_terms("danc"))
+    assert snippet == "Live &lt;b&gt;<mark>Dancing</mark>&lt;/b&gt; in Munich"
+
+
+def test_suggest_prefix_matches(client, db_session):
+    """Test suggestions match word prefixes, title starts first"""
+    add_videos(db_session)
+
+    suggestions = client.get("/api/search/suggest?q=dan").json()["suggestions"]
+    titles = [suggestion["title"] for suggestion in suggestions]
+    assert titles == ["Dance Sessions", "Gypsy Dance - رقصة غجرية"]
+
+    suggestions = client.get("/api/search/suggest?q=gypsy da").json()["suggestions"]
+    assert [suggestion["type"] for suggestion in suggestions] == ["video"]
+
+    suggestions = client.get("/api/search/suggest?q=رقص").json()["suggestions"]
+    assert [suggestion["title"] for suggestion in suggestions] == ["Gypsy Dance - رقصة غجرية"]
+
+
+def test_suggest_fuzzy_matches(client, db_session):
+    """Test a typo falls back to trigram matches"""
+    add_videos(db_session)
+
+    suggestions = client.get("/api/search/suggest?q=nahawnd").json()["suggestions"]
+    assert [suggestion["title"] for suggestion in suggestions] == ["Longa Nahawand"]
+
+
+def test_suggest_index_follows_writes(client, db_session):
+    """Test router writes update the index without a full reload"""
+    add_videos(db_session)
+    assert client.get("/api/search/suggest?q=samai").json()["suggestions"] == []
+
+    video = client.post("/api/videos", json={
+        "title": "Samai Bayati", "youtube_id": "samai", "youtube_url": "https://youtu.be/samai",
+    }).json()
+    suggestions = client.get("/api/search/suggest?q=samai").json()["suggestions"]
+    assert [suggestion["id"] for suggestion in suggestions] == [video["id"]]
+
+    client.put(f"/api/videos/{video['id']}", json={"is_visible": False})
+    assert client.get("/api/search/suggest?q=samai").json()["suggestions"] == []
+
+    client.put(f"/api/videos/{video['id']}", json={"is_visible": True, "title": "Samai Hijaz"})
+    suggestions = client.get("/api/search/suggest?q=samai h").json()["suggestions"]
+    assert [suggestion["title"] for suggestion in suggestions] == ["Samai Hijaz"]
+
+    client.delete(f"/api/videos/{video['id']}")
+    assert client.get("/api/search/suggest?q=samai").json()["suggestions"] == []
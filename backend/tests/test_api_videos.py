@@ -0,0 +1,132 @@
+"""Unit tests for the Videos API"""
+from datetime import date
+
+from sqlalchemy import event
+
+from app.models.video import Video
+from tests.conftest import async_engine
+
+
+def add_videos(db_session, event_id):
+    db_session.add_all([
+        Video(title="Longa", youtube_id="longa", youtube_url="https://youtu.be/longa",
+              category="concert", published_date=date(2024, 5, 1), event_id=event_id),
+        Video(title="Samai", youtube_id="samai", youtube_url="https://youtu.be/samai",
+              category="concert", published_date=date(2023, 3, 1)),
+        Video(title="Interview", youtube_id="interview", youtube_url="https://youtu.be/interview",
+              category="interview"),
+        Video(title="Hidden", youtube_id="hidden", youtube_url="https://youtu.be/hidden",
+              category="concert", is_visible=False),
+    ])
+    db_session.commit()
+
+
+def test_video_facets(client, db_session, sample_event):
+    """Test facet counts cover visible videos only, unknown values last"""
+    add_videos(db_session, sample_event.id)
+
+    response = client.get("/api/videos/facets")
+    assert response.status_code == 200
+    facets = response.json()
+    assert facets["total"] == 3
+    assert facets["category"] == [
+        {"value": "concert", "count": 2},
+        {"value": "interview", "count": 1},
+    ]
+    assert facets["year"] == [
+        {"value": 2024, "count": 1},
+        {"value": 2023, "count": 1},
+        {"value": None, "count": 1},
+    ]
+    assert facets["event"] == [
+        {"value": sample_event.id, "count": 1},
+        {"value": None, "count": 2},
+    ]
+
+
+def test_video_facets_follow_writes_without_scanning(client, db_session, sample_event):
+    """Test writes adjust the counts by reloading only the written rows"""
+    add_videos(db_session, sample_event.id)
+    client.get("/api/videos/facets")
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        client.get("/api/videos/facets")
+        assert statements == []
+
+        video = client.post("/api/videos", json={
+            "title": "Bashraf", "youtube_id": "bashraf", "youtube_url": "https://youtu.be/bashraf",
+            "category": "performance", "published_date": "2024-09-01",
+        }).json()
+        facets = client.get("/api/videos/facets").json()
+        assert len(statements) == 1 and " IN (" in statements[0]
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+    assert facets["total"] == 4
+    assert {"value": "performance", "count": 1} in facets["category"]
+    assert facets["year"][0] == {"value": 2024, "count": 2}
+
+    client.put(f"/api/videos/{video['id']}", json={"category": "concert"})
+    facets = client.get("/api/videos/facets").json()
+    assert facets["category"][0] == {"value": "concert", "count": 3}
+    assert "performance" not in [count["value"] for count in facets["category"]]
+
+    client.delete(f"/api/events/{sample_event.id}")
+    facets = client.get("/api/videos/facets").json()
+    assert facets["event"] == [{"value": None, "count": 4}]
+
+
+def add_related_videos(db_session):
+    videos = [
+        Video(title="Longa Nahawand", youtube_id="longa", youtube_url="https://youtu.be/longa",
+              description="Oud solo in maqam nahawand", category="concert"),
+        Video(title="Samai Nahawand", youtube_id="samai", youtube_url="https://youtu.be/samai",
+              description="Ensemble piece in maqam nahawand", category="concert"),
+        Video(title="Interview with Abathar", youtube_id="interview", youtube_url="https://youtu.be/interview",
+              description="Talking about teaching", category="interview"),
+        Video(title="Nahawand improvisation", youtube_id="hidden", youtube_url="https://youtu.be/hidden",
+              description="Oud taqsim in maqam nahawand", category="concert", is_visible=False),
+    ]
+    db_session.add_all(videos)
+    db_session.commit()
+    return videos
+
+
+def test_related_videos(client, db_session):
+    """Test related videos rank by shared terms and skip hidden videos"""
+    longa, samai, interview, hidden = add_related_videos(db_session)
+
+    response = client.get(f"/api/videos/{longa.id}/related")
+    assert response.status_code == 200
+    assert [video["id"] for video in response.json()] == [samai.id]
+
+    assert client.get(f"/api/videos/{interview.id}/related").json() == []
+    assert client.get(f"/api/videos/{hidden.id}/related").status_code == 404
+    assert client.get("/api/videos/9999/related").status_code == 404
+
+
+def test_related_videos_follow_writes(client, db_session):
+    """Test written videos are embedded and linked without a full reload"""
+    longa, samai, interview, hidden = add_related_videos(db_session)
+    client.get(f"/api/videos/{longa.id}/related")
+
+    client.put(f"/api/videos/{hidden.id}", json={"is_visible": True})
+    related = [video["id"] for video in client.get(f"/api/videos/{longa.id}/related").json()]
+    assert related[:1] == [hidden.id] and set(related) == {hidden.id, samai.id}
+
+    video = client.post("/api/videos", json={
+        "title": "Teaching the oud", "youtube_id": "teaching", "youtube_url": "https://youtu.be/teaching",
+        "description": "A lesson about teaching", "category": "interview",
+    }).json()
+    related = client.get(f"/api/videos/{video['id']}/related").json()
+    assert [video["id"] for video in related][:1] == [interview.id]
+
+    client.delete(f"/api/videos/{interview.id}")
+    related = client.get(f"/api/videos/{video['id']}/related").json()
+    assert interview.id not in [video["id"] for video in related]
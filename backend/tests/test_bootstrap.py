@@ -0,0 +1,67 @@
+"""Unit tests for the database bootstrap job"""
+import subprocess
+import sys
+
+import pytest
+
+from app import bootstrap
+from app.migrations import alembic_config, migration_heads, schema_is_current
+
+
+def test_schema_without_migration_history_is_not_current(db_session):
+    """Test a schema created without Alembic counts as not migrated"""
+    assert schema_is_current(db_session.get_bind()) is False
+
+
+def test_migration_heads_match_alembic():
+    """Test the readiness check finds the same head revisions as Alembic"""
+    from alembic.script import ScriptDirectory
+
+    assert migration_heads() == set(ScriptDirectory.from_config(alembic_config()).get_heads())
+
+
+def test_check_database_ready_fails_fast(monkeypatch):
+    """Test workers refuse to start when migrations are pending"""
+    monkeypatch.setattr(bootstrap, "schema_is_current", lambda: False)
+    with pytest.raises(RuntimeError, match="python -m app.bootstrap"):
+        bootstrap.check_database_ready()
+
+
+def test_bootstrap_runs_migrations_under_lock(monkeypatch):
+    """Test the job migrates inside the setup lock and can skip seeding"""
+    calls = []
+
+    class Lock:
+        def __enter__(self):
+            calls.append("lock")
+
+        def __exit__(self, *exc):
+            calls.append("unlock")
+
+    monkeypatch.setattr(bootstrap, "setup_lock", Lock)
+    monkeypatch.setattr(bootstrap, "run_migrations", lambda: calls.append("migrate"))
+
+    assert bootstrap.main(["--no-seed"]) == 0
+    assert calls == ["lock", "migrate", "unlock"]
+
+
+def test_startup_timings_report(client, internal_headers):
+    """Test the startup breakdown is served and covers each phase"""
+    response = client.get("/internal/startup", headers=internal_headers)
+    assert response.status_code == 200
+    phases = response.json()["phases_ms"]
+    for phase in ["import", "import_routers", "routers", "readiness"]:
+        assert phase in phases
+    assert response.json()["total_ms"] >= phases["import"]
+
+
+def test_app_import_does_not_load_seed_data():
+    """Test seed data, AI modules and Alembic stay out of the web worker's imports"""
+    code = (
+        "import sys, app.main; "
+        "print('seed_data' in sys.modules, 'app.ai' in sys.modules, 'alembic' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert output[-3:] == ["False", "False", "False"]
@@ -0,0 +1,145 @@
+"""Unit tests for the bulk create endpoints"""
+from sqlalchemy import event
+
+
+def make_video(youtube_id, title="Bulk Video"):
+    return {
+        "title": title,
+        "youtube_id": youtube_id,
+        "youtube_url": f"https://www.youtube.com/watch?v={youtube_id}",
+    }
+
+
+def test_bulk_create_videos(client, db_session):
+    """Test creating a batch of videos with a fixed number of statements"""
+    engine = db_session.get_bind()
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        response = client.post(
+            "/api/videos/bulk", json=[make_video(f"bulk{index}") for index in range(30)]
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == ["created"] * 30
+    assert [result["index"] for result in results] == list(range(30))
+    assert len({result["id"] for result in results}) == 30
+    # Duplicate check + one multi-row insert, not one round trip per video
+    inserts = [statement for statement in statements if statement.startswith("INSERT")]
+    assert len(inserts) == 1
+    assert len(statements) <= 3
+
+    listed = client.get("/api/videos?limit=100").json()
+    assert {video["youtube_id"] for video in listed} == {f"bulk{index}" for index in range(30)}
+
+
+def test_bulk_create_videos_reports_conflicts(client):
+    """Test existing and in-batch duplicate youtube_ids are reported per item"""
+    client.post("/api/videos", json=make_video("taken"))
+
+    response = client.post(
+        "/api/videos/bulk",
+        json=[make_video("taken"), make_video("new"), make_video("new")],
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == ["conflict", "created", "conflict"]
+    assert "already exists" in results[0]["detail"]
+    assert "in batch" in results[2]["detail"]
+    assert len(client.get("/api/videos").json()) == 2
+
+
+def test_bulk_upsert_videos(client):
+    """Test upsert updates existing videos and creates new ones"""
+    created = client.post("/api/videos", json=make_video("taken")).json()
+
+    response = client.post(
+        "/api/videos/bulk?upsert=true",
+        json=[make_video("taken", title="Renamed"), make_video("fresh")],
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0] == {"index": 0, "id": created["id"], "status": "updated", "detail": None}
+    assert results[1]["status"] == "created"
+
+    video = client.get(f"/api/videos/{created['id']}").json()
+    assert video["title"] == "Renamed"
+
+
+def test_bulk_create_events(client):
+    """Test creating a batch of events keeps the request order"""
+    events = [
+        {"title": f"Concert {index}", "date": "2030-05-01", "venue": "Hall"}
+        for index in range(5)
+    ]
+    response = client.post("/api/events/bulk", json=events)
+    assert response.status_code == 200
+    ids = [result["id"] for result in response.json()["results"]]
+
+    for index, event_id in enumerate(ids):
+        assert client.get(f"/api/events/{event_id}").json()["title"] == f"Concert {index}"
+
+
+def test_bulk_create_playlists(client):
+    """Test bulk playlist creation checks playlist_id duplicates"""
+    playlist = {
+        "title": "Season",
+        "playlist_id": "PL1",
+        "playlist_url": "https://www.youtube.com/playlist?list=PL1",
+    }
+    first = client.post("/api/admin/playlists/bulk", json=[playlist])
+    second = client.post("/api/admin/playlists/bulk", json=[playlist])
+
+    assert first.json()["results"][0]["status"] == "created"
+    assert second.json()["results"][0]["status"] == "conflict"
+
+
+def test_bulk_create_rejects_empty_batch(client):
+    """Test empty batches are rejected"""
+    response = client.post("/api/videos/bulk", json=[])
+    assert response.status_code == 422
+
+
+def test_upsert_video_by_youtube_id(client):
+    """Test PUT by youtube_id creates, then updates the same video"""
+    url = "/api/videos/by-youtube-id/sync1"
+    body = {"title": "Synced", "youtube_url": "https://www.youtube.com/watch?v=sync1"}
+
+    created = client.put(url, json=body)
+    assert created.status_code == 201
+    assert created.json()["youtube_id"] == "sync1"
+
+    updated = client.put(url, json={**body, "title": "Synced again"})
+    assert updated.status_code == 200
+    assert updated.json()["id"] == created.json()["id"]
+    assert updated.json()["title"] == "Synced again"
+    assert updated.json()["updated_at"] is not None
+
+    assert len(client.get("/api/videos").json()) == 1
+    assert client.get(f"/api/videos/{created.json()['id']}").json()["title"] == "Synced again"
+
+
+def test_upsert_video_rejects_mismatched_youtube_id(client):
+    """Test the body's youtube_id must match the URL"""
+    response = client.put(
+        "/api/videos/by-youtube-id/sync1",
+        json={**make_video("other"), "title": "Mismatch"},
+    )
+    assert response.status_code == 400
+
+
+def test_upsert_playlist_by_playlist_id(client):
+    """Test PUT by playlist_id is idempotent"""
+    url = "/api/admin/playlists/by-playlist-id/PL9"
+    body = {"title": "Season", "playlist_url": "https://www.youtube.com/playlist?list=PL9"}
+
+    assert client.put(url, json=body).status_code == 201
+    assert client.put(url, json=body).status_code == 200
+    assert len(client.get("/api/playlists").json()) == 1
@@ -0,0 +1,113 @@
+"""Unit tests for the response cache"""
+import json
+
+from app.cache import ResponseCache, response_cache, row_cache
+from app.models.event import Event
+from app.schemas.event import EventSchema
+
+
+def test_cache_get_and_set():
+    """Test storing and reading an entry"""
+    cache = ResponseCache(max_entries=10, ttl_seconds=60)
+    cache.set("key", "value", tags=["videos:list"])
+    assert cache.get("key") == "value"
+    assert cache.get("missing") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_ttl_expiry():
+    """Test entries expire after the TTL"""
+    cache = ResponseCache(max_entries=10, ttl_seconds=0)
+    cache.set("key", "value")
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_cache_lru_eviction():
+    """Test the least recently used entry is evicted when full"""
+    cache = ResponseCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_cache_invalidate_by_tag():
+    """Test invalidation only drops entries with matching tags"""
+    cache = ResponseCache(max_entries=10, ttl_seconds=60)
+    cache.set("videos", 1, tags=["videos:list"])
+    cache.set("video-1", 2, tags=["videos:1"])
+    cache.set("events", 3, tags=["events:list"])
+    assert cache.invalidate("videos:list", "videos:1") == 2
+    assert cache.get("videos") is None
+    assert cache.get("video-1") is None
+    assert cache.get("events") == 3
+
+
+def test_set_skipped_after_concurrent_invalidation():
+    """Test a read started before a write does not store its stale result"""
+    cache = ResponseCache(max_entries=10, ttl_seconds=60)
+    generation = cache.generation(["events:list"])
+    cache.invalidate("events:list")
+    assert cache.set("events", "stale", tags=["events:list"], generation=generation) is False
+    assert cache.get("events") is None
+
+
+def test_get_events_served_from_cache(client, sample_event):
+    """Test repeated reads are answered from the cache"""
+    client.get("/api/events")
+    hits = response_cache.stats()["hits"]
+    assert len(client.get("/api/events").json()) == 1
+    assert response_cache.stats()["hits"] > hits
+
+
+def test_write_from_other_process_refreshes_cache(client, db_session, sample_event):
+    """Test rows written outside this worker's routers are picked up via the table version"""
+    assert len(client.get("/api/events").json()) == 1
+
+    db_session.add(Event(title="Written elsewhere", date=sample_event.date, venue="Somewhere"))
+    db_session.commit()
+
+    assert len(client.get("/api/events").json()) == 2
+
+
+def test_write_invalidates_cached_reads(client, sample_event):
+    """Test POST/PUT handlers invalidate the affected entity's keys"""
+    assert len(client.get("/api/events").json()) == 1
+    assert client.get(f"/api/events/{sample_event.id}").json()["title"] == "Test Concert"
+
+    client.post("/api/events", json={"title": "Second", "date": str(sample_event.date), "venue": "Hall"})
+    assert len(client.get("/api/events").json()) == 2
+
+    client.put(f"/api/events/{sample_event.id}", json={"title": "Renamed"})
+    assert client.get(f"/api/events/{sample_event.id}").json()["title"] == "Renamed"
+
+
+def test_serialized_list_matches_schema(client, sample_event):
+    """Test the pre-serialized list body is what response_model would produce"""
+    response = client.get("/api/events")
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == [json.loads(EventSchema.model_validate(sample_event).model_dump_json())]
+
+
+def test_serialized_rows_reused_across_lists(client, sample_event):
+    """Test a row is encoded once and reused by other list responses"""
+    client.get("/api/events?filter_type=upcoming")
+    assert len(row_cache) == 1
+    hits = row_cache.stats()["hits"]
+
+    client.get("/api/events?filter_type=all")
+    assert row_cache.stats()["hits"] == hits + 1
+    assert len(row_cache) == 1
+
+
+def test_write_drops_serialized_row(client, sample_event):
+    """Test an update re-encodes the changed row"""
+    client.get("/api/events")
+    client.put(f"/api/events/{sample_event.id}", json={"title": "Renamed"})
+    assert len(row_cache) == 0
+    assert client.get("/api/events").json()[0]["title"] == "Renamed"
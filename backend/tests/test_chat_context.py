@@ -0,0 +1,69 @@
+"""Unit tests for the chatbot context snapshot"""
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.ai.context import clear_context_snapshot, context_snapshot, estimate_tokens
+from app.models.event import Event
+from app.scheduler import local_today
+from tests.conftest import TestingAsyncSessionLocal, async_engine
+
+
+@pytest.fixture(autouse=True)
+def fresh_snapshot():
+    clear_context_snapshot()
+    yield
+    clear_context_snapshot()
+
+
+async def _snapshot(budget=None):
+    async with TestingAsyncSessionLocal() as db:
+        return await context_snapshot(db, budget)
+
+
+def test_context_lists_content(db_session, sample_bio, sample_event):
+    """Test the snapshot covers bio and upcoming events, not past ones"""
+    db_session.add(Event(title="Last Year's Concert", date=local_today() - timedelta(days=365), venue="Old Venue"))
+    db_session.commit()
+
+    context = asyncio.run(_snapshot())
+    assert sample_bio.name in context
+    assert "Upcoming events:" in context and "Test Concert" in context
+    assert "Last Year's Concert" not in context
+
+
+def test_context_reused_until_content_changes(db_session, sample_bio, sample_event):
+    """Test later turns read only the table versions, and writes rebuild"""
+    first = asyncio.run(_snapshot())
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        assert asyncio.run(_snapshot()) == first
+        assert len(statements) == 1
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+    db_session.add(Event(title="Oud Night", date=local_today() + timedelta(days=3), venue="Gasteig HP8"))
+    db_session.commit()
+    assert "Oud Night" in asyncio.run(_snapshot())
+
+
+def test_context_trimmed_to_budget(db_session, sample_bio, sample_event):
+    """Test the snapshot fits the token budget, keeping the top lines"""
+    db_session.add_all([
+        Event(title=f"Concert {day}", date=local_today() + timedelta(days=day), venue="Venue " * 20)
+        for day in range(1, 10)
+    ])
+    db_session.commit()
+
+    context = asyncio.run(_snapshot(budget=80))
+    assert estimate_tokens(context) <= 80 + 4  # blank lines between sections
+    assert sample_bio.name in context
+    assert "Concert 1 " in context and "Concert 9" not in context
@@ -0,0 +1,93 @@
+"""Unit tests for the chatbot's content retrieval index"""
+import asyncio
+from datetime import timedelta
+
+from sqlalchemy import event
+
+from app.ai import chatbot
+from app.ai.providers import FakeProvider
+from app.ai.retrieval import content_index
+from app.models.bio import Bio
+from app.models.ensemble import Ensemble
+from app.models.event import Event
+from app.scheduler import local_today
+from tests.conftest import TestingAsyncSessionLocal, async_engine
+
+
+async def _search(query, k=6):
+    async with TestingAsyncSessionLocal() as db:
+        await content_index.refresh(db)
+    return content_index.search(query, k)
+
+
+def _add_content(db_session):
+    db_session.add_all([
+        Bio(
+            name="Abathar Kmash", title="Oud player", bio_text="Abathar teaches oud lessons for children and adults in Munich.",
+            achievements=["Bavarian Art Prize 2021"], discography=[{"title": "Maqam Nights", "year": 2019}],
+        ),
+        Ensemble(
+            name="Ogaro Ensemble", description="A transcultural ensemble.",
+            members=[{"name": "Lena Weber", "instrument": "Qanun"}],
+        ),
+        Event(title="Summer Concert", date=local_today() + timedelta(days=10), venue="Gasteig HP8", description="Songs of the Euphrates."),
+    ])
+    db_session.commit()
+
+
+def test_search_ranks_relevant_chunks(client, db_session):
+    """Test each kind of content is found by its words, and noise finds nothing"""
+    _add_content(db_session)
+
+    assert "oud lessons" in asyncio.run(_search("Do you give oud lessons?"))[0].text
+    assert "Lena Weber" in asyncio.run(_search("who plays qanun"))[0].text
+    assert "Maqam Nights" in asyncio.run(_search("discography albums"))[0].text
+    assert asyncio.run(_search("Euphrates concert"))[0].entity == "events"
+    assert asyncio.run(_search("xylophone quantum")) == []
+
+
+def test_index_follows_router_writes(client, db_session, sample_event):
+    """Test a router write re-chunks only the written row"""
+    _add_content(db_session)
+    asyncio.run(_search("concert"))
+
+    client.put(f"/api/events/{sample_event.id}", json={"description": "An evening of oud improvisation by the river."})
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(async_engine.sync_engine, "before_cursor_execute", listener)
+    try:
+        chunks = asyncio.run(_search("river improvisation"))
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", listener)
+    assert len(statements) == 1 and "IN" in statements[0]
+    assert chunks[0].row_id == sample_event.id
+
+    client.delete(f"/api/events/{sample_event.id}")
+    assert all(chunk.row_id != sample_event.id for chunk in asyncio.run(_search("river improvisation")))
+
+
+def test_prompt_holds_only_retrieved_chunks(client, db_session, monkeypatch):
+    """Test the system prompt carries the chunks relevant to the question"""
+    _add_content(db_session)
+    prompts = []
+
+    class CapturingFake(FakeProvider):
+        def stream(self, system, messages):
+            prompts.append(system)
+            return super().stream(system, messages)
+
+    monkeypatch.setattr(chatbot, "get_provider", lambda: CapturingFake(delay=0))
+
+    client.post("/api/chat/stream", json={"message": "Which songs of the Euphrates will you play?"})
+    assert "Gasteig HP8" in prompts[-1] and "(upcoming)" in prompts[-1]
+    assert "Lena Weber" not in prompts[-1]
+
+    # Follow-ups are retrieved together with the visitor's previous message
+    client.post("/api/chat/stream", json={
+        "message": "And who plays in it?",
+        "conversation_history": [
+            {"role": "user", "content": "Tell me about the Ogaro Ensemble"},
+            {"role": "assistant", "content": "It is a transcultural ensemble."},
+        ],
+    })
+    assert "Lena Weber" in prompts[-1]
@@ -0,0 +1,51 @@
+"""Unit tests for conditional GET (ETag / Last-Modified)"""
+
+
+def test_list_response_has_validators(client, sample_event):
+    """Test list endpoints advertise ETag and Last-Modified"""
+    response = client.get("/api/events")
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('W/"')
+    assert "last-modified" in response.headers
+
+
+def test_if_none_match_returns_304(client, sample_event):
+    """Test a matching If-None-Match is answered with 304 and no body"""
+    etag = client.get("/api/events").headers["etag"]
+    response = client.get("/api/events", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_etag_differs_per_route_parameters(client, sample_event):
+    """Test different query parameters get different validators"""
+    upcoming = client.get("/api/events?filter_type=upcoming").headers["etag"]
+    everything = client.get("/api/events?filter_type=all").headers["etag"]
+    assert upcoming != everything
+
+
+def test_write_changes_etag(client, sample_event):
+    """Test a write produces a new validator so clients refetch"""
+    etag = client.get(f"/api/events/{sample_event.id}").headers["etag"]
+    client.post("/api/events", json={"title": "Another", "date": "2026-09-01", "venue": "Hall"})
+
+    response = client.get(f"/api/events/{sample_event.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_if_modified_since_returns_304(client, sample_bio):
+    """Test If-Modified-Since with the advertised Last-Modified returns 304"""
+    last_modified = client.get("/api/bio").headers["last-modified"]
+    response = client.get("/api/bio", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+
+def test_wildcard_if_none_match(client, sample_event):
+    """Test If-None-Match: * only yields 304 for resources that exist"""
+    response = client.get(f"/api/events/{sample_event.id}", headers={"If-None-Match": "*"})
+    assert response.status_code == 304
+
+    response = client.get("/api/events/99999", headers={"If-None-Match": "*"})
+    assert response.status_code == 404
@@ -12,8 +12,7 @@ def test_event_model_with_photo(db_session):
         date=date(2026, 12, 31),
         venue="Test Venue",
         location="Test City",
-        photo_url="/images/test.webp",
-        is_past=False
+        photo_url="/images/test.webp"
     )
     db_session.add(event)
     db_session.commit()
@@ -31,8 +30,7 @@ def test_event_model_without_photo(db_session):
         title="Test Event",
         date=date(2026, 12, 31),
         venue="Test Venue",
-        location="Test City",
-        is_past=False
+        location="Test City"
     )
     db_session.add(event)
     db_session.commit()
@@ -0,0 +1,90 @@
+"""Unit tests for keyset (cursor) pagination"""
+import pytest
+from datetime import date
+from app.models.video import Video
+from app.models.playlist import Playlist
+
+
+@pytest.fixture
+def many_videos(db_session):
+    """Videos with duplicate sort keys and missing published dates"""
+    videos = []
+    for i in range(7):
+        videos.append(Video(
+            title=f"Video {i}",
+            youtube_id=f"yt{i}",
+            youtube_url=f"https://youtube.com/watch?v=yt{i}",
+            published_date=None if i % 3 == 0 else date(2024, 1, 1 + i % 2),
+            display_order=i % 2,
+        ))
+    db_session.add_all(videos)
+    db_session.commit()
+    return videos
+
+
+def _walk(client, url, limit, max_pages=20):
+    ids, cursor = [], ""
+    for _ in range(max_pages):
+        response = client.get(url, params={"cursor": cursor, "limit": limit})
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["items"]) <= limit
+        ids.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids
+    pytest.fail(f"cursor walk over {url} did not finish within {max_pages} pages")
+
+
+def test_video_cursor_pages_cover_all_rows_once(client, many_videos):
+    """Test walking every cursor page returns each video exactly once, in order"""
+    ids = _walk(client, "/api/videos", limit=2)
+    expected = [video["id"] for video in client.get("/api/videos?limit=100").json()]
+    assert ids == expected
+    assert len(ids) == len(many_videos)
+
+
+def test_video_cursor_last_page_has_no_next_cursor(client, many_videos):
+    """Test a page holding the remaining rows ends the walk"""
+    page = client.get("/api/videos", params={"cursor": "", "limit": 100}).json()
+    assert len(page["items"]) == len(many_videos)
+    assert page["next_cursor"] is None
+
+
+def test_invalid_cursor_rejected(client, many_videos):
+    """Test a malformed cursor returns 400"""
+    response = client.get("/api/videos", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_playlist_cursor_pages(client, db_session):
+    """Test cursor pagination for playlists"""
+    db_session.add_all([
+        Playlist(title=f"Playlist {i}", playlist_id=f"PL{i}", playlist_url=f"https://youtube.com/playlist?list=PL{i}")
+        for i in range(5)
+    ])
+    db_session.commit()
+
+    ids = _walk(client, "/api/playlists", limit=2)
+    expected = [playlist["id"] for playlist in client.get("/api/playlists?limit=100").json()]
+    assert ids == expected
+    assert len(ids) == 5
+
+
+def test_playlist_page_size_validated(client):
+    """Test out-of-range playlist limits and offsets return 422"""
+    for params in ({"cursor": "", "limit": 0}, {"limit": -1}, {"limit": 101}, {"offset": -1}):
+        assert client.get("/api/playlists", params=params).status_code == 422
+    assert client.get("/api/playlists/featured", params={"limit": 0}).status_code == 422
+
+
+def test_video_display_order_cannot_be_nulled(client, many_videos):
+    """Test display_order stays a total sort key"""
+    response = client.put(f"/api/videos/{many_videos[0].id}", json={"display_order": None})
+    assert response.status_code == 422
+    assert client.put(f"/api/videos/{many_videos[0].id}", json={"title": "Renamed"}).status_code == 200
+
+    playlist = client.post("/api/admin/playlists", json={
+        "title": "Playlist", "playlist_id": "PLx", "playlist_url": "https://youtube.com/playlist?list=PLx",
+    }).json()
+    assert client.put(f"/api/admin/playlists/{playlist['id']}", json={"display_order": None}).status_code == 422
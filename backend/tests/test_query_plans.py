@@ -0,0 +1,69 @@
+"""EXPLAIN-based checks that the public list queries are served by indexes"""
+import pytest
+from sqlalchemy import event
+
+from tests.conftest import async_engine, engine
+
+# Every public list route that filters or sorts, with the query shapes it can produce
+LIST_ROUTES = [
+    "/api/videos",
+    "/api/videos?featured=true",
+    "/api/videos?featured=false",
+    "/api/videos?category=concert",
+    "/api/videos?cursor=",
+    "/api/videos/featured",
+    "/api/videos/by-event/1",
+    "/api/playlists",
+    "/api/playlists?featured=true",
+    "/api/playlists?cursor=",
+    "/api/playlists/featured",
+    "/api/events?filter_type=upcoming",
+    "/api/events?filter_type=past",
+    "/api/events?filter_type=all",
+    "/api/home",
+]
+
+# Tables holding a single row, read with LIMIT 1; scanning them is fine
+SINGLETON_TABLES = {"biography", "ensembles"}
+
+# CONSTANT ROW is the outer SELECT of scalar subqueries, no table
+SCAN_ALLOWED = {"SCAN CONSTANT ROW", *(f"SCAN {table}" for table in SINGLETON_TABLES)}
+
+
+@pytest.fixture
+def captured_selects():
+    """Record the SELECT statements and parameters sent to the test database"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    # Reads run on the async engine, the validator and writes on the sync one
+    engines = [engine, async_engine.sync_engine]
+    for target in engines:
+        event.listen(target, "before_cursor_execute", capture)
+    yield statements
+    for target in engines:
+        event.remove(target, "before_cursor_execute", capture)
+
+
+def _plan(statement, parameters):
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return [row[-1] for row in rows]
+
+
+@pytest.mark.parametrize("url", LIST_ROUTES)
+def test_list_query_uses_index(client, captured_selects, url):
+    """Test the route's queries never scan a table or sort in a temp b-tree"""
+    response = client.get(url)
+    assert response.status_code == 200
+    assert captured_selects
+
+    for statement, parameters in captured_selects:
+        plan = _plan(statement, parameters)
+        for step in plan:
+            if step.startswith("SCAN") and step not in SCAN_ALLOWED:
+                assert "USING" in step and "INDEX" in step, (url, statement, plan)
+            assert "TEMP B-TREE" not in step, (url, statement, plan)
@@ -0,0 +1,94 @@
+"""Unit tests for read-replica routing"""
+import asyncio
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import database
+from app.config import settings
+from app.replicas import STICKY_COOKIE, USE_PRIMARY
+
+
+def test_routing_session_without_replicas_uses_primary():
+    """Test reads go to the primary when no replica is configured"""
+    session = database.RoutingSession()
+    assert session.get_bind() is database.async_engine.sync_engine
+
+
+def test_routing_session_reads_from_replica(monkeypatch, tmp_path):
+    """Test reads stick to one replica and sticky sessions use the primary"""
+    replicas = [
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}")
+        for name in ("replica1.db", "replica2.db")
+    ]
+    monkeypatch.setattr(database, "read_engines", replicas)
+
+    session = database.RoutingSession()
+    bind = session.get_bind()
+    assert bind in [replica.sync_engine for replica in replicas]
+    assert all(session.get_bind() is bind for _ in range(10))
+
+    sticky = database.RoutingSession(info={USE_PRIMARY: True})
+    assert sticky.get_bind() is database.async_engine.sync_engine
+
+
+def test_write_sets_sticky_cookie(client, monkeypatch):
+    """Test a successful write marks the client to read from the primary"""
+    monkeypatch.setattr(settings, "DATABASE_READ_URL", "postgresql://replica/db")
+
+    response = client.post("/api/events", json={"title": "New", "date": "2026-08-01", "venue": "Hall"})
+    assert response.status_code == 200
+    assert STICKY_COOKIE in response.cookies
+    # The frontend is on another site: the cookie must be sent cross-site
+    assert "samesite=none" in response.headers["set-cookie"].lower()
+    assert "secure" in response.headers["set-cookie"].lower()
+
+    assert "set-cookie" not in client.get("/api/events").headers
+
+
+async def _session_info(cookie_header):
+    request = Request({"type": "http", "headers": [(b"cookie", cookie_header)]})
+    generator = database.get_async_db(request)
+    db = await anext(generator)
+    await generator.aclose()
+    return db.sync_session.info
+
+
+def test_sticky_cookie_routes_reads_to_primary():
+    """Test get_async_db opens a primary-only session for a client that just wrote"""
+    assert asyncio.run(_session_info(f"{STICKY_COOKIE}=1".encode()))[USE_PRIMARY] is True
+    assert asyncio.run(_session_info(b"other=1"))[USE_PRIMARY] is False
+
+
+def test_no_sticky_cookie_without_replicas(client):
+    """Test writes do not set the cookie when reads already hit the primary"""
+    response = client.post("/api/events", json={"title": "New", "date": "2026-08-01", "venue": "Hall"})
+    assert STICKY_COOKIE not in response.cookies
+
+
+def test_index_reloads_written_rows_from_primary(client, db_session, monkeypatch, tmp_path):
+    """Test rows marked dirty by a write are not re-read from a lagging replica"""
+    from sqlalchemy import create_engine
+
+    from app.facets import video_facets
+    from app.models.video import Video
+    from tests.conftest import async_engine
+
+    # The replica has the schema but none of the primary's rows
+    replica_url = f"sqlite:///{tmp_path / 'replica.db'}"
+    database.Base.metadata.create_all(create_engine(replica_url))
+    monkeypatch.setattr(database, "read_engines", [create_async_engine(database.async_database_url(replica_url))])
+    monkeypatch.setattr(database, "async_engine", async_engine)
+
+    async def refreshed_total():
+        async with database.AsyncSessionLocal() as db:
+            await video_facets.refresh(db)
+        return video_facets.facets().total
+
+    assert asyncio.run(refreshed_total()) == 0
+
+    video = Video(title="New", youtube_id="new1", youtube_url="https://youtu.be/new1", category="concert")
+    db_session.add(video)
+    db_session.commit()
+    video_facets.mark_dirty("videos", (video.id,))
+    assert asyncio.run(refreshed_total()) == 1
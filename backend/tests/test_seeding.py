@@ -0,0 +1,69 @@
+"""Unit tests for diff-based seeding"""
+from app.models.seed_record import SeedRecord
+from app.models.video import Video
+from app.seeding import sync_seed
+
+
+def video_key(video):
+    return video["youtube_id"]
+
+
+def seed(db_session, records):
+    counts = sync_seed(db_session, Video, "videos", records, key=video_key)
+    db_session.commit()
+    return counts
+
+
+def make_records():
+    return [
+        {"title": f"Seeded {index}", "youtube_id": f"seed{index}", "youtube_url": f"https://youtu.be/seed{index}"}
+        for index in range(3)
+    ]
+
+
+def test_sync_seed_inserts_then_is_idempotent(db_session):
+    """Test a second run with unchanged seed data writes nothing"""
+    records = make_records()
+    assert seed(db_session, records) == {"inserted": 3, "updated": 0, "deleted": 0, "unchanged": 0}
+    assert seed(db_session, records) == {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 3}
+    assert db_session.query(Video).count() == 3
+    assert db_session.query(SeedRecord).count() == 3
+
+
+def test_sync_seed_applies_only_the_diff(db_session):
+    """Test edited, added and removed seed records become update, insert, delete"""
+    records = make_records()
+    seed(db_session, records)
+    unchanged_id = db_session.query(Video).filter_by(youtube_id="seed0").one().id
+
+    records[1]["title"] = "Renamed"
+    del records[2]
+    records.append({"title": "New", "youtube_id": "seed3", "youtube_url": "https://youtu.be/seed3"})
+
+    assert seed(db_session, records) == {"inserted": 1, "updated": 1, "deleted": 1, "unchanged": 1}
+    db_session.expire_all()
+    titles = {video.youtube_id: video.title for video in db_session.query(Video)}
+    assert titles == {"seed0": "Seeded 0", "seed1": "Renamed", "seed3": "New"}
+    assert db_session.query(Video).filter_by(youtube_id="seed0").one().id == unchanged_id
+
+
+def test_sync_seed_keeps_rows_created_through_the_api(db_session):
+    """Test rows the seeder did not write are never updated or deleted"""
+    db_session.add(Video(title="Admin upload", youtube_id="admin1", youtube_url="https://youtu.be/admin1"))
+    db_session.commit()
+
+    seed(db_session, make_records())
+    assert seed(db_session, []) == {"inserted": 0, "updated": 0, "deleted": 3, "unchanged": 0}
+    assert [video.youtube_id for video in db_session.query(Video)] == ["admin1"]
+
+
+def test_sync_seed_adopts_rows_seeded_before_tracking(db_session):
+    """Test matching untracked rows are adopted by natural key without rewriting them"""
+    records = make_records()
+    for record in records:
+        db_session.add(Video(**record))
+    db_session.commit()
+
+    assert seed(db_session, records) == {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 3}
+    assert db_session.query(Video).count() == 3
+    assert db_session.query(SeedRecord).count() == 3
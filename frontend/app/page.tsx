@@ -3,7 +3,7 @@
 import React, { useEffect, useState } from 'react';
 import Link from 'next/link';
 import Image from 'next/image';
-import { getEvents, getFeaturedVideos } from '@/lib/api';
+import { getHome } from '@/lib/api';
 import EventCard from '@/components/EventCard';
 import VideoGrid from '@/components/VideoGrid';
 import VideoModal from '@/components/VideoModal';
@@ -20,12 +20,9 @@ export default function HomePage() {
   useEffect(() => {
     async function fetchData() {
       try {
-        const [events, videos] = await Promise.all([
-          getEvents('upcoming'),
-          getFeaturedVideos(3)
-        ]);
-        setUpcomingEvents(events.slice(0, 3)); // Get first 3 upcoming events
-        setFeaturedVideos(videos);
+        const home = await getHome();
+        setUpcomingEvents(home.upcoming_events);
+        setFeaturedVideos(home.featured_videos);
       } catch (err) {
         setError(err instanceof Error ? err.message : 'Failed to load data');
       } finally {
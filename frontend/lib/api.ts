@@ -1,10 +1,16 @@
 import axios from 'axios';
-import type { Event, Bio, Ensemble, ContactInfo, Video, Playlist } from './types';
+import type {
+  Event, EventRecommendation, Bio, Ensemble, ContactInfo, Video, VideoFacets, Playlist, HomeData, SearchResults, SearchResultType,
+  Suggestions, ChatMessage,
+} from './types';
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
 const api = axios.create({
   baseURL: API_URL,
+  // Send the API's cookies cross-site (db_read_primary: read-your-writes
+  // after a write while replicas lag)
+  withCredentials: true,
   headers: {
     'Content-Type': 'application/json',
   },
@@ -22,6 +28,11 @@ export async function getEvent(id: number): Promise<Event> {
   return response.data;
 }
 
+export async function getRecommendedEvents(interest: string, limit: number = 5): Promise<EventRecommendation[]> {
+  const response = await api.get('/api/events/recommended', { params: { interest, limit } });
+  return response.data;
+}
+
 export async function getBio(): Promise<Bio> {
   const response = await api.get('/api/bio');
   return response.data;
@@ -67,6 +78,17 @@ export async function getFeaturedVideos(limit: number = 3): Promise<Video[]> {
   return response.data;
 }
 
+export async function getRelatedVideos(id: number, limit: number = 6): Promise<Video[]> {
+  const response = await api.get(`/api/videos/${id}/related`, { params: { limit } });
+  return response.data;
+}
+
+// Counts for category / year / event filter menus
+export async function getVideoFacets(): Promise<VideoFacets> {
+  const response = await api.get('/api/videos/facets');
+  return response.data;
+}
+
 export async function getVideosByEvent(eventId: number): Promise<Video[]> {
   const response = await api.get(`/api/videos/by-event/${eventId}`);
   return response.data;
@@ -91,3 +113,64 @@ export async function getFeaturedPlaylists(limit: number = 3): Promise<Playlist[
   const response = await api.get('/api/playlists/featured', { params: { limit } });
   return response.data;
 }
+
+// Homepage aggregate: bio, featured videos/playlists, upcoming events, ensemble
+export async function getHome(): Promise<HomeData> {
+  const response = await api.get('/api/home');
+  return response.data;
+}
+
+export async function search(
+  q: string,
+  params?: { type?: SearchResultType[]; limit?: number }
+): Promise<SearchResults> {
+  const response = await api.get('/api/search', {
+    params: { q, ...params },
+    paramsSerializer: { indexes: null }, // type=video&type=event
+  });
+  return response.data;
+}
+
+// Search-as-you-type; cheap enough to call on every keystroke
+export async function getSuggestions(q: string, limit: number = 8): Promise<Suggestions> {
+  const response = await api.get('/api/search/suggest', { params: { q, limit } });
+  return response.data;
+}
+
+// Chat: the reply streams in as Server-Sent Events; axios cannot read a
+// streamed body in the browser, so this uses fetch. onToken is called with
+// each piece of text; aborting the signal stops generation on the server.
+export async function streamChat(
+  message: string,
+  history: ChatMessage[],
+  onToken: (text: string) => void,
+  signal?: AbortSignal,
+): Promise<void> {
+  const response = await fetch(`${API_URL}/api/chat/stream`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ message, conversation_history: history }),
+    signal,
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(`Chat request failed: ${response.status}`);
+  }
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = '';
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) return;
+    buffer += value;
+    let end;
+    while ((end = buffer.indexOf('\n\n')) >= 0) {
+      const block = buffer.slice(0, end);
+      buffer = buffer.slice(end + 2);
+      const event = block.match(/^event: (.*)$/m)?.[1];
+      const data = JSON.parse(block.match(/^data: (.*)$/m)?.[1] ?? '{}');
+      if (event === 'token') onToken(data.text);
+      else if (event === 'error') throw new Error(data.detail);
+      else if (event === 'done') return;
+    }
+  }
+}
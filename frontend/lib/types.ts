@@ -12,6 +12,11 @@ export interface Event {
   is_past: boolean;
 }
 
+export interface EventRecommendation {
+  event: Event;
+  match_score: number;  // 0..1
+}
+
 export interface Bio {
   id: number;
   name: string;
@@ -74,6 +79,18 @@ export interface Video {
   updated_at?: string;
 }
 
+export interface FacetCount {
+  value: string | number | null;  // null: videos without the value
+  count: number;
+}
+
+export interface VideoFacets {
+  total: number;
+  category: FacetCount[];
+  year: FacetCount[];
+  event: FacetCount[];  // by event id
+}
+
 export interface Playlist {
   id: number;
   title: string;
@@ -88,3 +105,42 @@ export interface Playlist {
   created_at: string;
   updated_at?: string;
 }
+
+export interface HomeData {
+  bio: Bio | null;
+  featured_videos: Video[];
+  featured_playlists: Playlist[];
+  upcoming_events: Event[];
+  ensemble: Ensemble | null;
+}
+
+export type SearchResultType = 'video' | 'event' | 'playlist' | 'ensemble';
+
+export interface SearchResult {
+  type: SearchResultType;
+  id: number;
+  title: string;
+  snippet: string; // HTML-escaped, matches wrapped in <mark>
+  rank: number;
+}
+
+export interface SearchResults {
+  query: string;
+  results: SearchResult[];
+}
+
+export interface Suggestion {
+  type: Exclude<SearchResultType, 'ensemble'>;
+  id: number;
+  title: string;
+}
+
+export interface Suggestions {
+  query: string;
+  suggestions: Suggestion[];
+}
+
+export interface ChatMessage {
+  role: 'user' | 'assistant';
+  content: string;
+}